@@ -0,0 +1,60 @@
+"""Approximations benchmarks."""
+# stdlib
+from typing import Tuple
+
+# third party
+import pytest
+import torch
+
+from sympc.approximations import APPROXIMATIONS
+from sympc.approximations.softmax import softmax
+from sympc.tensor import MPCTensor
+
+SIZES = [(10,), (100,)]
+FUNCTIONS = {**APPROXIMATIONS, "softmax": softmax}
+
+
+@pytest.mark.parametrize("nr_parties", [2, 3, 5])
+@pytest.mark.parametrize("size", SIZES)
+def test_exp(
+    benchmark, get_session, record_communication, size: Tuple[int, ...], nr_parties: int
+) -> None:
+    """Benchmark the exponential approximation.
+
+    Arguments:
+        benchmark: Fixture that benchmarks any function passed
+        get_session: Fixture that returns a session
+        record_communication: Fixture that adds the communication to the benchmark info
+        size: The shape of the secret
+        nr_parties: The number of parties
+    """
+    session = get_session(nr_parties)
+    x = MPCTensor(secret=torch.rand(size), session=session)
+
+    benchmark.extra_info.update(op="exp", size=size, nr_parties=nr_parties)
+    record_communication(session, FUNCTIONS["exp"], x)
+    benchmark(FUNCTIONS["exp"], x)
+
+
+# Those approximations need comparisons (FSS) that work only with 2 parties
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("approx", ["sigmoid", "reciprocal", "log", "softmax"])
+def test_approximation(
+    benchmark, get_session, record_communication, approx: str, size: Tuple[int, ...]
+) -> None:
+    """Benchmark the approximations that use comparisons.
+
+    Arguments:
+        benchmark: Fixture that benchmarks any function passed
+        get_session: Fixture that returns a session
+        record_communication: Fixture that adds the communication to the benchmark info
+        approx: The approximation
+        size: The shape of the secret
+    """
+    session = get_session(2)
+    # Positive values such that "log" and "reciprocal" are defined
+    x = MPCTensor(secret=torch.rand(size) + 0.5, session=session)
+
+    benchmark.extra_info.update(op=approx, size=size, nr_parties=2)
+    record_communication(session, FUNCTIONS[approx], x)
+    benchmark(FUNCTIONS[approx], x)
@@ -4,24 +4,127 @@
 from typing import Any
 from typing import Callable
 from typing import List
+from typing import Optional
 
 # third party
 import pytest
 import syft as sy
 
+from sympc.runtime import LocalParty
+from sympc.runtime import close_parties
+from sympc.runtime import launch_parties
+from sympc.session import Session
+from sympc.session import SessionManager
+
+
+def pytest_addoption(parser) -> None:
+    """Add the option to choose where the parties run.
+
+    Args:
+        parser: Parser for the command line options
+    """
+    parser.addoption(
+        "--backend",
+        choices=["vm", "local", "tcp", "unix"],
+        default="vm",
+        help=(
+            "Run the parties in syft VirtualMachines, in the SyMPC local runtime or "
+            "in their own processes (connected by TCP or Unix sockets)"
+        ),
+    )
+
 
 @pytest.fixture
-def get_clients() -> Callable[[int], List[Any]]:
+def get_clients(request) -> Callable[[int], List[Any]]:
     """Generate a list of clients given a number.
 
-    Returns:
+    The processes of the parties (if any) are stopped at the end of the benchmark.
+
+    Args:
+        request: Fixture that gives access to the command line options
+
+    Yields:
         Callable[[int], List[Any]]: List of clients
     """
+    backend = request.config.getoption("--backend")
+    process_parties = []
 
     def _helper_get_clients(nr_clients: int) -> List[Any]:
+        if backend == "local":
+            return [LocalParty(name=f"P_{i}") for i in range(nr_clients)]
+
+        if backend in {"tcp", "unix"}:
+            family = "AF_INET" if backend == "tcp" else "AF_UNIX"
+            parties = launch_parties(nr_clients, family=family)
+            process_parties.extend(parties)
+            return parties
+
         return [
             sy.VirtualMachine(name=f"P_{i}").get_root_client()
             for i in range(nr_clients)
         ]
 
-    return _helper_get_clients
+    yield _helper_get_clients
+
+    close_parties(process_parties)
+
+
+@pytest.fixture
+def get_session(
+    get_clients: Callable[[int], List[Any]]
+) -> Callable[[int, Optional[Any], int], Session]:
+    """Generate a session (on which setup_mpc was called) given a number of parties.
+
+    Args:
+        get_clients: Fixture that returns a list of clients
+
+    Returns:
+        Callable[[int, Optional[Any], int], Session]: Session for the computation
+    """
+
+    def _helper_get_session(
+        nr_parties: int, protocol: Optional[Any] = None, ring_size: int = 2 ** 64
+    ) -> Session:
+        session = Session(
+            parties=get_clients(nr_parties), protocol=protocol, ring_size=ring_size
+        )
+        SessionManager.setup_mpc(session)
+        return session
+
+    return _helper_get_session
+
+
+@pytest.fixture
+def record_communication(benchmark) -> Callable[..., None]:
+    """Run a function once and add the communication it needs to the benchmark info.
+
+    Args:
+        benchmark: Fixture that benchmarks any function passed
+
+    Returns:
+        Callable[..., None]: Function that records the communication
+    """
+
+    def _helper_record_communication(
+        session: Session, fn: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> None:
+        # The parties that run in their own processes count the bytes on the wire
+        wire_parties = [party for party in session.parties if hasattr(party, "traffic")]
+        for party in wire_parties:
+            party.reset_traffic()
+
+        with session.stats as stats:
+            fn(*args, **kwargs)
+
+        benchmark.extra_info.update(
+            rounds=stats.rounds,
+            bytes_sent=stats.bytes_sent,
+            bytes_received=stats.bytes_received,
+            communication=stats.summary(),
+        )
+        if wire_parties:
+            benchmark.extra_info["wire"] = {
+                party.name: party.traffic() for party in wire_parties
+            }
+
+    return _helper_record_communication
@@ -0,0 +1,104 @@
+"""Falcon and ABY3 protocols benchmarks."""
+# stdlib
+import operator
+from typing import Optional
+from typing import Tuple
+
+# third party
+import pytest
+import torch
+
+from sympc.protocol import ABY3
+from sympc.protocol import Falcon
+from sympc.tensor import MPCTensor
+
+SIZES = [(10, 10), (100, 100)]
+IMAGE_SIZES = [(1, 1, 28, 28), (1, 1, 56, 56)]
+
+
+# Falcon and ABY3 work only with 3 parties (the same sizes as for the SPDZ benchmarks
+# with 3 parties, such that the results can be compared)
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("channel", [None, "in_process"])
+@pytest.mark.parametrize("op_str", ["mul", "matmul"])
+def test_falcon_mul(
+    benchmark,
+    get_session,
+    record_communication,
+    op_str: str,
+    size: Tuple[int, ...],
+    channel: Optional[str],
+) -> None:
+    """Benchmark the multiplication between two secrets.
+
+    Arguments:
+        benchmark: Fixture that benchmarks any function passed
+        get_session: Fixture that returns a session
+        record_communication: Fixture that adds the communication to the benchmark info
+        op_str: The multiplication operation
+        size: The shape of the secrets
+        channel: The channel used by the parties to truncate the shares
+    """
+    session = get_session(3, Falcon("semi-honest"))
+    session.channel = channel
+    x = MPCTensor(secret=torch.randn(size), session=session)
+    y = MPCTensor(secret=torch.randn(size), session=session)
+
+    benchmark.extra_info.update(op=op_str, size=size, nr_parties=3, channel=channel)
+    record_communication(session, getattr(operator, op_str), x, y)
+    benchmark(getattr(operator, op_str), x, y)
+
+
+@pytest.mark.parametrize("size", IMAGE_SIZES)
+@pytest.mark.parametrize("channel", [None, "in_process"])
+def test_falcon_conv2d(
+    benchmark,
+    get_session,
+    record_communication,
+    size: Tuple[int, ...],
+    channel: Optional[str],
+) -> None:
+    """Benchmark the convolution between two secrets.
+
+    Arguments:
+        benchmark: Fixture that benchmarks any function passed
+        get_session: Fixture that returns a session
+        record_communication: Fixture that adds the communication to the benchmark info
+        size: The shape of the input
+        channel: The channel used by the parties to truncate the shares
+    """
+    session = get_session(3, Falcon("semi-honest"))
+    session.channel = channel
+    x = MPCTensor(secret=torch.randn(size), session=session)
+    weight = MPCTensor(secret=torch.randn((5, 1, 5, 5)), session=session)
+
+    benchmark.extra_info.update(op="conv2d", size=size, nr_parties=3, channel=channel)
+    record_communication(session, x.conv2d, weight)
+    benchmark(x.conv2d, weight)
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("channel", [None, "in_process"])
+def test_aby3_truncate(
+    benchmark,
+    get_session,
+    record_communication,
+    size: Tuple[int, ...],
+    channel: Optional[str],
+) -> None:
+    """Benchmark the truncation of a secret.
+
+    Arguments:
+        benchmark: Fixture that benchmarks any function passed
+        get_session: Fixture that returns a session
+        record_communication: Fixture that adds the communication to the benchmark info
+        size: The shape of the secret
+        channel: The channel used by the parties to truncate the shares
+    """
+    session = get_session(3, Falcon("semi-honest"))
+    session.channel = channel
+    x = MPCTensor(secret=torch.randn(size), session=session)
+
+    benchmark.extra_info.update(op="truncate", size=size, nr_parties=3, channel=channel)
+    record_communication(session, ABY3.truncate, x, session)
+    benchmark(ABY3.truncate, x, session)
@@ -0,0 +1,57 @@
+"""Function Secret Sharing protocol benchmarks."""
+# stdlib
+from typing import Tuple
+
+# third party
+import pytest
+import torch
+
+from sympc.tensor import MPCTensor
+
+SIZES = [(10, 10), (100, 100)]
+
+
+# FSS works only with 2 parties
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("op_str", ["eq", "le"])
+def test_fss_comparison(
+    benchmark, get_session, record_communication, op_str: str, size: Tuple[int, ...]
+) -> None:
+    """Benchmark the comparison between two secrets.
+
+    Arguments:
+        benchmark: Fixture that benchmarks any function passed
+        get_session: Fixture that returns a session
+        record_communication: Fixture that adds the communication to the benchmark info
+        op_str: The comparison operation
+        size: The shape of the secrets
+    """
+    session = get_session(2)
+    x = MPCTensor(secret=torch.randn(size), session=session)
+    y = MPCTensor(secret=torch.randn(size), session=session)
+
+    benchmark.extra_info.update(op=op_str, size=size, nr_parties=2)
+    record_communication(session, getattr(x, op_str), y)
+    benchmark(getattr(x, op_str), y)
+
+
+@pytest.mark.parametrize("ring_size", [2 ** 32, 2 ** 64])
+def test_fss_comparison_ring_size(
+    benchmark, get_session, record_communication, ring_size: int
+) -> None:
+    """Benchmark the comparison between two secrets for different rings.
+
+    Arguments:
+        benchmark: Fixture that benchmarks any function passed
+        get_session: Fixture that returns a session
+        record_communication: Fixture that adds the communication to the benchmark info
+        ring_size: The ring of the shares
+    """
+    size = (100, 100)
+    session = get_session(2, ring_size=ring_size)
+    x = MPCTensor(secret=torch.randn(size), session=session)
+    y = MPCTensor(secret=torch.randn(size), session=session)
+
+    benchmark.extra_info.update(op="le", size=size, nr_parties=2, ring_size=ring_size)
+    record_communication(session, x.le, y)
+    benchmark(x.le, y)
@@ -0,0 +1,126 @@
+"""SPDZ protocol benchmarks."""
+# stdlib
+import operator
+from typing import Tuple
+
+# third party
+import pytest
+import torch
+
+from sympc.protocol.spdz import spdz
+from sympc.tensor import MPCTensor
+
+SIZES = [(10, 10), (100, 100)]
+RING_SIZES = [2 ** 32, 2 ** 64]
+IMAGE_SIZES = [(1, 1, 28, 28), (1, 1, 56, 56)]
+NR_PARTIES = [2, 3, 5]
+
+
+@pytest.mark.parametrize("nr_parties", NR_PARTIES)
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("op_str", ["mul", "matmul"])
+def test_spdz_mul(
+    benchmark,
+    get_session,
+    record_communication,
+    op_str: str,
+    size: Tuple[int, ...],
+    nr_parties: int,
+) -> None:
+    """Benchmark the multiplication between two secrets.
+
+    Arguments:
+        benchmark: Fixture that benchmarks any function passed
+        get_session: Fixture that returns a session
+        record_communication: Fixture that adds the communication to the benchmark info
+        op_str: The multiplication operation
+        size: The shape of the secrets
+        nr_parties: The number of parties
+    """
+    session = get_session(nr_parties)
+    x = MPCTensor(secret=torch.randn(size), session=session)
+    y = MPCTensor(secret=torch.randn(size), session=session)
+
+    benchmark.extra_info.update(op=op_str, size=size, nr_parties=nr_parties)
+    record_communication(session, getattr(operator, op_str), x, y)
+    benchmark(getattr(operator, op_str), x, y)
+
+
+@pytest.mark.parametrize("nr_parties", NR_PARTIES)
+@pytest.mark.parametrize("size", IMAGE_SIZES)
+def test_spdz_conv2d(
+    benchmark, get_session, record_communication, size: Tuple[int, ...], nr_parties: int
+) -> None:
+    """Benchmark the convolution between two secrets.
+
+    Arguments:
+        benchmark: Fixture that benchmarks any function passed
+        get_session: Fixture that returns a session
+        record_communication: Fixture that adds the communication to the benchmark info
+        size: The shape of the input
+        nr_parties: The number of parties
+    """
+    session = get_session(nr_parties)
+    x = MPCTensor(secret=torch.randn(size), session=session)
+    weight = MPCTensor(secret=torch.randn((5, 1, 5, 5)), session=session)
+
+    benchmark.extra_info.update(op="conv2d", size=size, nr_parties=nr_parties)
+    record_communication(session, x.conv2d, weight)
+    benchmark(x.conv2d, weight)
+
+
+@pytest.mark.parametrize("nr_parties", NR_PARTIES)
+@pytest.mark.parametrize("size", SIZES)
+def test_spdz_public_divide(
+    benchmark, get_session, record_communication, size: Tuple[int, ...], nr_parties: int
+) -> None:
+    """Benchmark the division of a secret by a public value.
+
+    Arguments:
+        benchmark: Fixture that benchmarks any function passed
+        get_session: Fixture that returns a session
+        record_communication: Fixture that adds the communication to the benchmark info
+        size: The shape of the secret
+        nr_parties: The number of parties
+    """
+    session = get_session(nr_parties)
+    x = MPCTensor(secret=torch.randn(size), session=session)
+
+    benchmark.extra_info.update(op="public_divide", size=size, nr_parties=nr_parties)
+    record_communication(session, spdz.public_divide, x, 3)
+    benchmark(spdz.public_divide, x, 3)
+
+
+@pytest.mark.parametrize("ring_size", RING_SIZES)
+@pytest.mark.parametrize("nr_parties", [2, 3])
+@pytest.mark.parametrize("op_str", ["mul", "matmul"])
+def test_spdz_mul_ring_size(
+    benchmark,
+    get_session,
+    record_communication,
+    op_str: str,
+    nr_parties: int,
+    ring_size: int,
+) -> None:
+    """Benchmark the multiplication between two secrets for different rings.
+
+    The shares of a 2**32 ring take half the memory and half the bytes on the wire.
+
+    Arguments:
+        benchmark: Fixture that benchmarks any function passed
+        get_session: Fixture that returns a session
+        record_communication: Fixture that adds the communication to the benchmark info
+        op_str: The multiplication operation
+        nr_parties: The number of parties
+        ring_size: The ring of the shares
+    """
+    size = (100, 100)
+    session = get_session(nr_parties, ring_size=ring_size)
+    x = MPCTensor(secret=torch.randn(size), session=session)
+    y = MPCTensor(secret=torch.randn(size), session=session)
+
+    benchmark.extra_info.update(
+        op=op_str, size=size, nr_parties=nr_parties, ring_size=ring_size
+    )
+    record_communication(session, getattr(operator, op_str), x, y)
+    benchmark(getattr(operator, op_str), x, y)
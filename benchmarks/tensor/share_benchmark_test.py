@@ -0,0 +1,36 @@
+"""Share distribution and reconstruction benchmarks."""
+# stdlib
+from typing import Optional
+
+# third party
+import pytest
+import torch
+
+from sympc.tensor import MPCTensor
+
+# 100 MB of float32 values
+SIZE = (5000, 5000)
+
+
+@pytest.mark.parametrize("transport", [None, "in_process", "shared_memory"])
+def test_share_and_reconstruct(
+    benchmark, get_session, record_communication, transport: Optional[str]
+) -> None:
+    """Benchmark sharing a large tensor and reconstructing it.
+
+    Arguments:
+        benchmark: Fixture that benchmarks any function passed
+        get_session: Fixture that returns a session
+        record_communication: Fixture that adds the communication to the benchmark info
+        transport: The transport used to move the shares (None to serialize them)
+    """
+    session = get_session(2)
+    session.transport = transport
+    secret = torch.randn(SIZE)
+
+    def share_and_reconstruct() -> torch.Tensor:
+        return MPCTensor(secret=secret, session=session).reconstruct()
+
+    benchmark.extra_info.update(size=SIZE, nr_parties=2, transport=transport)
+    record_communication(session, share_and_reconstruct)
+    benchmark(share_and_reconstruct)
@@ -0,0 +1,54 @@
+"""Static functions benchmarks."""
+# stdlib
+from typing import Tuple
+
+# third party
+import pytest
+import torch
+
+from sympc.module.nn import max_pool2d
+from sympc.tensor import MPCTensor
+
+SIZES = [(1, 16), (1, 64)]
+IMAGE_SIZES = [(1, 1, 8, 8), (1, 1, 28, 28)]
+
+
+# The comparisons (FSS) work only with 2 parties
+@pytest.mark.parametrize("size", SIZES)
+def test_argmax(
+    benchmark, get_session, record_communication, size: Tuple[int, ...]
+) -> None:
+    """Benchmark the argmax of a secret.
+
+    Arguments:
+        benchmark: Fixture that benchmarks any function passed
+        get_session: Fixture that returns a session
+        record_communication: Fixture that adds the communication to the benchmark info
+        size: The shape of the secret
+    """
+    session = get_session(2)
+    x = MPCTensor(secret=torch.randn(size), session=session)
+
+    benchmark.extra_info.update(op="argmax", size=size, nr_parties=2)
+    record_communication(session, x.argmax, dim=1)
+    benchmark(x.argmax, dim=1)
+
+
+@pytest.mark.parametrize("size", IMAGE_SIZES)
+def test_max_pool2d(
+    benchmark, get_session, record_communication, size: Tuple[int, ...]
+) -> None:
+    """Benchmark the max pooling of a secret.
+
+    Arguments:
+        benchmark: Fixture that benchmarks any function passed
+        get_session: Fixture that returns a session
+        record_communication: Fixture that adds the communication to the benchmark info
+        size: The shape of the input
+    """
+    session = get_session(2)
+    x = MPCTensor(secret=torch.randn(size), session=session)
+
+    benchmark.extra_info.update(op="max_pool2d", size=size, nr_parties=2)
+    record_communication(session, max_pool2d, x, kernel_size=2)
+    benchmark(max_pool2d, x, kernel_size=2)
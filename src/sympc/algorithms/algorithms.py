@@ -1,28 +1,154 @@
 """Applications that make use of primitive MPC operations."""
 
 # stdlib
+from functools import lru_cache
 from typing import List
+from typing import Tuple
+from typing import Union
 
 # third party
 import torch
 
 from sympc.tensor import MPCTensor
+from sympc.tensor.static import cat
 
+Comparators = Tuple[torch.Tensor, torch.Tensor, torch.Tensor]
 
-def sort(input_list: List[MPCTensor], ascending: bool = True) -> List[MPCTensor]:
-    """Takes a list of MPCTensors and sorts them in ascending/desending order using bubble sort.
+
+@lru_cache(maxsize=128)
+def _bitonic_layers(n: int) -> Tuple[Comparators, ...]:
+    """Get the layers of a bitonic sorting network for "n" values.
+
+    All the comparators put the minimum at the lower index. The network for the next
+    power of two is used, the missing values are considered to be +inf - they never
+    move, such that the comparators that involve them are dropped.
+
+    Args:
+        n (int): Number of values.
+
+    Returns:
+        Tuple[Comparators, ...]: For each layer, the lower indices and the higher
+        indices of the comparators and the index used to put the results back in
+        place (from the concatenation of the values, the minimums and the maximums).
+    """
+    size = 1
+    while size < n:
+        size *= 2
+
+    layers = []
+    block = 2
+    while block <= size:
+        step = block // 2
+        while step >= 1:
+            lo, hi = [], []
+            for i in range(size):
+                if step == block // 2:
+                    # First layer of a merge - compare with the mirrored position
+                    if i % block >= step:
+                        continue
+                    partner = i - i % block + block - 1 - i % block
+                else:
+                    if i & step:
+                        continue
+                    partner = i + step
+
+                if partner < n:
+                    lo.append(i)
+                    hi.append(partner)
+
+            if lo:
+                m = len(lo)
+                scatter = torch.arange(n)
+                scatter[lo] = torch.arange(n, n + m)
+                scatter[hi] = torch.arange(n + m, n + 2 * m)
+                layers.append((torch.tensor(lo), torch.tensor(hi), scatter))
+
+            step //= 2
+        block *= 2
+
+    return tuple(layers)
+
+
+def _sort_rows(data: MPCTensor) -> MPCTensor:
+    """Sort the rows of a 2-D tensor (ascending) by the values on the first column.
+
+    Each layer of the network needs one comparison and one multiplication for all
+    its comparators - a bitonic network has log(n) * (log(n) + 1) / 2 layers.
+
+    Args:
+        data (MPCTensor): Tensor of shape (n, r).
+
+    Returns:
+        MPCTensor: The rows in ascending order.
+    """
+    n, nr_cols = data.shape
+
+    for lo, hi, scatter in _bitonic_layers(n):
+        x_lo = data.index_select(0, lo)
+        x_hi = data.index_select(0, hi)
+
+        swap = x_lo.narrow(1, 0, 1) > x_hi.narrow(1, 0, 1)
+        if nr_cols > 1:
+            swap = swap.repeat(1, nr_cols)
+
+        diff = swap * (x_hi - x_lo)
+        x_lo = x_lo + diff
+        x_hi = x_hi - diff
+
+        # The shares are moved locally, there is no communication
+        data = cat([data, x_lo, x_hi]).index_select(0, scatter)
+
+    return data
+
+
+def _reverse(data: MPCTensor) -> MPCTensor:
+    """Reverse the order of the values on the first dimension.
+
+    Args:
+        data (MPCTensor): The tensor.
+
+    Returns:
+        MPCTensor: The reversed tensor.
+    """
+    n = data.shape[0]
+    return data.index_select(0, torch.arange(n - 1, -1, -1))
+
+
+def _check_vector(x: MPCTensor) -> None:
+    """Check that the sorting network can be applied on a tensor.
 
     Args:
-        input_list (List[MPCTensor]): Takes a list of MPCTensor
+        x (MPCTensor): The tensor.
+
+    Raises:
+        ValueError: If the tensor is not 1-D.
+    """
+    if not isinstance(x, MPCTensor) or len(x.shape) != 1:
+        raise ValueError("Invalid dimension. The MPCTensor should have a 1-D secret.")
+
+
+def sort(
+    input_list: Union[MPCTensor, List[MPCTensor]], ascending: bool = True
+) -> Union[MPCTensor, List[MPCTensor]]:
+    """Sort the values in ascending/descending order using a bitonic sorting network.
+
+    Args:
+        input_list (Union[MPCTensor, List[MPCTensor]]): A MPCTensor of shape (n,) or
+            a list of MPCTensors with a secret of shape (1,)
         ascending (bool): If list has to sorted in ascending/descending order
 
     Returns:
-        List[MPC_tensor]: Sorted list of MPCTensors
+        Union[MPCTensor, List[MPCTensor]]: Sorted MPCTensor (or list of MPCTensors)
 
     Raises:
         ValueError: If the list contains MPCTensor with secret that is not 1-D.
-
     """
+    if isinstance(input_list, MPCTensor):
+        _check_vector(input_list)
+        n = input_list.shape[0]
+        res = _sort_rows(input_list.view(n, 1)).flatten()
+        return res if ascending else _reverse(res)
+
     # Checks if the list of MPCTensors are of length 1
     if not all(
         ((hasattr(item, "shape")) and item.shape == torch.Size([1]))
@@ -34,22 +160,72 @@ def sort(input_list: List[MPCTensor], ascending: bool = True) -> List[MPCTensor]
         )
 
     n = len(input_list)
+    if n < 2:
+        return list(input_list)
 
-    # Traverse through all array elements
-    for i in range(n - 1):
-        # range(n) also work but outer loop will repeat one time more than needed.
-        # Last i elements are already in place
-        for j in range(0, n - i - 1):
-            # traverse the array from 0 to n-i-1
-            # Swap if the element found is greater
-            # than the next element
-            check = input_list[j] > input_list[j + 1]
-            neg_check = 1 - check
-            temp = input_list[j]
-            input_list[j] = neg_check * input_list[j] + check * input_list[j + 1]
-            input_list[j + 1] = neg_check * input_list[j + 1] + check * temp
+    res = sort(cat(input_list), ascending=ascending)
+    return [res.narrow(0, i, 1) for i in range(n)]
 
+
+def _sort_with_indices(
+    x: MPCTensor, ascending: bool = True
+) -> Tuple[MPCTensor, MPCTensor]:
+    """Sort a tensor and get the (secret shared) indices that sort it.
+
+    Args:
+        x (MPCTensor): A MPCTensor of shape (n,).
+        ascending (bool): If the values are sorted in ascending/descending order.
+
+    Returns:
+        Tuple[MPCTensor, MPCTensor]: The sorted values and the indices.
+    """
+    _check_vector(x)
+    n = x.shape[0]
+
+    indices = MPCTensor(secret=torch.arange(n, dtype=torch.float), session=x.session)
+    data = _sort_rows(cat([x, indices]).view(2, n).t())
     if not ascending:
-        return input_list[::-1]
+        data = _reverse(data)
+
+    values = data.narrow(1, 0, 1).flatten()
+    indices = data.narrow(1, 1, 1).flatten()
+    return values, indices
+
+
+def argsort(x: MPCTensor, ascending: bool = True) -> MPCTensor:
+    """Get the indices that sort a tensor, the indices are secret shared.
+
+    The indices are sorted with the values using the same comparisons.
+
+    Args:
+        x (MPCTensor): A MPCTensor of shape (n,).
+        ascending (bool): If the values are sorted in ascending/descending order.
+
+    Returns:
+        MPCTensor: The indices, of shape (n,).
+    """
+    _, indices = _sort_with_indices(x, ascending)
+    return indices
+
+
+def topk(x: MPCTensor, k: int, largest: bool = True) -> Tuple[MPCTensor, MPCTensor]:
+    """Get the "k" largest (or smallest) values from a tensor and their indices.
+
+    Args:
+        x (MPCTensor): A MPCTensor of shape (n,).
+        k (int): Number of values.
+        largest (bool): Get the largest or the smallest values.
+
+    Returns:
+        Tuple[MPCTensor, MPCTensor]: The values and the indices, of shape (k,).
+
+    Raises:
+        ValueError: If "k" is not between 1 and the number of values.
+    """
+    _check_vector(x)
+    n = x.shape[0]
+    if not 1 <= k <= n:
+        raise ValueError(f"k should be between 1 and {n}, got {k}")
 
-    return input_list
+    values, indices = _sort_with_indices(x, ascending=not largest)
+    return values.narrow(0, 0, k), indices.narrow(0, 0, k)
@@ -35,12 +35,17 @@ allowed_external_modules = [
     ("sympc.tensor", tensor),
     ("sympc.tensor.share_tensor", tensor.share_tensor),
     ("sympc.tensor.replicatedshare_tensor", tensor.replicatedshare_tensor),
+    ("sympc.tensor.bit_share_tensor", tensor.bit_share_tensor),
     ("sympc.tensor.static", tensor.static),
+    ("sympc.tensor.lazy", tensor.lazy),
     ("sympc.protocol", protocol),
     ("sympc.module", module),
     ("sympc.module.nn", module.nn),
     ("sympc.module.nn.functional", module.nn.functional),
     ("sympc.store", store),
+    ("sympc.protocol.aby3", protocol.aby3),
+    ("sympc.protocol.aby3.aby3", protocol.aby3.aby3),
+    ("sympc.protocol.aby3.aby3.ABY3", protocol.aby3.aby3.ABY3),
     ("sympc.protocol.falcon", protocol.falcon),
     ("sympc.protocol.falcon.falcon", protocol.falcon.falcon),
     ("sympc.protocol.falcon.falcon.Falcon", protocol.falcon.falcon.Falcon),
@@ -65,6 +70,11 @@ allowed_external_classes = [
         "sympc.tensor.replicatedshare_tensor.ReplicatedSharedTensor",
         tensor.replicatedshare_tensor.ReplicatedSharedTensor,
     ),
+    (
+        "sympc.tensor.bit_share_tensor.BitShareTensor",
+        "sympc.tensor.bit_share_tensor.BitShareTensor",
+        tensor.bit_share_tensor.BitShareTensor,
+    ),
 ]
 
 share_tensor_attrs = [
@@ -134,6 +144,10 @@ share_tensor_attrs = [
     ),
     ("sympc.tensor.static.stack_share_tensor", "sympc.tensor.share_tensor.ShareTensor"),
     ("sympc.tensor.static.cat_share_tensor", "sympc.tensor.share_tensor.ShareTensor"),
+    (
+        "sympc.tensor.static.helper_compare_many_concat",
+        "sympc.tensor.share_tensor.ShareTensor",
+    ),
     (
         "sympc.tensor.static.helper_argmax_pairwise",
         "sympc.tensor.share_tensor.ShareTensor",
@@ -160,6 +174,10 @@ share_tensor_attrs = [
         "sympc.tensor.share_tensor.ShareTensor.flatten",
         "sympc.tensor.share_tensor.ShareTensor",
     ),
+    (
+        "sympc.tensor.share_tensor.ShareTensor.index_select",
+        "sympc.tensor.share_tensor.ShareTensor",
+    ),
 ]
 
 replicated_shared_tensor_attrs = [
@@ -248,15 +266,61 @@ allowed_external_attrs = [
     ),
     ("sympc.store.CryptoStore.get_primitives_from_store", "syft.lib.python.List"),
     ("sympc.store.CryptoStore.store", "syft.lib.python.Dict"),
+    ("sympc.store.CryptoStore.available", "syft.lib.python.Int"),
+    ("sympc.store.CryptoStore.use_disk", "syft.lib.python._SyNone"),
     ("sympc.session.Session.crypto_store", "sympc.store.CryptoStore"),
     ("sympc.session.Session.init_generators", "syft.lib.python._SyNone"),
+    ("sympc.session.Session.shutdown", "syft.lib.python._SyNone"),
     ("sympc.session.Session.przs_generators", "syft.lib.python.List"),
     ("sympc.protocol.fss.fss.mask_builder", "sympc.tensor.share_tensor.ShareTensor"),
     ("sympc.protocol.fss.fss.evaluate", "sympc.tensor.share_tensor.ShareTensor"),
+    (
+        "sympc.protocol.fss.fss.evaluate_bits",
+        "sympc.tensor.bit_share_tensor.BitShareTensor",
+    ),
+    (
+        "sympc.protocol.fss.fss.mask_and_evaluate",
+        "sympc.tensor.share_tensor.ShareTensor",
+    ),
+    (
+        "sympc.protocol.fss.fss.mask_and_evaluate_bits",
+        "sympc.tensor.bit_share_tensor.BitShareTensor",
+    ),
     ("sympc.protocol.spdz.spdz.mul_parties", "sympc.tensor.share_tensor.ShareTensor"),
     ("sympc.protocol.spdz.spdz.spdz_mask", "syft.lib.python.Tuple"),
     ("sympc.protocol.spdz.spdz.div_wraps", "sympc.tensor.share_tensor.ShareTensor"),
+    ("sympc.tensor.lazy.run_ops", "sympc.tensor.share_tensor.ShareTensor"),
+    ("sympc.tensor.share_tensor.load_share", "sympc.tensor.share_tensor.ShareTensor"),
+    ("sympc.tensor.share_tensor.export_share", "syft.lib.python.List"),
+    (
+        "sympc.tensor.bit_share_tensor.BitShareTensor.xor",
+        "sympc.tensor.bit_share_tensor.BitShareTensor",
+    ),
+    (
+        "sympc.tensor.bit_share_tensor.BitShareTensor.and_",
+        "sympc.tensor.bit_share_tensor.BitShareTensor",
+    ),
+    ("sympc.tensor.bit_share_tensor.BitShareTensor.get_packed", "torch.Tensor"),
+    ("sympc.tensor.bit_share_tensor.b2a_mask", "torch.Tensor"),
+    (
+        "sympc.tensor.bit_share_tensor.b2a_finish",
+        "sympc.tensor.share_tensor.ShareTensor",
+    ),
+    ("sympc.tensor.bit_share_tensor.bit_and_mask", "syft.lib.python.Tuple"),
+    (
+        "sympc.tensor.bit_share_tensor.bit_and_finish",
+        "sympc.tensor.bit_share_tensor.BitShareTensor",
+    ),
     ("sympc.protocol.falcon.falcon.Falcon.compute_zvalue_and_add_mask", "torch.Tensor"),
+    (
+        "sympc.protocol.aby3.aby3.ABY3.local_truncation",
+        "sympc.tensor.replicatedshare_tensor.ReplicatedSharedTensor",
+    ),
+    ("sympc.protocol.aby3.aby3.ABY3.truncation_mask", "torch.Tensor"),
+    (
+        "sympc.protocol.aby3.aby3.ABY3.truncation_finish",
+        "sympc.tensor.replicatedshare_tensor.ReplicatedSharedTensor",
+    ),
     (
         "sympc.session.Session.przs_generate_random_share",
         sy.lib.misc.union.UnionGenerator[
@@ -639,6 +639,7 @@ class GradMaxPool2D(GradFunc):
         padding: Union[int, Tuple[int, int]] = 0,
         dilation: Union[int, Tuple[int, int]] = 1,
         return_indices: bool = False,
+        method: str = "auto",
     ) -> Union[MPCTensor, Tuple[MPCTensor, MPCTensor]]:
         """Perform the feedforward and compute the result for the MaxPool2D operation.
 
@@ -654,6 +655,7 @@ class GradMaxPool2D(GradFunc):
             dilation (Union[int, Tuple[int, int]]): the dilation size
                 in case it is passed as an integer then that value is used for height and width
             return_indices (bool): to return the indices of the max values
+            method (str): the method used to compute the maximum for each window
 
         Returns:
             result (Union[MPCTensor, Tuple[MPCTensor, MPCTensor]) Only MaxPool2d result if
@@ -681,6 +683,7 @@ class GradMaxPool2D(GradFunc):
             padding=padding,
             dilation=dilation,
             return_indices=True,
+            method=method,
         )
 
         ctx["indices"] = indices
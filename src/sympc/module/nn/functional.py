@@ -11,6 +11,7 @@ import torch
 
 from sympc.grads import GRAD_FUNCS
 from sympc.grads import forward
+from sympc.protocol import FSS
 from sympc.session import get_session
 from sympc.tensor import MPCTensor
 from sympc.tensor import ShareTensor
@@ -20,6 +21,9 @@ from sympc.utils import parallel_execution
 def relu(x: MPCTensor) -> MPCTensor:
     """Rectified linear unit function.
 
+    With FSS the sign of the input is kept as packed bits and converted to
+    arithmetic shares with daBits.
+
     Args:
         x (MPCTensor): The tensor on which we apply the function
 
@@ -29,6 +33,11 @@ def relu(x: MPCTensor) -> MPCTensor:
     relu_forward = GRAD_FUNCS.get("relu", None)
     if relu_forward and x.session.autograd_active:
         return forward(x, relu_forward)
+
+    if isinstance(x.session.protocol, FSS):
+        sign = ~FSS.le(x, 0, packed=True)
+        return x * sign.to_arithmetic()
+
     res = x * (x >= 0)
     return res
 
@@ -223,6 +232,7 @@ def max_pool2d(
     padding: Union[int, Tuple[int, int]] = 0,
     dilation: Union[int, Tuple[int, int]] = 1,
     return_indices: bool = False,
+    method: str = "auto",
 ) -> Union[MPCTensor, Tuple[MPCTensor, MPCTensor]]:
     """Compute the max pool for a tensor with 2 dimension.
 
@@ -237,6 +247,8 @@ def max_pool2d(
         dilation (Union[int, Tuple[int, int]]): the dilation size
             in case it is passed as an integer then that specific value is used for height and width
         return_indices (bool): to return the indices of the max values
+        method (str): the method used to compute the maximum for each window -
+            "pairwise", "tree" or "auto" (see :func:`sympc.tensor.static.max_mpc`)
 
     Returns:
         A tuple representing maximum values and the indices (as a one hot encoding
@@ -254,6 +266,7 @@ def max_pool2d(
             padding,
             dilation,
             return_indices,
+            method,
         )
 
     kernel_size, stride, padding, dilation = _sanity_check_max_pool2d(
@@ -273,8 +286,8 @@ def max_pool2d(
         x, kernel_size=kernel_size, stride=stride, padding=padding, dilation=dilation
     )
 
-    res_max_columns, columns = x_reshaped.max(dim=-1, one_hot=True)
-    res_max, rows = res_max_columns.max(dim=-1, one_hot=True)
+    res_max_columns, columns = x_reshaped.max(dim=-1, one_hot=True, method=method)
+    res_max, rows = res_max_columns.max(dim=-1, one_hot=True, method=method)
 
     output_shape = x.shape[:-2] + (
         (x.shape[-2] - kernel_size[0] + 2 * padding[0]) // stride[0] + 1,
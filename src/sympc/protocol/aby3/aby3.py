@@ -5,21 +5,40 @@ https://eprint.iacr.org/2018/403.pdf
 """
 # stdlib
 from typing import Any
+from typing import Dict
+from typing import Iterable
 from typing import List
 from typing import Tuple
+from typing import Union
+from uuid import uuid4
 
 # third party
 import torch
 import torchcsprng as csprng
 
+from sympc.config import Config
 from sympc.protocol.protocol import Protocol
 from sympc.session import Session
+from sympc.store import register_primitive_generator
+from sympc.store import register_primitive_store_add
+from sympc.store import register_primitive_store_get
+from sympc.store.crypto_store import add_primitives_to_queue
+from sympc.store.crypto_store import get_primitive_from_queue
+from sympc.store.crypto_store import get_primitive_key
 from sympc.tensor import MPCTensor
 from sympc.tensor import ReplicatedSharedTensor
 from sympc.tensor.tensor import SyMPCTensor
+from sympc.utils import generate_random_element
+from sympc.utils import get_channel
+from sympc.utils import get_type_from_ring
+from sympc.utils import parallel_execution
 
 gen = csprng.create_random_device_generator()
 
+# The second value of a truncation pair is reserved by the mask step and used by the
+# second step of the truncation
+RESERVED_TRUNC_PAIR = "aby3_reserved_trunc_pair"
+
 
 class ABY3(metaclass=Protocol):
     """ABY3 Protocol Implementation."""
@@ -59,37 +78,14 @@ class ABY3(metaclass=Protocol):
 
         return True
 
-    @staticmethod
-    def truncation_algorithm1(
-        ptr_list: List[torch.Tensor], shape: torch.Size, session: Session
-    ) -> List[ReplicatedSharedTensor]:
-        """Performs the ABY3 truncation algorithm1.
-
-        Args:
-            ptr_list (List[torch.Tensor]): Tensors to truncate
-            shape(torch.Size) : shape of tensor values
-            session(Session) : session the tensor belong to
-
-        Returns:
-            List["ReplicatedSharedTensor"] : Truncated shares.
-        """
-        rand_value = torch.empty(size=shape, dtype=session.tensor_type).random_(
-            generator=gen
-        )
-        base = session.config.encoder_base
-        precision = session.config.encoder_precision
-        scale = base ** precision
-        x1, x2, x3 = ptr_list
-        x1_trunc = x1 >> precision if base == 2 else x1 // scale
-        x_trunc = (x2 + x3) >> precision if base == 2 else (x2 + x3) // scale
-        shares = [x1_trunc, x_trunc - rand_value, rand_value]
-        ptr_list = ReplicatedSharedTensor.distribute_shares(shares, session)
-        return ptr_list
-
     @staticmethod
     def truncate(x: MPCTensor, session: Session) -> MPCTensor:
         """Perfoms the ABY3 truncation algorithm.
 
+        If the session has a channel, the parties truncate their shares and reshare
+        them between them (see :meth:`local_truncation`), otherwise the parties use
+        truncation pairs from their CryptoStore (see :meth:`truncation_algorithm2`).
+
         Args:
             x (MPCTensor): input tensor
             session (Session) : session of the input tensor.
@@ -100,72 +96,358 @@ class ABY3(metaclass=Protocol):
         Raises:
             ValueError : parties involved in the computation is not equal to three.
             ValueError : Invalid MPCTensor share pointers.
-
-        TODO :Switch to trunc2 algorithm  as it is communication efficient.
         """
         if session.nr_parties != 3:
-            raise ValueError("Share truncation algorithm 1 works only for 3 parites.")
+            raise ValueError("ABY3 truncation works only for 3 parties.")
 
         # RSPointer - public ops, Tensor Pointer - Private ops
-        ptr_list = []
         ptr_name = x.share_ptrs[0].__name__
-        if ptr_name == "ReplicatedSharedTensorPointer":
-            ptr_list.append(x.share_ptrs[0].get_shares()[0].get_copy())
-            ptr_list.extend(x.share_ptrs[1].get_copy().shares)
-        elif ptr_name == "TensorPointer":
-            ptr_list = [share.get_copy() for share in x.share_ptrs]
+        if ptr_name not in {"ReplicatedSharedTensorPointer", "TensorPointer"}:
+            raise ValueError(f"{ptr_name} not supported.")
+
+        if session.channel is not None:
+            tag = uuid4().hex
+            args = [
+                [session_ptr, share_ptr, session.channel, tag]
+                for session_ptr, share_ptr in zip(session.session_ptrs, x.share_ptrs)
+            ]
+            share_ptrs = parallel_execution(
+                ABY3.local_truncation, session.parties, uses_channel=True
+            )(args)
+            return MPCTensor(shares=share_ptrs, session=session, shape=x.shape)
+
+        return ABY3.truncation_algorithm2(x, session)
+
+    @staticmethod
+    def local_truncation(
+        session: Session,
+        x: Union[ReplicatedSharedTensor, torch.Tensor],
+        channel_name: str,
+        tag: str,
+    ) -> ReplicatedSharedTensor:
+        """Truncate the shares at the parties (ABY3 share truncation).
+
+        The value "x = x1 + x2 + x3" is truncated to the shares "x1 / scale",
+        "(x2 + x3) / scale - r" and "r" - the party 1 holds "x2" and "x3", the
+        random "r" is generated by the parties 1 and 2 with the generator they
+        share. Only the party 1 sends its new share (to the party 0).
+
+        If the parties hold only one share of "x" (the result of a local
+        multiplication, masked with a zero share), each party first sends its share
+        to the previous party.
+
+        Args:
+            session (Session): The session of the party.
+            x (Union[ReplicatedSharedTensor, torch.Tensor]): The share(s) of the party.
+            channel_name (str): Name of the channel used to send the shares.
+            tag (str): Identifies the messages for this truncation.
+
+        Returns:
+            ReplicatedSharedTensor: The truncated shares.
+        """
+        tag = str(tag)
+        rank = session.rank
+        prev_rank = (rank - 1) % 3
+        next_rank = (rank + 1) % 3
+        channel = get_channel(channel_name)
+
+        if isinstance(x, torch.Tensor):
+            channel.send(f"{tag}_reshare", rank, prev_rank, x.clone())
+            shares = [x, channel.recv(f"{tag}_reshare", next_rank, rank)]
         else:
-            raise ValueError("{ptr_name} not supported.")
+            shares = x.shares
 
-        share_ptrs = ABY3.truncation_algorithm1(ptr_list, x.shape, session)
-        result = MPCTensor(shares=share_ptrs, session=session, shape=x.shape)
+        base = session.config.encoder_base
+        precision = session.config.encoder_precision
+        scale = base ** precision
 
-        return result
+        def _truncate(share: torch.Tensor) -> torch.Tensor:
+            return share >> precision if base == 2 else share // scale
+
+        shape = shares[0].shape
+        if rank == 0:
+            truncated = [_truncate(shares[0]), channel.recv(tag, 1, 0)]
+        elif rank == 1:
+            # The generator shared with the party 2
+            rand_value = generate_random_element(
+                session.tensor_type, session.przs_generators[1], shape
+            )
+            share = _truncate(shares[0] + shares[1]) - rand_value
+            channel.send(tag, 1, 0, share.clone())
+            truncated = [share, rand_value]
+        else:
+            # The generator shared with the party 1
+            rand_value = generate_random_element(
+                session.tensor_type, session.przs_generators[0], shape
+            )
+            truncated = [rand_value, _truncate(shares[1])]
+
+        return ReplicatedSharedTensor(
+            truncated,
+            config=Config(encoder_base=1, encoder_precision=0),
+            session_uuid=session.uuid,
+            ring_size=session.ring_size,
+        )
 
     @staticmethod
     def truncation_algorithm2(x: MPCTensor, session: Session) -> MPCTensor:
         """Truncates the MPCTensor by scale factor using trunc2 algorithm.
 
+        Each party takes a truncation pair "(r, r / scale)" from its CryptoStore (the
+        pairs are generated when the store is empty) and masks its share with "r".
+        The orchestrator opens "x - r", truncates it and sends it back to be added
+        to "r / scale".
+
         Args:
             x (MPCTensor): input tensor
             session (Session) : session of the input tensor.
 
         Returns:
             MPCTensor: truncated MPCTensor.
+        """
+        from sympc.store.exceptions import EmptyPrimitiveStore
 
-        TODO : The truncation algorithm 2 is erroneous, to be optimized.
+        shape = tuple(x.shape)
+        op_id = uuid4().hex
+        args = [
+            [session_ptr, share_ptr, shape, op_id]
+            for session_ptr, share_ptr in zip(session.session_ptrs, x.share_ptrs)
+        ]
+
+        try:
+            masked = parallel_execution(ABY3.truncation_mask, session.parties)(args)
+        except EmptyPrimitiveStore:
+            ABY3.generate_truncation_pairs(session, shape)
+            masked = parallel_execution(ABY3.truncation_mask, session.parties)(args)
+
+        x_masked = sum(share_ptr.get() for share_ptr in masked)
+
+        base = session.config.encoder_base
+        precision = session.config.encoder_precision
+        scale = base ** precision
+        x_trunc = x_masked >> precision if base == 2 else x_masked // scale
+
+        args = [[session_ptr, x_trunc, op_id] for session_ptr in session.session_ptrs]
+        share_ptrs = parallel_execution(ABY3.truncation_finish, session.parties)(args)
+
+        return MPCTensor(shares=share_ptrs, session=session, shape=x.shape)
+
+    @staticmethod
+    def generate_truncation_pairs(
+        session: Session, shape: Tuple[int, ...], n_instances: int = 1
+    ) -> None:
+        """Generate truncation pairs and send them to the parties.
+
+        The pairs can be generated in bulk before the computation, such that the
+        truncation takes them from the store.
+
+        Args:
+            session (Session): The session.
+            shape (Tuple[int, ...]): Shape of the values that are truncated.
+            n_instances (int): Number of pairs. Defaults to 1.
         """
-        r, rPrime = ABY3.get_truncation_pair(x, session)
-        scale = session.config.encoder_base ** session.config.encoder_precision
-        x_rp = x - rPrime
-        x_rp = x_rp.reconstruct(decode=False) // scale
-        zero = torch.tensor([0])
-        x_rp = MPCTensor(shares=[x_rp, zero, zero], session=x.session, shape=x.shape)
+        from sympc.store import CryptoPrimitiveProvider
+
+        shape = tuple(shape)
+        g_kwargs = {
+            "nr_parties": session.nr_parties,
+            "shape": shape,
+            "encoder_base": session.config.encoder_base,
+            "encoder_precision": session.config.encoder_precision,
+            "n_instances": n_instances,
+        }
+        if session.ring_size != 2 ** 64:
+            g_kwargs["ring_size"] = session.ring_size
+
+        CryptoPrimitiveProvider.generate_primitives(
+            "aby3_trunc_pair",
+            session=session,
+            g_kwargs=g_kwargs,
+            p_kwargs={"shape": shape},
+        )
 
-        result = r + x_rp
+    @staticmethod
+    def truncation_mask(
+        session: Session,
+        x: Union[ReplicatedSharedTensor, torch.Tensor],
+        shape: Tuple[int, ...],
+        op_id: str,
+    ) -> torch.Tensor:
+        """Mask the share of the party with the first value of a truncation pair.
+
+        The pair is removed from the store and reserved for :meth:`truncation_finish`.
+
+        Args:
+            session (Session): The session of the party.
+            x (Union[ReplicatedSharedTensor, torch.Tensor]): The share(s) of the party.
+            shape (Tuple[int, ...]): Shape of the value.
+            op_id (str): Identifies the truncation.
+
+        Returns:
+            torch.Tensor: The (additive) share of "x - r".
+        """
+        crypto_store = session.crypto_store
+        r, r_trunc = crypto_store.get_primitives_from_store(
+            "aby3_trunc_pair", tuple(shape), remove=True
+        )
+        crypto_store.store[(RESERVED_TRUNC_PAIR, str(op_id))] = r_trunc
 
-        return result
+        share = x if isinstance(x, torch.Tensor) else x.shares[0]
+        return share - r.shares[0]
 
     @staticmethod
-    def _get_truncation_pair(x: MPCTensor, session: Session) -> Tuple[MPCTensor]:
-        """Generates truncation pair for the given MPCTensor.
+    def truncation_finish(
+        session: Session, x_trunc: torch.Tensor, op_id: str
+    ) -> ReplicatedSharedTensor:
+        """Add the truncated (public) "x - r" to the share of "r / scale".
 
         Args:
-            x (MPCTensor): input tensor
-            session (Session) : session of the input tensor.
+            session (Session): The session of the party.
+            x_trunc (torch.Tensor): The truncated "x - r".
+            op_id (str): Identifies the truncation.
 
         Returns:
-            Tuple[MPCTensor]: generated truncation pair.
+            ReplicatedSharedTensor: The truncated shares.
         """
-        r: List = []
-        rPrime: List = []
-        for session_ptrs in session.session_ptrs:
-            rst = session_ptrs.prrs_generate_random_share(shape=x.shape)
-            rst = rst.resolve_pointer_type()
-            rPrime.append(rst)
-            r.append(rst)
-
-        r = ABY3.truncation_algorithm1(r, x.shape, session)
-        r_mpc = MPCTensor(shares=r, session=session, shape=x.shape)
-        rPrime_mpc = MPCTensor(shares=rPrime, session=session, shape=x.shape)
-        return r_mpc, rPrime_mpc
+        r_trunc = session.crypto_store.store.pop((RESERVED_TRUNC_PAIR, str(op_id)))
+        shares = list(r_trunc.shares)
+
+        # The public value is added to the first share (of the rank 0 party)
+        index = -session.rank % session.nr_parties
+        if index < len(shares):
+            shares[index] = shares[index] + x_trunc.to(shares[index].dtype)
+
+        return ReplicatedSharedTensor(
+            shares,
+            config=Config(encoder_base=1, encoder_precision=0),
+            session_uuid=session.uuid,
+            ring_size=session.ring_size,
+        )
+
+
+@register_primitive_generator("aby3_trunc_pair")
+def get_truncation_pairs(
+    nr_parties: int,
+    shape: Tuple[int, ...],
+    encoder_base: int,
+    encoder_precision: int,
+    n_instances: int = 1,
+    ring_size: int = 2 ** 64,
+) -> List[List[List[ReplicatedSharedTensor]]]:
+    """Get truncation pairs "(r, r / scale)" with "r" a random value from the ring.
+
+    All the instances are generated at once and shared (with replicated sharing) -
+    the values are stacked on a leading dimension, the store splits them back into
+    instances.
+
+    Args:
+        nr_parties (int): Number of parties.
+        shape (Tuple[int, ...]): Shape of the values that are truncated.
+        encoder_base (int): Base of the fixed point encoder.
+        encoder_precision (int): Precision of the fixed point encoder.
+        n_instances (int): Number of pairs. Defaults to 1.
+        ring_size (int): Ring of the shares. Defaults to 2**64.
+
+    Returns:
+        List[List[List[ReplicatedSharedTensor]]]: for each party, the (stacked) shares
+        of "r" and of "r / scale".
+    """
+    tensor_type = get_type_from_ring(ring_size)
+    r = torch.empty(size=(n_instances, *shape), dtype=tensor_type).random_(
+        generator=gen
+    )
+    scale = encoder_base ** encoder_precision
+    r_trunc = r >> encoder_precision if encoder_base == 2 else r // scale
+
+    config = Config(encoder_precision=0)
+    rst_config = Config(encoder_base=1, encoder_precision=0)
+    nshares = nr_parties - 1
+    values_shares = [
+        MPCTensor.generate_shares(
+            secret=value,
+            nr_parties=nr_parties,
+            tensor_type=tensor_type,
+            config=config,
+        )
+        for value in (r, r_trunc)
+    ]
+
+    primitives: List[List[List[ReplicatedSharedTensor]]] = []
+    for rank in range(nr_parties):
+        indices = [index % nr_parties for index in range(rank, rank + nshares)]
+        pair = []
+        for shares in values_shares:
+            rst = ReplicatedSharedTensor(config=rst_config, ring_size=ring_size)
+            rst.shares = [shares[index].tensor for index in indices]
+            pair.append(rst)
+
+        primitives.append([pair])
+
+    return primitives
+
+
+def _split_instances(
+    primitives: Iterable[Iterable[ReplicatedSharedTensor]],
+) -> List[List[ReplicatedSharedTensor]]:
+    """Split stacked primitives into instances (like beaver._split_instances).
+
+    The views share the memory of the stacked tensors, no data is copied.
+
+    Args:
+        primitives (Iterable[Iterable[ReplicatedSharedTensor]]): Stacked primitives,
+            the leading dimension of each tensor represents the instance.
+
+    Returns:
+        List[List[ReplicatedSharedTensor]]: A list with the primitives for each
+        instance.
+    """
+    instances = []
+    for stacked in primitives:
+        values = [zip(*[share.unbind(0) for share in rst.shares]) for rst in stacked]
+        for instance_values in zip(*values):
+            instance = []
+            for rst, shares in zip(stacked, instance_values):
+                instance_rst = ReplicatedSharedTensor(
+                    config=rst.config,
+                    session_uuid=rst.session_uuid,
+                    ring_size=rst.ring_size,
+                )
+                instance_rst.shares = list(shares)
+                instance.append(instance_rst)
+
+            instances.append(instance)
+
+    return instances
+
+
+@register_primitive_store_add("aby3_trunc_pair")
+def trunc_pair_store_add(
+    store: Any, primitives: Iterable[Any], shape: Tuple[int, ...]
+) -> None:
+    """Add the truncation pairs to the CryptoStore.
+
+    Args:
+        store (Any): The CryptoStore.
+        primitives (Iterable[Any]): The list of (stacked) primitives.
+        shape (Tuple[int, ...]): Shape of the values that are truncated.
+    """
+    key = get_primitive_key("aby3_trunc_pair", shape)
+    add_primitives_to_queue(store, key, _split_instances(primitives))
+
+
+@register_primitive_store_get("aby3_trunc_pair")
+def trunc_pair_store_get(
+    store: Dict[Any, Any], shape: Tuple[int, ...], remove: bool = True
+) -> Any:
+    """Retrieve a truncation pair from the CryptoStore.
+
+    Args:
+        store (Dict[Any, Any]): The CryptoStore.
+        shape (Tuple[int, ...]): Shape of the values that are truncated.
+        remove (bool): True if the primitives should be removed from the store.
+
+    Returns:
+        Any: The shares of "r" and of "r / scale".
+    """
+    key = get_primitive_key("aby3_trunc_pair", shape)
+    return get_primitive_from_queue(store, key, remove=remove)
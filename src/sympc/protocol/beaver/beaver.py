@@ -7,14 +7,17 @@ Computer Science, pages 420–432. Springer, 1991.
 
 
 # stdlib
+from functools import reduce
 import operator
 from typing import Any
 from typing import Dict
 from typing import Iterable
 from typing import List
 from typing import Tuple
+from typing import Union
 
 # third party
+import numpy as np
 import torch
 import torchcsprng as csprng  # type: ignore
 
@@ -22,10 +25,13 @@ from sympc.config import Config
 from sympc.store import register_primitive_generator
 from sympc.store import register_primitive_store_add
 from sympc.store import register_primitive_store_get
-from sympc.store.exceptions import EmptyPrimitiveStore
+from sympc.store.crypto_store import add_primitives_to_queue
+from sympc.store.crypto_store import get_primitive_from_queue
+from sympc.store.crypto_store import get_primitive_key
 from sympc.tensor import MPCTensor
 from sympc.tensor import ShareTensor
 from sympc.utils import count_wraps
+from sympc.utils import get_type_from_ring
 
 ttp_generator = csprng.create_random_device_generator()
 
@@ -37,80 +43,152 @@ def _get_triples(
     nr_parties: int,
     a_shape: Tuple[int],
     b_shape: Tuple[int],
+    n_instances: int = 1,
+    ring_size: int = 2 ** 64,
     **kwargs: Dict[Any, Any],
-) -> List[Tuple[Tuple[ShareTensor, ShareTensor, ShareTensor]]]:
+) -> List[List[List[ShareTensor]]]:
     """Get triples.
 
     The Trusted Third Party (TTP) or Crypto Provider should provide this triples Currently,
     the one that orchestrates the communication provides those triples.".
 
+    All the instances are generated at once - the random values for "a" and "b" (and the
+    result "c") are stacked on a new leading dimension and shared as a single tensor such
+    that each party receives one contiguous buffer per operand.
+
     Args:
         op_str (str): Operator string.
         nr_parties (int): Number of parties
         a_shape (Tuple[int]): Shape of a from beaver triples protocol.
         b_shape (Tuple[int]): Shape of b part from beaver triples protocol.
+        n_instances (int): Number of triples to generate. Defaults to 1.
+        ring_size (int): Ring of the shares. Defaults to 2**64.
         kwargs: Arbitrary keyword arguments for commands.
 
     Returns:
-        List[List[3 x List[ShareTensor, ShareTensor, ShareTensor]]]:
-        The generated triples a,b,c for each party.
+        List[List[List[ShareTensor, ShareTensor, ShareTensor]]]:
+        The generated (stacked) triples a,b,c for each party.
     """
     config = Config(encoder_precision=0)
-    a_rand = torch.empty(size=a_shape, dtype=torch.long).random_(
+    tensor_type = get_type_from_ring(ring_size)
+    a_rand = torch.empty(size=(n_instances, *a_shape), dtype=tensor_type).random_(
         generator=ttp_generator
     )
     a_shares = MPCTensor.generate_shares(
         secret=a_rand,
         nr_parties=nr_parties,
-        tensor_type=torch.long,
+        tensor_type=tensor_type,
         config=config,
     )
 
-    b_rand = torch.empty(size=b_shape, dtype=torch.long).random_(
+    b_rand = torch.empty(size=(n_instances, *b_shape), dtype=tensor_type).random_(
         generator=ttp_generator
     )
     b_shares = MPCTensor.generate_shares(
         secret=b_rand,
         nr_parties=nr_parties,
-        tensor_type=torch.long,
+        tensor_type=tensor_type,
         config=config,
     )
 
-    if op_str in ["conv2d", "conv_transpose2d"]:
-        cmd = getattr(torch, op_str)
-    else:
-        cmd = getattr(operator, op_str)
-
-    c_val = cmd(a_rand, b_rand, **kwargs)
+    # The result is computed with longs (not all the operations are implemented for
+    # the smaller types) - it is reduced to the ring when it is shared
+    c_val = _stacked_op(op_str, a_rand.long(), b_rand.long(), **kwargs)
     c_shares = MPCTensor.generate_shares(
-        secret=c_val, nr_parties=nr_parties, tensor_type=torch.long, config=config
+        secret=c_val, nr_parties=nr_parties, tensor_type=tensor_type, config=config
     )
 
-    # We are always creating an instance
-    triple_sequential = [(a_shares, b_shares, c_shares)]
-
     """
     Example -- for n_instances=2 and n_parties=2:
-    For Beaver Triples the "res" would look like:
-    res = [
-        ([a0_sh_p0, a0_sh_p1], [b0_sh_p0, b0_sh_p1], [c0_sh_p0, c0_sh_p1]),
-        ([a1_sh_p0, a1_sh_p1], [b1_sh_p0, b1_sh_p1], [c1_sh_p0, c1_sh_p1])
-    ]
+    a_shares, b_shares and c_shares hold a share for each party, where each share
+    has a leading dimension of size n_instances:
+    a_shares = [a_sh_p0, a_sh_p1] (a_sh_p0.shape == (2, *a_shape))
 
     We want to send to each party the values they should hold:
     primitives = [
-        [[a0_sh_p0, b0_sh_p0, c0_sh_p0], [a1_sh_p0, b1_sh_p0, c1_sh_p0]], # (Row 0)
-        [[a0_sh_p1, b0_sh_p1, c0_sh_p1], [a1_sh_p1, b1_sh_p1, c1_sh_p1]]  # (Row 1)
+        [[a_sh_p0, b_sh_p0, c_sh_p0]], # (Row 0)
+        [[a_sh_p1, b_sh_p1, c_sh_p1]]  # (Row 1)
     ]
 
-    The first party (party 0) receives Row 0 and the second party (party 1) receives Row 1
+    The first party (party 0) receives Row 0 and the second party (party 1) receives Row 1.
+    The store splits the stacked shares back into instances (see _split_instances).
     """
 
-    triple = list(map(list, zip(*map(lambda x: map(list, zip(*x)), triple_sequential))))
+    triple = [[list(shares)] for shares in zip(a_shares, b_shares, c_shares)]
 
     return triple
 
 
+def _stacked_op(
+    op_str: str, a: torch.Tensor, b: torch.Tensor, **kwargs: Dict[Any, Any]
+) -> torch.Tensor:
+    """Apply an operation independently for each instance of two stacked tensors.
+
+    Args:
+        op_str (str): Operator string.
+        a (torch.Tensor): Stacked first operands (leading dimension is the instance).
+        b (torch.Tensor): Stacked second operands (leading dimension is the instance).
+        kwargs: Arbitrary keyword arguments for the operation.
+
+    Returns:
+        torch.Tensor: The stacked results.
+    """
+    if op_str == "mul":
+        # Right-align the instance shapes such that broadcasting never mixes
+        # values from different instances
+        nr_dims = max(a.dim(), b.dim())
+        a = a.view(a.shape[0], *([1] * (nr_dims - a.dim())), *a.shape[1:])
+        b = b.view(b.shape[0], *([1] * (nr_dims - b.dim())), *b.shape[1:])
+        return a * b
+
+    if op_str in ["conv2d", "conv_transpose2d"]:
+        cmd = getattr(torch, op_str)
+    else:
+        cmd = getattr(operator, op_str)
+
+    return torch.stack([cmd(a_i, b_i, **kwargs) for a_i, b_i in zip(a, b)])
+
+
+def _split_instances(
+    primitives: Iterable[Iterable[Union[ShareTensor, torch.Tensor]]]
+) -> List[List[Any]]:
+    """Split stacked primitives into instances.
+
+    The views share the memory of the stacked tensors, no data is copied.
+
+    Args:
+        primitives (Iterable[Iterable[Union[ShareTensor, torch.Tensor]]]): Stacked
+            primitives, the leading dimension of each tensor represents the instance.
+
+    Returns:
+        List[List[Union[ShareTensor, torch.Tensor]]]: A list with the primitives for
+        each instance.
+    """
+    instances = []
+    for stacked in primitives:
+        tensors = [
+            share if isinstance(share, torch.Tensor) else share.tensor
+            for share in stacked
+        ]
+        values = [tensor.unbind(0) for tensor in tensors]
+        for instance_values in zip(*values):
+            instance = []
+            for share, value in zip(stacked, instance_values):
+                if isinstance(share, torch.Tensor):
+                    instance.append(value)
+                    continue
+
+                instance_share = ShareTensor(
+                    session_uuid=share.session_uuid, config=share.config
+                )
+                instance_share.tensor = value
+                instance.append(instance_share)
+
+            instances.append(instance)
+
+    return instances
+
+
 """ Beaver Operations defined for Multiplication """
 
 
@@ -146,11 +224,8 @@ def mul_store_add(
         a_shape (Tuple[int]): the shape of the first operand
         b_shape (Tuple[int]): the shape of the second operand
     """
-    config_key = f"beaver_mul_{a_shape}_{b_shape}"
-    if config_key in store:
-        store[config_key].extend(primitives)
-    else:
-        store[config_key] = primitives
+    config_key = get_primitive_key("beaver_mul", a_shape, b_shape)
+    add_primitives_to_queue(store, config_key, _split_instances(primitives))
 
 
 @register_primitive_store_get("beaver_mul")
@@ -172,26 +247,9 @@ def mul_store_get(
 
     Returns:
         Any: The primitives required for the "mul" operation.
-
-    Raises:
-        EmptyPrimitiveStore: If no primitive in the store for config_key.
     """
-    config_key = f"beaver_mul_{tuple(a_shape)}_{tuple(b_shape)}"
-
-    try:
-        primitives = store[config_key]
-    except KeyError:
-        raise EmptyPrimitiveStore(f"{config_key} does not exists in the store")
-
-    try:
-        primitive = primitives[0]
-    except Exception:
-        raise EmptyPrimitiveStore(f"No primitive in the store for {config_key}")
-
-    if remove:
-        del primitives[0]
-
-    return primitive
+    config_key = get_primitive_key("beaver_mul", a_shape, b_shape)
+    return get_primitive_from_queue(store, config_key, remove=remove)
 
 
 """ Beaver Operations defined for Matrix Multiplication """
@@ -230,11 +288,8 @@ def matmul_store_add(
         b_shape (Tuple[int]): The shape of the second operand.
 
     """
-    config_key = f"beaver_matmul_{a_shape}_{b_shape}"
-    if config_key in store:
-        store[config_key].extend(primitives)
-    else:
-        store[config_key] = primitives
+    config_key = get_primitive_key("beaver_matmul", a_shape, b_shape)
+    add_primitives_to_queue(store, config_key, _split_instances(primitives))
 
 
 @register_primitive_store_get("beaver_matmul")
@@ -256,26 +311,9 @@ def matmul_store_get(
 
     Returns:
         Any: The primitives required for the "matmul" operation.
-
-    Raises:
-        EmptyPrimitiveStore: If no primitive in the store for config_key.
     """
-    config_key = f"beaver_matmul_{tuple(a_shape)}_{tuple(b_shape)}"
-
-    try:
-        primitives = store[config_key]
-    except KeyError:
-        raise EmptyPrimitiveStore(f"{config_key} does not exists in the store")
-
-    try:
-        primitive = primitives[0]
-    except Exception:
-        raise EmptyPrimitiveStore(f"No primitive in the store for {config_key}")
-
-    if remove:
-        del primitives[0]
-
-    return primitive
+    config_key = get_primitive_key("beaver_matmul", a_shape, b_shape)
+    return get_primitive_from_queue(store, config_key, remove=remove)
 
 
 """ Beaver Operations defined for Convolution 2D """
@@ -313,11 +351,8 @@ def conv2d_store_add(
         a_shape (Tuple[int]): The shape of the first operand.
         b_shape (Tuple[int]): The shape of the second operand.
     """
-    config_key = f"beaver_conv2d_{a_shape}_{b_shape}"
-    if config_key in store:
-        store[config_key].extend(primitives)
-    else:
-        store[config_key] = primitives
+    config_key = get_primitive_key("beaver_conv2d", a_shape, b_shape)
+    add_primitives_to_queue(store, config_key, _split_instances(primitives))
 
 
 @register_primitive_store_get("beaver_conv2d")
@@ -339,26 +374,9 @@ def conv2d_store_get(
 
     Returns:
         Any: The primitives required for the "conv2d" operation.
-
-    Raises:
-        EmptyPrimitiveStore: If no primitive in the store for config_key.
     """
-    config_key = f"beaver_conv2d_{tuple(a_shape)}_{tuple(b_shape)}"
-
-    try:
-        primitives = store[config_key]
-    except KeyError:
-        raise EmptyPrimitiveStore(f"{config_key} does not exists in the store")
-
-    try:
-        primitive = primitives[0]
-    except Exception:
-        raise EmptyPrimitiveStore(f"No primitive in the store for {config_key}")
-
-    if remove:
-        del primitives[0]
-
-    return primitive
+    config_key = get_primitive_key("beaver_conv2d", a_shape, b_shape)
+    return get_primitive_from_queue(store, config_key, remove=remove)
 
 
 """ Beaver Operations defined for Convolution Transpose 2D """
@@ -396,11 +414,8 @@ def conv_transpose2d_store_add(
         a_shape (Tuple[int]): The shape of the first operand.
         b_shape (Tuple[int]): The shape of the second operand.
     """
-    config_key = f"beaver_conv_transpose2d_{a_shape}_{b_shape}"
-    if config_key in store:
-        store[config_key].extend(primitives)
-    else:
-        store[config_key] = primitives
+    config_key = get_primitive_key("beaver_conv_transpose2d", a_shape, b_shape)
+    add_primitives_to_queue(store, config_key, _split_instances(primitives))
 
 
 @register_primitive_store_get("beaver_conv_transpose2d")
@@ -422,26 +437,9 @@ def conv_transpose2d_store_get(
 
     Returns:
         Any: The primitives required for the "conv2d" operation.
-
-    Raises:
-        EmptyPrimitiveStore: If no primitive in the store for config_key.
     """
-    config_key = f"beaver_conv_transpose2d_{tuple(a_shape)}_{tuple(b_shape)}"
-
-    try:
-        primitives = store[config_key]
-    except KeyError:
-        raise EmptyPrimitiveStore(f"{config_key} does not exists in the store")
-
-    try:
-        primitive = primitives[0]
-    except Exception:
-        raise EmptyPrimitiveStore(f"No primitive in the store for {config_key}")
-
-    if remove:
-        del primitives[0]
-
-    return primitive
+    config_key = get_primitive_key("beaver_conv_transpose2d", a_shape, b_shape)
+    return get_primitive_from_queue(store, config_key, remove=remove)
 
 
 """ Beaver Operations defined for Counting the Wrap-Arounds """
@@ -449,8 +447,11 @@ def conv_transpose2d_store_get(
 
 @register_primitive_generator("beaver_wraps")
 def count_wraps_rand(
-    nr_parties: int, shape: Tuple[int]
-) -> Tuple[List[ShareTensor], List[ShareTensor]]:
+    nr_parties: int,
+    shape: Tuple[int],
+    n_instances: int = 1,
+    ring_size: int = 2 ** 64,
+) -> List[List[List[ShareTensor]]]:
     """Count wraps random.
 
     The Trusted Third Party (TTP) or Crypto provider should generate:
@@ -464,31 +465,188 @@ def count_wraps_rand(
     Args:
         nr_parties (int): Number of parties
         shape (Tuple[int]): The shape for the random value
+        n_instances (int): Number of instances to generate. Defaults to 1.
+        ring_size (int): Ring of the shares. Defaults to 2**64.
 
     Returns:
-        List[List[List[ShareTensor, ShareTensor]]: a list of instaces with the shares
+        List[List[List[ShareTensor, ShareTensor]]: for each party, the (stacked) shares
         for a random integer value and shares for the number of wraparounds that are done when
-        reconstructing the random value
+        reconstructing the random value. The leading dimension of each share is the instance.
     """
-    rand_val = torch.empty(size=shape, dtype=torch.long).random_(
+    tensor_type = get_type_from_ring(ring_size)
+    rand_val = torch.empty(size=(n_instances, *shape), dtype=tensor_type).random_(
         generator=ttp_generator
     )
 
     config = Config(encoder_precision=0)
     r_shares = MPCTensor.generate_shares(
-        secret=rand_val, nr_parties=nr_parties, tensor_type=torch.long, config=config
+        secret=rand_val, nr_parties=nr_parties, tensor_type=tensor_type, config=config
     )
     wraps = count_wraps([share.tensor for share in r_shares])
 
     theta_r_shares = MPCTensor.generate_shares(
-        secret=wraps, nr_parties=nr_parties, tensor_type=torch.long, config=config
+        secret=wraps, nr_parties=nr_parties, tensor_type=tensor_type, config=config
+    )
+
+    primitives = [[list(shares)] for shares in zip(r_shares, theta_r_shares)]
+
+    return primitives
+
+
+""" Operations defined for the Bits (see MPCBitTensor) """
+
+
+def _xor_shares(bits: torch.Tensor, nr_parties: int) -> List[torch.Tensor]:
+    """Split bits in XOR shares, the shares are packed 8 bits per byte.
+
+    Args:
+        bits (torch.Tensor): The bits, one row for each instance.
+        nr_parties (int): Number of parties.
+
+    Returns:
+        List[torch.Tensor]: The packed shares for each party, one row for each
+        instance (each row is packed like :func:`pack_bits`).
+    """
+    packed = torch.from_numpy(
+        np.packbits(bits.numpy().astype(np.uint8), axis=-1, bitorder="little")
     )
+    shares = [
+        torch.empty(packed.shape, dtype=torch.uint8).random_(generator=ttp_generator)
+        for _ in range(nr_parties - 1)
+    ]
+    shares.append(reduce(operator.xor, shares, packed))
+
+    return shares
+
+
+def _random_bits(n_instances: int, numel: int) -> torch.Tensor:
+    """Generate random bits.
 
-    # We are always creating only an instance
-    primitives_sequential = [(r_shares, theta_r_shares)]
+    Args:
+        n_instances (int): Number of instances.
+        numel (int): Number of bits for an instance.
 
-    primitives = list(
-        map(list, zip(*map(lambda x: map(list, zip(*x)), primitives_sequential)))
+    Returns:
+        torch.Tensor: The bits, one row for each instance.
+    """
+    return torch.empty((n_instances, numel), dtype=torch.long).random_(
+        0, 2, generator=ttp_generator
     )
 
-    return primitives
+
+@register_primitive_generator("dabit")
+def get_dabits(
+    nr_parties: int, numel: int, n_instances: int = 1, ring_size: int = 2 ** 64
+) -> List[List[List[Any]]]:
+    """Get random bits that are shared both with XOR and arithmetic sharing.
+
+    They are used to convert bits (shared with XOR) to arithmetic shares.
+
+    All the instances are generated at once (stacked on a leading dimension), the
+    store splits them back into instances.
+
+    Args:
+        nr_parties (int): Number of parties.
+        numel (int): Number of bits for an instance.
+        n_instances (int): Number of instances to generate. Defaults to 1.
+        ring_size (int): Ring of the arithmetic shares. Defaults to 2**64.
+
+    Returns:
+        List[List[List[Any]]]: for each party, the (stacked) packed XOR share and
+        arithmetic share of the random bits.
+    """
+    config = Config(encoder_precision=0)
+    tensor_type = get_type_from_ring(ring_size)
+
+    bits = _random_bits(n_instances, numel)
+    xor_shares = _xor_shares(bits, nr_parties)
+    arith_shares = MPCTensor.generate_shares(
+        secret=bits, nr_parties=nr_parties, tensor_type=tensor_type, config=config
+    )
+
+    return [[list(shares)] for shares in zip(xor_shares, arith_shares)]
+
+
+@register_primitive_store_add("dabit")
+def dabit_store_add(store: Any, primitives: Iterable[Any], numel: int) -> None:
+    """Add the daBits to the CryptoStore.
+
+    Args:
+        store (Any): The CryptoStore.
+        primitives (Iterable[Any]): The list of primitives.
+        numel (int): Number of bits for an instance.
+    """
+    key = get_primitive_key("dabit", (numel,))
+    add_primitives_to_queue(store, key, _split_instances(primitives))
+
+
+@register_primitive_store_get("dabit")
+def dabit_store_get(store: Dict[Any, Any], numel: int, remove: bool = True) -> Any:
+    """Retrieve the daBits from the CryptoStore.
+
+    Args:
+        store (Dict[Any, Any]): The CryptoStore.
+        numel (int): Number of bits.
+        remove (bool): True if the primitives should be removed from the store.
+
+    Returns:
+        Any: The packed XOR share and the arithmetic share of the random bits.
+    """
+    key = get_primitive_key("dabit", (numel,))
+    return get_primitive_from_queue(store, key, remove=remove)
+
+
+@register_primitive_generator("beaver_bit_and")
+def get_triples_bit_and(
+    nr_parties: int, numel: int, n_instances: int = 1
+) -> List[List[List[torch.Tensor]]]:
+    """Get the beaver triples for the "and" between bits.
+
+    All the instances are generated at once (stacked on a leading dimension), the
+    store splits them back into instances.
+
+    Args:
+        nr_parties (int): Number of parties.
+        numel (int): Number of bits for an instance.
+        n_instances (int): Number of instances to generate. Defaults to 1.
+
+    Returns:
+        List[List[List[torch.Tensor]]]: for each party, the (stacked) packed XOR
+        shares of the random bits a, b and "a and b".
+    """
+    a_bits = _random_bits(n_instances, numel)
+    b_bits = _random_bits(n_instances, numel)
+    shares = [
+        _xor_shares(bits, nr_parties) for bits in (a_bits, b_bits, a_bits & b_bits)
+    ]
+
+    return [[list(triple)] for triple in zip(*shares)]
+
+
+@register_primitive_store_add("beaver_bit_and")
+def bit_and_store_add(store: Any, primitives: Iterable[Any], numel: int) -> None:
+    """Add the primitives required for the "and" between bits to the CryptoStore.
+
+    Args:
+        store (Any): The CryptoStore.
+        primitives (Iterable[Any]): The list of primitives.
+        numel (int): Number of bits for an instance.
+    """
+    key = get_primitive_key("beaver_bit_and", (numel,))
+    add_primitives_to_queue(store, key, _split_instances(primitives))
+
+
+@register_primitive_store_get("beaver_bit_and")
+def bit_and_store_get(store: Dict[Any, Any], numel: int, remove: bool = True) -> Any:
+    """Retrieve the primitives required for the "and" between bits.
+
+    Args:
+        store (Dict[Any, Any]): The CryptoStore.
+        numel (int): Number of bits.
+        remove (bool): True if the primitives should be removed from the store.
+
+    Returns:
+        Any: The packed XOR shares of a, b and "a and b".
+    """
+    key = get_primitive_key("beaver_bit_and", (numel,))
+    return get_primitive_from_queue(store, key, remove=remove)
@@ -4,9 +4,11 @@ Falcon : Honest-Majority Maliciously Secure Framework for Private Deep Learning.
 arXiv:2004.02229 [cs.CR]
 """
 # stdlib
+import operator
 from typing import Any
 from typing import Dict
 from typing import List
+from typing import Optional
 
 # third party
 import torch
@@ -20,6 +22,9 @@ from sympc.tensor import ReplicatedSharedTensor
 from sympc.tensor.tensor import SyMPCTensor
 from sympc.utils import parallel_execution
 
+# Operations that are computed with the (one round) Falcon multiplication
+MUL_OPS = {"mul", "matmul", "conv2d", "conv_transpose2d"}
+
 
 class Falcon(metaclass=Protocol):
     """Falcon Protocol Implementation."""
@@ -73,40 +78,61 @@ class Falcon(metaclass=Protocol):
         return True
 
     @staticmethod
-    def mul_master(x: MPCTensor, y: MPCTensor, session: Session) -> MPCTensor:
+    def mul_master(
+        x: MPCTensor,
+        y: MPCTensor,
+        session: Session,
+        op_str: str = "mul",
+        kwargs_: Optional[Dict[str, Any]] = None,
+    ) -> MPCTensor:
         """Master method for multiplication.
 
         Performs Falcon's mul implementation, gets and reshares mul results and distributes shares.
         This needs to be improved in future, it relies on orchestrator being a trusted third party.
         Falcon, requires parties to be able to communication between each other.
 
+        The same single round is used for "mul", "matmul", "conv2d" and
+        "conv_transpose2d" - the parties compute the local product for "op_str"
+        and reshare it with a PRZS mask.
+
         Args:
             x (MPCTensor): Secret
             y (MPCTensor): Another secret
             session (Session): Session the tensors belong to
+            op_str (str): The multiplication operation. Defaults to "mul".
+            kwargs_ (Optional[Dict[str, Any]]): Kwargs for some operations like
+                conv2d. Defaults to None.
 
         Returns:
             shares (ReplicatedSharedTensor): Shares in terms of ReplicatedSharedTensor.
 
         Raises:
-            ValueError: Raised when number of parties are not three.
+            ValueError: Raised when number of parties are not three or "op_str" is
+                not a multiplication operation.
             NotImplementedError: Raised when implementation not present
 
         """
         if len(session.parties) != 3:
             raise ValueError("Falcon requires 3 parties")
 
+        if op_str not in MUL_OPS:
+            raise ValueError(f"{op_str} should be one of {MUL_OPS}")
+
+        if kwargs_ is None:
+            kwargs_ = {}
+
         result = None
 
         if session.protocol.security_type == "semi-honest":
-            args = list(zip(x.share_ptrs, y.share_ptrs))
+            args = [list(el) + [op_str] for el in zip(x.share_ptrs, y.share_ptrs)]
 
             z_shares_ptrs = parallel_execution(
                 Falcon.compute_zvalue_and_add_mask, session.parties
-            )(args)
+            )(args, kwargs_)
 
             result = MPCTensor(shares=z_shares_ptrs, session=x.session)
-            result.shape = MPCTensor._get_shape("mul", x.shape, y.shape)  # for prrs
+            # The shape is used by the truncation (for prrs)
+            result.shape = MPCTensor._get_shape(op_str, x.shape, y.shape, **kwargs_)
             result = ABY3.truncate(result, session)
 
         else:
@@ -120,40 +146,62 @@ class Falcon(metaclass=Protocol):
     def compute_zvalue_and_add_mask(
         x: ReplicatedSharedTensor,
         y: ReplicatedSharedTensor,
+        op_str: str = "mul",
+        **kwargs: Dict[str, Any],
     ) -> torch.Tensor:
         """Operation to compute local z share and add mask to it.
 
         Args:
             x (ReplicatedSharedTensor): Secret.
             y (ReplicatedSharedTensor): Another secret.
+            op_str (str): The multiplication operation. Defaults to "mul".
+            **kwargs (Dict[str, Any]): Kwargs for some operations like conv2d.
 
         Returns:
             share (Torch.tensor): The masked local z share.
         """
         # Parties calculate z value locally
         session = get_session(x.session_uuid)
-        z_value = x * y
-        przs_mask = session.przs_generate_random_share(shape=x.shape)
+        z_value = Falcon.multiplication_protocol(x, y, op_str, **kwargs)
+        przs_mask = session.przs_generate_random_share(shape=z_value.shape)
         # Add PRZS Mask to z  value
-        share = z_value.get_shares()[0] + przs_mask.get_shares()[0]
+        share = z_value + przs_mask.get_shares()[0]
         return share
 
     @staticmethod
     def multiplication_protocol(
-        x: ReplicatedSharedTensor, y: ReplicatedSharedTensor
-    ) -> ReplicatedSharedTensor:
+        x: ReplicatedSharedTensor,
+        y: ReplicatedSharedTensor,
+        op_str: str = "mul",
+        **kwargs: Dict[str, Any],
+    ) -> torch.Tensor:
         """Implementation of Falcon's multiplication with semi-honest security guarantee.
 
+        The local product "x0 * y0 + x1 * y0 + x0 * y1" is computed as
+        "x0 * (y0 + y1) + x1 * y0" - the operations are bilinear, such that only two
+        products are needed (for matmul and convolutions they dominate the cost).
+
         Args:
             x (ReplicatedSharedTensor): Secret
             y (ReplicatedSharedTensor): Another secret
+            op_str (str): The multiplication operation. Defaults to "mul".
+            **kwargs (Dict[str, Any]): Kwargs for some operations like conv2d.
 
         Returns:
-            shares (ReplicatedSharedTensor): results in terms of ReplicatedSharedTensor.
+            torch.Tensor: The local (additive) share of the product.
+
+        Raises:
+            ValueError: If "op_str" is not a multiplication operation.
         """
-        z_value = (
-            x.shares[0] * y.shares[0]
-            + x.shares[1] * y.shares[0]
-            + x.shares[0] * y.shares[1]
+        if op_str not in MUL_OPS:
+            raise ValueError(f"{op_str} should be one of {MUL_OPS}")
+
+        if op_str in {"conv2d", "conv_transpose2d"}:
+            op = getattr(torch, op_str)
+        else:
+            op = getattr(operator, op_str)
+
+        z_value = op(x.shares[0], y.shares[0] + y.shares[1], **kwargs) + op(
+            x.shares[1], y.shares[0], **kwargs
         )
         return z_value
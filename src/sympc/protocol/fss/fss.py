@@ -4,14 +4,18 @@ ARIANN: Low-Interaction Privacy-Preserving Deep Learning via Function Secret Sha
 arXiv:2006.04593 [cs.LG]
 """
 # stdlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import multiprocessing
-import os
+import threading
 from typing import Any
 from typing import Dict
 from typing import Iterable
 from typing import List
-from typing import Tuple
-import warnings
+from typing import Optional
+from typing import Union
+from uuid import uuid4
 
 # third party
 import numpy as np
@@ -25,10 +29,17 @@ from sympc.store import CryptoPrimitiveProvider
 from sympc.store import register_primitive_generator
 from sympc.store import register_primitive_store_add
 from sympc.store import register_primitive_store_get
+from sympc.store.crypto_store import get_primitive_key
+from sympc.store.exceptions import EmptyPrimitiveStore
 from sympc.tensor import MPCTensor
 from sympc.tensor import ShareTensor
+from sympc.tensor.bit_share_tensor import BitShareTensor
+from sympc.tensor.mpc_bit_tensor import MPCBitTensor
 from sympc.tensor.tensor import SyMPCTensor
+from sympc.utils import get_channel
+from sympc.utils import op_scope
 from sympc.utils import parallel_execution
+from sympc.utils import register_executor
 
 ttp_generator = csprng.create_random_device_generator()
 
@@ -37,13 +48,170 @@ n = 32  # bit precision
 
 # number of processes
 N_CORES = multiprocessing.cpu_count()
-dpf = sycret.EqFactory(n_threads=N_CORES)
-dif = sycret.LeFactory(n_threads=N_CORES)
+
+# FSS is not supported on GPU, the values used by sycret are always on the CPU
+CPU = th.device("cpu")
+
+# The keys for an operation are reserved by the mask step and used by the evaluation
+RESERVED_KEYS = "fss_reserved_keys"
+
+# number of values for which the keys are evaluated with one call
+EVAL_CHUNK_SIZE = 2 ** 16
+
+# The pools used to evaluate the chunks are kept by the session of each party (see
+# Session.executors), for each thread budget
+EVAL_EXECUTOR = "fss_eval"
+_EVAL_EXECUTORS_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def get_factory(op: str, n_threads: int) -> Any:
+    """Get the sycret factory (created only once) for an operation.
+
+    Args:
+        op (str): Type of operation (eq or comp).
+        n_threads (int): Number of threads used by the factory.
+
+    Returns:
+        Any: The factory (EqFactory for eq and LeFactory for comp).
+
+    Raises:
+        ValueError: If the operation is not valid.
+    """
+    if op == "eq":
+        return sycret.EqFactory(n_threads=n_threads)
+
+    if op == "comp":
+        return sycret.LeFactory(n_threads=n_threads)
+
+    raise ValueError(f"{op} is an FSS unsupported operation.")
+
+
+def get_thread_budget(session: Session, n_threads: Optional[int] = None) -> int:
+    """Get the number of threads a party can use for the FSS operations.
+
+    Args:
+        session (Session): MPC Session.
+        n_threads (Optional[int]): Number of threads requested by the orchestrator.
+            Defaults to None.
+
+    Returns:
+        int: The number of threads - if not requested the cores are split between the
+        parties (that might run on the same machine).
+    """
+    if n_threads is not None:
+        return max(1, int(n_threads))
+
+    return max(1, N_CORES // max(1, session.nr_parties))
+
+
+def _get_eval_executor(session: Session, n_threads: int) -> ThreadPoolExecutor:
+    """Get the pool used by a party to evaluate the chunks.
+
+    Each party (session) has its own pool, such that the parties that run in the
+    same process get their whole budget. The pool is shut down with the session
+    (or with "shutdown_executors").
+
+    Args:
+        session (Session): MPC Session (of the party).
+        n_threads (int): Number of workers.
+
+    Returns:
+        ThreadPoolExecutor: The pool.
+    """
+    name = f"{EVAL_EXECUTOR}_{n_threads}"
+    with _EVAL_EXECUTORS_LOCK:
+        executor = session.executors.get(name, None)
+        if executor is None or executor._shutdown:
+            executor = ThreadPoolExecutor(
+                max_workers=n_threads, thread_name_prefix="sympc-fss"
+            )
+            session.executors[name] = executor
+            register_executor(executor)
+
+        return executor
+
+
+def _eval_keys(
+    session: Session,
+    op: str,
+    b: int,
+    x_masked: np.ndarray,
+    keys: np.ndarray,
+    n_threads: int,
+) -> np.ndarray:
+    """Evaluate the keys, the large inputs are split in chunks evaluated in parallel.
+
+    Args:
+        session (Session): MPC Session (of the party).
+        op (str): Type of operation (eq or comp).
+        b (int): Rank of the evaluator.
+        x_masked (np.ndarray): The flattened public input.
+        keys (np.ndarray): A key for each value.
+        n_threads (int): Number of threads that can be used.
+
+    Returns:
+        np.ndarray: The flattened result.
+    """
+    numel = len(x_masked)
+    if n_threads == 1 or numel <= EVAL_CHUNK_SIZE:
+        return get_factory(op, n_threads).eval(b, x_masked, keys)
+
+    # Each chunk is evaluated by a single thread
+    factory = get_factory(op, 1)
+    executor = _get_eval_executor(session, n_threads)
+    futures = [
+        executor.submit(
+            factory.eval,
+            b,
+            x_masked[start : start + EVAL_CHUNK_SIZE],
+            keys[start : start + EVAL_CHUNK_SIZE],
+        )
+        for start in range(0, numel, EVAL_CHUNK_SIZE)
+    ]
+
+    return np.concatenate([future.result() for future in futures])
+
+
+def _reserve_keys(
+    session: Session, op: str, n_values: int, op_id: str, position: int
+) -> np.ndarray:
+    """Remove the keys for an operation from the store and reserve them.
+
+    The orchestrator gives to each operation the position of its keys, such that all
+    the parties reserve the same keys even if the operations reach them in a
+    different order. If the operation is retried, the keys that are already reserved
+    are used.
+
+    Args:
+        session (Session): MPC Session.
+        op (str): Type of operation (eq or comp).
+        n_values (int): Number of values compared by the operation.
+        op_id (str): Identifies the operation.
+        position (int): Position of the first key for the operation.
+
+    Returns:
+        np.ndarray: The keys.
+    """
+    crypto_store = session.crypto_store
+    reserved_key = (RESERVED_KEYS, str(op_id))
+    if reserved_key not in crypto_store.store:
+        queue = _get_fss_queue(f"fss_{op}", crypto_store.store)
+        crypto_store.store[reserved_key] = crypto_store.reserve_primitives(
+            get_primitive_key(f"fss_{op}"), position, n_values, queue.get
+        )
+
+    return crypto_store.store[reserved_key]
 
 
 # share level
 def mask_builder(
-    session: Session, x1: ShareTensor, x2: ShareTensor, op: str
+    session: Session,
+    x1: ShareTensor,
+    x2: Union[ShareTensor, th.Tensor, float, int],
+    op: str,
+    op_id: Optional[str] = None,
+    position: Optional[int] = None,
 ) -> ShareTensor:
     """Mask the private inputs.
 
@@ -55,28 +223,74 @@ def mask_builder(
     Args:
         session (Session): MPC Session.
         x1 (ShareTensor): Share of the first private value.
-        x2 (ShareTensor): Share of the second private value.
+        x2 (Union[ShareTensor, th.Tensor, float, int]): Share of the second private
+            value (or the public value, for the first party).
         op (str): Type of operation to perform (eq or comp).
+        op_id (Optional[str]): If specified, the keys found at the position are
+            reserved for the operation with this id (see :func:`_reserve_keys`),
+            otherwise the first keys from the store are used. Defaults to None.
+        position (Optional[int]): Position of the first key for the operation (used
+            with op_id). Defaults to None.
 
     Returns:
         ShareTensor: share of the masked input
     """
     x = x1 - x2
+    x.tensor = x.tensor.to(CPU)
 
-    keys = session.crypto_store.get_primitives_from_store(
-        f"fss_{op}", nr_instances=x.numel(), remove=False
-    )
+    crypto_store = session.crypto_store
+    if op_id is not None:
+        keys = _reserve_keys(session, str(op), x.numel(), op_id, position)
+    else:
+        keys = crypto_store.get_primitives_from_store(
+            f"fss_{op}", nr_instances=x.numel(), remove=False
+        )
 
     n_bytes = n // 8  # keys contains bytes not bits
     alpha = np.frombuffer(np.ascontiguousarray(keys[:, 0:n_bytes]), dtype=np.uint32)
 
-    x.tensor += th.tensor(alpha.astype(np.int64)).reshape(x.shape)
+    alpha = th.tensor(alpha.astype(np.int64), device=CPU).reshape(x.shape)
+    x.tensor += alpha.to(x.tensor.dtype)
 
     return x
 
 
+def _evaluate_flat(
+    session: Session, b, x_masked, op, n_threads=None, op_id=None
+) -> np.ndarray:
+    """Evaluate the keys on the masked input.
+
+    Args:
+        session (Session): MPC Session
+        b: rank of the evaluator running this function
+        x_masked: the public input created by masking the private input
+        op: the type of operation (eq or comp)
+        n_threads: the number of threads used for the evaluation
+        op_id: the id used by the mask step to reserve the keys
+
+    Returns:
+        np.ndarray: The flattened share of the result.
+    """
+    numel = x_masked.numel()
+    crypto_store = session.crypto_store
+    if op_id is not None:
+        keys = crypto_store.store.pop((RESERVED_KEYS, str(op_id)))
+    else:
+        keys = crypto_store.get_primitives_from_store(
+            f"fss_{op}", nr_instances=numel, remove=True
+        )
+
+    b = b.to(CPU).numpy().item()
+    x_masked = x_masked.to(CPU).numpy().reshape(-1)
+
+    n_threads = get_thread_budget(session, n_threads)
+    return _eval_keys(session, str(op), b, x_masked, keys, n_threads)
+
+
 # share level
-def evaluate(session: Session, b, x_masked, op, dtype="long") -> ShareTensor:
+def evaluate(
+    session: Session, b, x_masked, op, dtype="long", n_threads=None, op_id=None
+) -> ShareTensor:
     """Evaluate the FSS protocol on the masked and public input `x_masked`.
 
     Args:
@@ -85,101 +299,346 @@ def evaluate(session: Session, b, x_masked, op, dtype="long") -> ShareTensor:
         x_masked: the public input created by masking the private input
         op: the type of operation (eq or comp)
         dtype: the type of the shares (int or long)
+        n_threads: the number of threads used for the evaluation (if None the cores
+            are split between the parties)
+        op_id: the id used by the mask step to reserve the keys (if None the first
+            keys from the store are used)
 
     Returns:
         ShareTensor: A share of the result of the FSS protocol.
     """
-    numel = x_masked.numel()
-    keys = session.crypto_store.get_primitives_from_store(
-        f"fss_{op}", nr_instances=numel, remove=True
-    )
-
-    b = b.numpy().item()
     original_shape = x_masked.shape
-    x_masked = x_masked.numpy().reshape(-1)
-
-    if op == "eq":
-        flat_result = dpf.eval(b, x_masked, keys)
-    elif op == "comp":
-        flat_result = dif.eval(b, x_masked, keys)
+    flat_result = _evaluate_flat(session, b, x_masked, op, n_threads, op_id)
 
     result_share = flat_result.astype(np.int32).astype(np.int64).reshape(original_shape)
 
     dtype_options = {None: th.long, "int": th.int32, "long": th.long}
-    result = th.tensor(result_share, dtype=dtype_options[dtype])
+    result = th.tensor(result_share, dtype=dtype_options[dtype], device=CPU)
 
     share_result = ShareTensor(
-        data=result, session_uuid=session.uuid, config=session.config
+        data=result,
+        session_uuid=session.uuid,
+        config=session.config,
+        ring_size=session.ring_size,
     )
 
     return share_result
 
 
-def fss_op(x1: MPCTensor, x2: MPCTensor, op="eq") -> MPCTensor:
-    """Define the workflow for a binary operation using Function Secret Sharing.
+# share level
+def evaluate_bits(
+    session: Session, b, x_masked, op, n_threads=None, op_id=None
+) -> BitShareTensor:
+    """Evaluate the FSS protocol and keep only the XOR share of the output bit.
 
-    Currently supported operand are = & <=, respectively corresponding to
-    op = 'eq' and 'comp'.
+    The output shares are arithmetic shares (modulo 2**32) of a bit - the lowest bit
+    of the shares is a XOR share of the output, that is packed 8 per byte.
 
     Args:
-        x1 (MPCTensor): First private value.
-        x2 (MPCTensor): Second private value.
-        op: Type of operation to perform, should be 'eq' or 'comp'. Defaults to eq.
+        session (Session): MPC Session
+        b: rank of the evaluator running this function
+        x_masked: the public input created by masking the private input
+        op: the type of operation (eq or comp)
+        n_threads: the number of threads used for the evaluation (if None the cores
+            are split between the parties)
+        op_id: the id used by the mask step to reserve the keys (if None the first
+            keys from the store are used)
 
     Returns:
-        MPCTensor: Shares of the comparison.
+        BitShareTensor: A share of the result of the FSS protocol.
     """
-    if th.cuda.is_available():
-        # FSS is currently not supported on GPU.
-        # https://stackoverflow.com/a/62145307/8878627
-
-        # When the CUDA_VISIBLE_DEVICES environment variable is not set,
-        # CUDA is not used even if available. Hence, we default to None
-        cuda_visible_devices = os.environ.get("CUDA_VISIBLE_DEVICES", None)
-        os.environ["CUDA_VISIBLE_DEVICES"] = ""
-        warnings.warn("Temporarily disabling CUDA as FSS does not support it")
-    else:
-        cuda_visible_devices = None
+    original_shape = x_masked.shape
+    flat_result = _evaluate_flat(session, b, x_masked, op, n_threads, op_id)
 
-    # FIXME: Better handle the case where x1 or x2 is not a MPCTensor. For the moment
-    # FIXME: we cast it into a MPCTensor at the expense of extra communication
-    session = x1.session
+    bits = (flat_result & 1).reshape(original_shape)
+    return BitShareTensor(data=bits, session_uuid=session.uuid)
+
+
+# share level
+def mask_and_evaluate(
+    session: Session,
+    x1: ShareTensor,
+    x2: Union[ShareTensor, th.Tensor, float, int],
+    op: str,
+    channel_name: str,
+    tag: str,
+    position: int,
+    n_threads: Optional[int] = None,
+) -> ShareTensor:
+    """Mask the private inputs, open the masked value with the other party and evaluate.
+
+    The masked shares are exchanged directly between the two evaluators through a
+    channel, such that the orchestrator does not see the masked value.
+
+    Args:
+        session (Session): MPC Session.
+        x1 (ShareTensor): Share of the first private value.
+        x2 (Union[ShareTensor, th.Tensor, float, int]): Share of the second private
+            value (or the public value, for the first party).
+        op (str): Type of operation to perform (eq or comp).
+        channel_name (str): Name of the channel used to exchange the masked shares.
+        tag (str): Identifies the messages and the keys for this operation.
+        position (int): Position of the first key for the operation.
+        n_threads (Optional[int]): The number of threads used for the evaluation.
+            Defaults to None.
 
-    shape = MPCTensor._get_shape("sub", x1.shape, x2.shape)
-    n_values = shape.numel()
+    Returns:
+        ShareTensor: A share of the result of the FSS protocol.
+    """
+    op = str(op)
+    tag = str(tag)
+    mask_value = _open_masked(session, x1, x2, op, channel_name, tag, position)
 
-    CryptoPrimitiveProvider.generate_primitives(
-        f"fss_{op}",
-        session=session,
-        g_kwargs={"n_values": n_values},
-        p_kwargs={},
+    return evaluate(
+        session, th.IntTensor([session.rank]), mask_value, op, "long", n_threads, tag
     )
 
-    args = zip(session.session_ptrs, x1.share_ptrs, x2.share_ptrs)
-    args = [list(el) + [op] for el in args]
 
-    shares = parallel_execution(mask_builder, session.parties)(args)
+# share level
+def mask_and_evaluate_bits(
+    session: Session,
+    x1: ShareTensor,
+    x2: Union[ShareTensor, th.Tensor, float, int],
+    op: str,
+    channel_name: str,
+    tag: str,
+    position: int,
+    n_threads: Optional[int] = None,
+) -> BitShareTensor:
+    """Like mask_and_evaluate, but keep only the XOR share of the output bits.
 
-    # TODO: don't do .reconstruct(), this should be done remotely between the evaluators
-    mask_value = MPCTensor(shares=shares, session=session)
-    mask_value = mask_value.reconstruct(decode=False) % 2 ** n
+    Args:
+        session (Session): MPC Session.
+        x1 (ShareTensor): Share of the first private value.
+        x2 (Union[ShareTensor, th.Tensor, float, int]): Share of the second private
+            value (or the public value, for the first party).
+        op (str): Type of operation to perform (eq or comp).
+        channel_name (str): Name of the channel used to exchange the masked shares.
+        tag (str): Identifies the messages and the keys for this operation.
+        position (int): Position of the first key for the operation.
+        n_threads (Optional[int]): The number of threads used for the evaluation.
+            Defaults to None.
 
-    # TODO: add dtype to args
-    args = [
-        (session.session_ptrs[i], th.IntTensor([i]), mask_value, op) for i in range(2)
-    ]
+    Returns:
+        BitShareTensor: A share of the result of the FSS protocol.
+    """
+    op = str(op)
+    tag = str(tag)
+    mask_value = _open_masked(session, x1, x2, op, channel_name, tag, position)
+
+    return evaluate_bits(
+        session, th.IntTensor([session.rank]), mask_value, op, n_threads, tag
+    )
+
+
+def _open_masked(
+    session: Session,
+    x1: ShareTensor,
+    x2: Union[ShareTensor, th.Tensor, float, int],
+    op: str,
+    channel_name: str,
+    tag: str,
+    position: int,
+) -> th.Tensor:
+    """Mask the private inputs and open the masked value with the other party.
+
+    If the keys are not in the store yet, the parties tell each other (such that none
+    of them waits for the other) and the operation can be retried.
+
+    Args:
+        session (Session): MPC Session.
+        x1 (ShareTensor): Share of the first private value.
+        x2 (Union[ShareTensor, th.Tensor, float, int]): Share of the second private
+            value (or the public value, for the first party).
+        op (str): Type of operation to perform (eq or comp).
+        channel_name (str): Name of the channel used to exchange the masked shares.
+        tag (str): Identifies the messages and the keys for this operation.
+        position (int): Position of the first key for the operation.
+
+    Returns:
+        th.Tensor: The masked value.
 
-    shares = parallel_execution(evaluate, session.parties)(args)
+    Raises:
+        EmptyPrimitiveStore: If the keys are not in the store of one of the parties.
+    """
+    rank = session.rank
+    other_rank = 1 - rank
+    channel = get_channel(channel_name)
+
+    try:
+        x = mask_builder(session, x1, x2, op, tag, position)
+    except EmptyPrimitiveStore:
+        channel.send(tag, rank, other_rank, None)
+        channel.recv(tag, other_rank, rank)
+        raise
+
+    channel.send(tag, rank, other_rank, x.tensor.clone())
+    other_tensor = channel.recv(tag, other_rank, rank)
+    if other_tensor is None:
+        raise EmptyPrimitiveStore(f"The keys for {tag} are not in the store yet")
+
+    # The masked value is in the ring of the session (it might be smaller than 2**n)
+    return (x.tensor + other_tensor).long() % 2 ** n
+
+
+def fss_op(
+    x1: MPCTensor,
+    x2: Union[MPCTensor, th.Tensor, float, int],
+    op="eq",
+    packed: bool = False,
+) -> Union[MPCTensor, MPCBitTensor]:
+    """Define the workflow for a binary operation using Function Secret Sharing.
+
+    Currently supported operand are = & <=, respectively corresponding to
+    op = 'eq' and 'comp'.
 
-    response = MPCTensor(session=session, shares=shares, shape=shape)
-    response.shape = shape
+    The second value can be public, in which case it is subtracted only by the
+    first party.
+
+    If the session has a channel, the masked value is opened by the two evaluators
+    between them (one round), otherwise it is reconstructed by the orchestrator and
+    sent back to the evaluators.
+
+    The function can be called from multiple threads at the same time - the
+    orchestrator gives to each operation the position of its keys in the stores of
+    the parties, which reserve them while masking (in the same round).
+
+    If "packed" is True, the parties keep only the XOR shares of the output bits,
+    packed 8 per byte.
+
+    Args:
+        x1 (MPCTensor): First private value.
+        x2 (Union[MPCTensor, th.Tensor, float, int]): Second value (private or public).
+        op: Type of operation to perform, should be 'eq' or 'comp'. Defaults to eq.
+        packed (bool): Get the output as packed bits. Defaults to False.
 
-    if cuda_visible_devices is not None:
-        os.environ["CUDA_VISIBLE_DEVICES"] = cuda_visible_devices
+    Returns:
+        Union[MPCTensor, MPCBitTensor]: Shares of the comparison.
+    """
+    # FIXME: Better handle the case where x1 is not a MPCTensor. For the moment
+    # FIXME: we cast it into a MPCTensor at the expense of extra communication
+    with op_scope(f"fss_{op}"):
+        session = x1.session
+
+        if isinstance(x2, MPCTensor):
+            x2_shares = x2.share_ptrs
+            x2_shape = x2.shape
+        else:
+            x2_shares = [x2] + [0] * (session.nr_parties - 1)
+            x2_shape = x2.shape if isinstance(x2, th.Tensor) else (1,)
+
+        shape = MPCTensor._get_shape("sub", x1.shape, x2_shape)
+        n_values = shape.numel()
+
+        # The keys used by this operation are identified by an id, such that multiple
+        # operations can run at the same time
+        op_id = uuid4().hex
+        key = get_primitive_key(f"fss_{op}")
+        with session.primitives_lock:
+            position = session.reserve_position(key, n_values)
+            missing = position + n_values - session.primitive_counts.get(key, 0)
+            if missing > 0:
+                # The keys were not generated in advance (see FSS.generate_keys)
+                _generate_keys(session, op, missing)
+
+        args = zip(session.session_ptrs, x1.share_ptrs, x2_shares)
+        args = [list(el) + [op] for el in args]
+
+        open_by_orchestrator = session.channel is None
+        if open_by_orchestrator:
+            party_fn = mask_builder
+            args = [el + [op_id, position] for el in args]
+        else:
+            # The evaluators open the masked value between them
+            party_fn = mask_and_evaluate_bits if packed else mask_and_evaluate
+            args = [
+                el + [session.channel, op_id, position, session.fss_threads]
+                for el in args
+            ]
+
+        mask = parallel_execution(
+            party_fn, session.parties, uses_channel=not open_by_orchestrator
+        )
+        while True:
+            try:
+                shares = mask(args)
+                break
+            except EmptyPrimitiveStore:
+                # Some keys were used without a position (the keys that are already
+                # reserved by a party are used again)
+                _generate_keys(session, op, n_values)
+
+        if open_by_orchestrator:
+            mask_value = MPCTensor(shares=shares, session=session)
+            mask_value = mask_value.reconstruct(decode=False).long() % 2 ** n
+
+            if packed:
+                args = [
+                    (
+                        session.session_ptrs[i],
+                        th.IntTensor([i]),
+                        mask_value,
+                        op,
+                        session.fss_threads,
+                        op_id,
+                    )
+                    for i in range(2)
+                ]
+
+                shares = parallel_execution(evaluate_bits, session.parties)(args)
+                return MPCBitTensor(session=session, shares=shares, shape=shape)
+
+            # TODO: add dtype to args
+            args = [
+                (
+                    session.session_ptrs[i],
+                    th.IntTensor([i]),
+                    mask_value,
+                    op,
+                    "long",
+                    session.fss_threads,
+                    op_id,
+                )
+                for i in range(2)
+            ]
+
+            shares = parallel_execution(evaluate, session.parties)(args)
+        elif packed:
+            return MPCBitTensor(session=session, shares=shares, shape=shape)
+
+        response = MPCTensor(session=session, shares=shares, shape=shape)
+        response.shape = shape
 
     return response
 
 
+def _generate_keys(session: Session, op: str, n_values: int) -> None:
+    """Generate keys and send them to the parties.
+
+    The orchestrator counts the keys sent to the parties (see
+    Session.primitive_counts), such that an operation generates only the keys that
+    are missing for its position.
+
+    Args:
+        session (Session): Session used for the computation.
+        op (str): Type of operation (eq or comp).
+        n_values (int): Number of keys.
+    """
+    g_kwargs = {"n_values": n_values}
+    if session.fss_threads is not None:
+        g_kwargs["n_threads"] = session.fss_threads
+
+    key = get_primitive_key(f"fss_{op}")
+    with session.primitives_lock:
+        CryptoPrimitiveProvider.generate_primitives(
+            f"fss_{op}",
+            session=session,
+            g_kwargs=g_kwargs,
+            p_kwargs={},
+        )
+        session.primitive_counts[key] = session.primitive_counts.get(key, 0) + n_values
+
+
 class FSS(metaclass=Protocol):
     """Function Secret Sharing."""
 
@@ -202,30 +661,71 @@ class FSS(metaclass=Protocol):
         self.security_type = security_type
 
     @staticmethod
-    def eq(x1: MPCTensor, x2: MPCTensor) -> MPCTensor:
+    def eq(
+        x1: MPCTensor,
+        x2: Union[MPCTensor, th.Tensor, float, int],
+        packed: bool = False,
+    ) -> Union[MPCTensor, MPCBitTensor]:
         """Equal operator.
 
         Args:
             x1 (MPCTensor): First private value.
-            x2 (MPCTensor): Second private value.
+            x2 (Union[MPCTensor, th.Tensor, float, int]): Second value.
+            packed (bool): Get the output as packed bits (see MPCBitTensor).
+                Defaults to False.
 
         Returns:
-            MPCTensor: Shares of the equality.
+            Union[MPCTensor, MPCBitTensor]: Shares of the equality.
         """
-        return fss_op(x1, x2, "eq")
+        return fss_op(x1, x2, "eq", packed)
 
     @staticmethod
-    def le(x1: MPCTensor, x2: MPCTensor) -> MPCTensor:
+    def le(
+        x1: MPCTensor,
+        x2: Union[MPCTensor, th.Tensor, float, int],
+        packed: bool = False,
+    ) -> Union[MPCTensor, MPCBitTensor]:
         """Lower equal operator.
 
         Args:
             x1 (MPCTensor): First private value.
-            x2 (MPCTensor): Second private value.
+            x2 (Union[MPCTensor, th.Tensor, float, int]): Second value.
+            packed (bool): Get the output as packed bits (see MPCBitTensor).
+                Defaults to False.
 
         Returns:
-            MPCTensor: Shares of the comparison.
+            Union[MPCTensor, MPCBitTensor]: Shares of the comparison.
+        """
+        return fss_op(x1, x2, "comp", packed)
+
+    @staticmethod
+    def generate_keys(
+        session: Session,
+        n_values: int,
+        op: str = "comp",
+        batch_size: Optional[int] = None,
+    ) -> None:
+        """Generate the keys for comparisons in advance and send them to the parties.
+
+        The comparisons consume the keys from the store, such that no key is
+        generated while doing the computation (while there are enough keys).
+
+        Args:
+            session (Session): Session used for the computation.
+            n_values (int): Number of values that will be compared.
+            op (str): Type of operation (eq or comp). Defaults to comp.
+            batch_size (Optional[int]): Maximum number of keys generated at once, to
+                limit the memory used by the generation. Defaults to None (all at once).
+
+        Raises:
+            ValueError: If the number of values is not positive.
         """
-        return fss_op(x1, x2, "comp")
+        if n_values < 1:
+            raise ValueError(f"Number of values should be positive, got {n_values}")
+
+        batch_size = batch_size or n_values
+        for start in range(0, n_values, batch_size):
+            _generate_keys(session, op, min(batch_size, n_values - start))
 
     @staticmethod
     def distribute_shares(*args: List[Any], **kwargs: Dict[str, Any]) -> Any:
@@ -261,38 +761,127 @@ class FSS(metaclass=Protocol):
 """ Register Crypto Store capabilities for FSS """
 
 
-def _ensure_fss_store(store: Dict[Any, Any]):
-    """Create an empty store for FSS if it doesn't exist already.
+class FSSKeyQueue:
+    """Keys for the FSS operations, consumed in the order in which they were added.
+
+    The keys are kept in the arrays (one row for each key) that were generated and a
+    cursor points to the first key that was not consumed from the first array. An
+    operation consumes exactly the number of keys it needs.
+
+    Attributes:
+        arrays (deque): The arrays with the keys.
+        offset (int): Number of keys that were consumed from the first array.
+    """
+
+    __slots__ = {"arrays", "offset"}
+
+    def __init__(self) -> None:
+        """Initializer."""
+        self.arrays: deque = deque()
+        self.offset = 0
+
+    def append(self, keys: np.ndarray) -> None:
+        """Add keys at the end of the queue.
+
+        Args:
+            keys (np.ndarray): The keys.
+        """
+        if len(keys):
+            self.arrays.append(keys)
+
+    def get(self, nr_instances: int, remove: bool = True) -> np.ndarray:
+        """Get the first keys from the queue.
+
+        Args:
+            nr_instances (int): Number of keys.
+            remove (bool): True if the keys should be consumed.
+
+        Returns:
+            np.ndarray: The keys (a view on the stored array if the keys are from a
+            single array).
+
+        Raises:
+            EmptyPrimitiveStore: If there are not enough keys.
+        """
+        if len(self) < nr_instances:
+            raise EmptyPrimitiveStore(
+                f"Not enough primitives for fss: {nr_instances} required, "
+                f"but only {len(self)} available"
+            )
+
+        parts = []
+        offset = self.offset
+        nr_left = nr_instances
+        for array in self.arrays:
+            if nr_left == 0:
+                break
+
+            part = array[offset : offset + nr_left]
+            parts.append(part)
+            nr_left -= len(part)
+            offset = 0
+
+        if remove:
+            nr_left = nr_instances
+            while nr_left:
+                available = len(self.arrays[0]) - self.offset
+                if available > nr_left:
+                    self.offset += nr_left
+                    break
+
+                nr_left -= available
+                self.arrays.popleft()
+                self.offset = 0
+
+        if len(parts) == 1:
+            return parts[0]
+
+        return np.concatenate(parts)
+
+    def __len__(self) -> int:
+        """Number of keys that were not consumed.
+
+        Returns:
+            int: Number of keys.
+        """
+        return sum(len(array) for array in self.arrays) - self.offset
+
+
+def _get_fss_queue(op: str, store: Dict[Any, Any]) -> FSSKeyQueue:
+    """Get the queue with the keys for an operation, it is created if needed.
 
     Args:
-        store: the main crypto store
+        op (str): The FSS primitive (fss_eq or fss_comp).
+        store (Dict[Any, Any]): The crypto store.
+
+    Returns:
+        FSSKeyQueue: The queue.
     """
-    for fss_key in ["fss_eq", "fss_comp"]:
-        if fss_key not in store.keys():
-            store[fss_key] = [[]]
+    key = get_primitive_key(op)
+    if key not in store:
+        store[key] = FSSKeyQueue()
+
+    return store[key]
 
 
-def _generate_primitive(op: str, n_values: int) -> List[Any]:
+def _generate_primitive(
+    op: str, n_values: int, n_threads: Optional[int] = None
+) -> List[Any]:
     """Generate FSS primitives.
 
     Args:
         op (str): type of operation (eq or comp)
         n_values (int): number of primitives to generate
+        n_threads (Optional[int]): number of threads used for the generation, if None
+            all the cores are used
 
     Returns:
         List[Any]: a pair of primitive keys
-
-    Raises:
-        ValueError: if the operation is not valid
     """
-    if op == "eq":
-        primitives = dpf.keygen(n_values=n_values)
-    elif op == "comp":
-        primitives = dif.keygen(n_values=n_values)
-    else:
-        raise ValueError(f"{op} is an FSS unsupported operation.")
+    factory = get_factory(op, n_threads or N_CORES)
+    primitives = factory.keygen(n_values=n_values)
 
-    return [th.tensor(p) for p in primitives]
+    return [th.tensor(p, device=CPU) for p in primitives]
 
 
 def _add_primitive(
@@ -307,51 +896,31 @@ def _add_primitive(
         store (Dict[Any,Any]): the crypto store
         primitives (Iterable[Any]): the primitives to add to the store
     """
-    _ensure_fss_store(store)
-    current_primitives = store[op]
-
-    primitives = np.array(primitives)
-
-    if len(current_primitives) == 0 or len(current_primitives[0]) == 0:
-        store[op] = [primitives]
-    else:
-        # This branch never happens with on-the-fly primitives
-        current_primitives.append(primitives)
+    _get_fss_queue(op, store).append(np.array(primitives))
 
 
 def _get_primitive(
     op: str,
-    store: Dict[Tuple[int, int], List[Any]],
+    store: Dict[Any, Any],
     nr_instances: int,
     remove: bool = True,
     **kwargs,
 ) -> Any:
-    _ensure_fss_store(store)
-    primitive_stack = store[op]
-
-    available_instances = len(primitive_stack[0]) if len(primitive_stack) > 0 else -1
-
-    if available_instances >= nr_instances:
-        primitive = primitive_stack[0][0:nr_instances]
-        if remove:
-            # We throw the whole key array away, not just the keys we used
-            del primitive_stack[0]
-        return primitive
-    else:
-        raise ValueError(
-            f"Not enough primitives for fss: {nr_instances} required, "
-            f"but only {available_instances} available"
-        )
+    return _get_fss_queue(op, store).get(nr_instances, remove=remove)
 
 
 @register_primitive_generator("fss_eq")
-def generate_primitive(n_values: int) -> List[Any]:  # noqa
-    return _generate_primitive("eq", n_values)
+def generate_primitive(  # noqa
+    n_values: int, n_threads: Optional[int] = None
+) -> List[Any]:
+    return _generate_primitive("eq", n_values, n_threads)
 
 
 @register_primitive_generator("fss_comp")
-def generate_primitive(n_values: int) -> List[Any]:  # noqa
-    return _generate_primitive("comp", n_values)
+def generate_primitive(  # noqa
+    n_values: int, n_threads: Optional[int] = None
+) -> List[Any]:
+    return _generate_primitive("comp", n_values, n_threads)
 
 
 @register_primitive_store_add("fss_eq")
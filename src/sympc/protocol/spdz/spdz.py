@@ -7,28 +7,37 @@ SPDZ mechanism used for multiplication Contains functions that are run at:
 """
 
 # stdlib
+import asyncio
 import operator
 from typing import Any
 from typing import Dict
 from typing import List
+from typing import Optional
 from typing import Tuple
 from typing import Union
 from uuid import UUID
+from uuid import uuid4
 
 # third party
 import torch
 
 from sympc.config import Config
+from sympc.session import Session
 from sympc.session import get_session
 from sympc.store import CryptoPrimitiveProvider
+from sympc.store.crypto_store import get_primitive_key
 from sympc.store.exceptions import EmptyPrimitiveStore
 from sympc.tensor import MPCTensor
 from sympc.tensor import ShareTensor
 from sympc.utils import count_wraps
 from sympc.utils import parallel_execution
+from sympc.utils import parallel_execution_async
 
 EXPECTED_OPS = {"mul", "matmul", "conv2d", "conv_transpose2d"}
 
+# Key prefix for the triples reserved by an operation (in the CryptoStore)
+RESERVED_TRIPLE = "spdz_reserved_triple"
+
 
 """ Functions that are executed at the orchestrator """
 
@@ -57,23 +66,24 @@ def mul_master(
     shape_x = tuple(x.shape)
     shape_y = tuple(y.shape)
 
-    args = [list(el) + [op_str] for el in zip(x.share_ptrs, y.share_ptrs)]
-
-    try:
-        mask = parallel_execution(spdz_mask, session.parties)(args)
-    except EmptyPrimitiveStore:
-        CryptoPrimitiveProvider.generate_primitives(
-            f"beaver_{op_str}",
-            session=session,
-            g_kwargs={
-                "a_shape": shape_x,
-                "b_shape": shape_y,
-                "nr_parties": session.nr_parties,
-                **kwargs_,
-            },
-            p_kwargs={"a_shape": shape_x, "b_shape": shape_y},
-        )
-        mask = parallel_execution(spdz_mask, session.parties)(args)
+    # Other operations might run at the same time - each party reserves the triple
+    # found at the position given to this operation, such that all the parties use
+    # the same triple (and "mul_parties" uses the reserved one)
+    op_id = uuid4().hex
+    position = _reserve_position(session, op_str, shape_x, shape_y)
+    args = [
+        list(el) + [op_str, op_id, position] for el in zip(x.share_ptrs, y.share_ptrs)
+    ]
+
+    mask_fn = parallel_execution(spdz_mask, session.parties)
+    while True:
+        try:
+            mask = mask_fn(args)
+            break
+        except EmptyPrimitiveStore:
+            # The triples were not generated in advance (the triple that is already
+            # reserved by a party is used again)
+            _generate_triples(session, op_str, shape_x, shape_y, kwargs_)
 
     eps_shares, delta_shares = zip(*mask)
 
@@ -85,7 +95,7 @@ def mul_master(
 
     # Specific arguments to each party
     args = [
-        [str(remote_session_uuid), eps_plaintext, delta_plaintext, op_str]
+        [str(remote_session_uuid), eps_plaintext, delta_plaintext, op_str, op_id]
         for remote_session_uuid in session.rank_to_uuid.values()
     ]
 
@@ -96,6 +106,125 @@ def mul_master(
     return result
 
 
+async def mul_master_async(
+    x: MPCTensor, y: MPCTensor, op_str: str, kwargs_: Dict[Any, Any]
+) -> MPCTensor:
+    """Coroutine executed by the orchestrator to multiply two secret values.
+
+    Same as :func:`mul_master`, but the communication with the parties does not
+    block the event loop - other operations can run while waiting for the parties.
+
+    Args:
+        x (MPCTensor): First value to multiply with.
+        y (MPCTensor): Second value to multiply with.
+        op_str (str): Operation string.
+        kwargs_ (dict): Keyword arguments for the operation.
+
+    Raises:
+        ValueError: If op_str not in EXPECTED_OPS.
+
+    Returns:
+        MPCTensor: Result of the multiplication.
+    """
+    if op_str not in EXPECTED_OPS:
+        raise ValueError(f"{op_str} should be in {EXPECTED_OPS}")
+
+    session = x.session
+    shape_x = tuple(x.shape)
+    shape_y = tuple(y.shape)
+
+    # Other operations might run at the same time (see mul_master)
+    op_id = uuid4().hex
+    position = _reserve_position(session, op_str, shape_x, shape_y)
+    args = [
+        list(el) + [op_str, op_id, position] for el in zip(x.share_ptrs, y.share_ptrs)
+    ]
+
+    mask_fn = parallel_execution_async(spdz_mask, session.parties)
+    while True:
+        try:
+            mask = await mask_fn(args)
+            break
+        except EmptyPrimitiveStore:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(
+                None, _generate_triples, session, op_str, shape_x, shape_y, kwargs_
+            )
+
+    eps_shares, delta_shares = zip(*mask)
+
+    eps = MPCTensor(shares=eps_shares, session=session)
+    delta = MPCTensor(shares=delta_shares, session=session)
+
+    eps_plaintext, delta_plaintext = await asyncio.gather(
+        eps.reconstruct_async(decode=False), delta.reconstruct_async(decode=False)
+    )
+
+    # Specific arguments to each party
+    args = [
+        [str(remote_session_uuid), eps_plaintext, delta_plaintext, op_str, op_id]
+        for remote_session_uuid in session.rank_to_uuid.values()
+    ]
+
+    shares = await parallel_execution_async(mul_parties, session.parties)(args, kwargs_)
+
+    result = MPCTensor(shares=shares, session=session)
+
+    return result
+
+
+def _reserve_position(
+    session: Session, op_str: str, shape_x: Tuple[int, ...], shape_y: Tuple[int, ...]
+) -> int:
+    """Give to an operation the position of its triple in the stores of the parties.
+
+    Args:
+        session (Session): Session used for the computation.
+        op_str (str): Operation string.
+        shape_x (Tuple[int, ...]): Shape of the first operand.
+        shape_y (Tuple[int, ...]): Shape of the second operand.
+
+    Returns:
+        int: The position of the triple.
+    """
+    key = get_primitive_key(f"beaver_{op_str}", shape_x, shape_y)
+    return session.reserve_position(key, 1)
+
+
+def _generate_triples(
+    session: Session,
+    op_str: str,
+    shape_x: Tuple[int, ...],
+    shape_y: Tuple[int, ...],
+    kwargs_: Dict[Any, Any],
+) -> None:
+    """Generate the beaver triples for an operation and send them to the parties.
+
+    Args:
+        session (Session): Session used for the computation.
+        op_str (str): Operation string.
+        shape_x (Tuple[int, ...]): Shape of the first operand.
+        shape_y (Tuple[int, ...]): Shape of the second operand.
+        kwargs_ (dict): Keyword arguments for the operation.
+    """
+    g_kwargs = {
+        "a_shape": shape_x,
+        "b_shape": shape_y,
+        "nr_parties": session.nr_parties,
+        **kwargs_,
+    }
+    if session.ring_size != 2 ** 64:
+        # The triples are generated in the ring of the session
+        g_kwargs["ring_size"] = session.ring_size
+
+    CryptoPrimitiveProvider.generate_primitives(
+        f"beaver_{op_str}",
+        session=session,
+        g_kwargs=g_kwargs,
+        p_kwargs={"a_shape": shape_x, "b_shape": shape_y},
+    )
+
+
 def public_divide(x: MPCTensor, y: Union[torch.Tensor, int]) -> MPCTensor:
     """Function that is executed by the orchestrator to divide a secret by a public value.
 
@@ -113,14 +242,17 @@ def public_divide(x: MPCTensor, y: Union[torch.Tensor, int]) -> MPCTensor:
         shares = [operator.truediv(share, y) for share in x.share_ptrs]
         return MPCTensor(shares=shares, session=session, shape=res_shape)
 
+    g_kwargs = {"nr_parties": session.nr_parties, "shape": res_shape}
+    if session.ring_size != 2 ** 64:
+        g_kwargs["ring_size"] = session.ring_size
+
     primitives = CryptoPrimitiveProvider.generate_primitives(
-        "beaver_wraps",
-        session=session,
-        g_kwargs={"nr_parties": session.nr_parties, "shape": res_shape},
-        p_kwargs=None,
+        "beaver_wraps", session=session, g_kwargs=g_kwargs, p_kwargs=None
     )
 
-    r_sh, theta_r_sh = list(zip(*list(zip(*primitives))[0]))
+    # Each party receives a single stacked instance - drop the instance dimension
+    r_sh = [party_primitives[0][0].squeeze(0) for party_primitives in primitives]
+    theta_r_sh = [party_primitives[0][1].squeeze(0) for party_primitives in primitives]
 
     r_mpc = MPCTensor(shares=r_sh, session=session, shape=x.shape)
 
@@ -136,11 +268,21 @@ def public_divide(x: MPCTensor, y: Union[torch.Tensor, int]) -> MPCTensor:
     args = [list(el) + common_args for el in args]
 
     theta_x = parallel_execution(div_wraps, session.parties)(args)
-    theta_x_plaintext = MPCTensor(shares=theta_x, session=session).reconstruct()
+    theta_x_plaintext = MPCTensor(shares=theta_x, session=session).reconstruct(
+        decode=False
+    )
+
+    # The correction is computed with integers (a float does not have enough precision
+    # for the ring) and it is removed from the raw share of the first party
+    correction = ShareTensor(config=Config(encoder_precision=0))
+    correction.tensor = (theta_x_plaintext * 4 * ((session.ring_size // 4) // y)).to(
+        session.tensor_type
+    )
 
-    res = x - theta_x_plaintext * 4 * ((session.ring_size // 4) // y)
+    shares = list(x.share_ptrs)
+    shares[0] = shares[0] - correction
 
-    return res
+    return MPCTensor(shares=shares, session=session, shape=res_shape)
 
 
 """ Functions that are executed at each party that holds shares """
@@ -192,7 +334,11 @@ def div_wraps(
 
 
 def spdz_mask(
-    x_sh: ShareTensor, y_sh: ShareTensor, op_str: str
+    x_sh: ShareTensor,
+    y_sh: ShareTensor,
+    op_str: str,
+    op_id: Optional[str] = None,
+    position: Optional[int] = None,
 ) -> Tuple[ShareTensor, ShareTensor]:
     """Spdz mask.
 
@@ -200,6 +346,11 @@ def spdz_mask(
         x_sh (ShareTensor): X share.
         y_sh (ShareTensor): Y share.
         op_str (str): Operator.
+        op_id (Optional[str]): If set, the triple found at the position is taken out of
+            the store and kept for the "mul_parties" call with the same id (it is used
+            again if the mask is retried). Defaults to None.
+        position (Optional[int]): Position of the triple for the operation (used with
+            op_id). Defaults to None.
 
     Returns:
         Tuple[ShareTensor, ShareTensor]
@@ -208,9 +359,28 @@ def spdz_mask(
 
     crypto_store = session.crypto_store
 
-    primitives = crypto_store.get_primitives_from_store(
-        f"beaver_{op_str}", x_sh.shape, y_sh.shape, remove=False
-    )
+    if op_id is None:
+        primitives = crypto_store.get_primitives_from_store(
+            f"beaver_{op_str}", x_sh.shape, y_sh.shape, remove=False
+        )
+    else:
+        reserved_key = (RESERVED_TRIPLE, op_id)
+        if reserved_key not in crypto_store.store:
+
+            def take(nr_instances: int) -> List[Any]:
+                return [
+                    crypto_store.get_primitives_from_store(
+                        f"beaver_{op_str}", x_sh.shape, y_sh.shape
+                    )
+                    for _ in range(nr_instances)
+                ]
+
+            key = get_primitive_key(f"beaver_{op_str}", x_sh.shape, y_sh.shape)
+            crypto_store.store[reserved_key] = crypto_store.reserve_primitives(
+                key, position, 1, take
+            )[0]
+
+        primitives = crypto_store.store[reserved_key]
 
     a_sh, b_sh, _ = primitives
 
@@ -218,7 +388,12 @@ def spdz_mask(
 
 
 def mul_parties(
-    session_uuid_str: str, eps: torch.Tensor, delta: torch.Tensor, op_str: str, **kwargs
+    session_uuid_str: str,
+    eps: torch.Tensor,
+    delta: torch.Tensor,
+    op_str: str,
+    op_id: Optional[str] = None,
+    **kwargs,
 ) -> ShareTensor:
     """SPDZ Multiplication.
 
@@ -227,6 +402,8 @@ def mul_parties(
         eps (torch:tensor): Epsilon value of the protocol.
         delta (torch.Tensor): Delta value of the protocol.
         op_str (str): Operator string.
+        op_id (Optional[str]): Id of the triple reserved by "spdz_mask". If not set,
+            the first triple from the store is used. Defaults to None.
         kwargs: Keywords arguments for the operator.
 
     Returns:
@@ -238,9 +415,12 @@ def mul_parties(
     eps_shape = tuple(eps.shape)
     delta_shape = tuple(delta.shape)
 
-    primitives = crypto_store.get_primitives_from_store(
-        f"beaver_{op_str}", eps_shape, delta_shape
-    )
+    if op_id is not None:
+        primitives = crypto_store.store.pop((RESERVED_TRIPLE, op_id))
+    else:
+        primitives = crypto_store.get_primitives_from_store(
+            f"beaver_{op_str}", eps_shape, delta_shape
+        )
 
     a_share, b_share, c_share = primitives
 
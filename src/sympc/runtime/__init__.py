@@ -0,0 +1,17 @@
+"""Runtimes in which the parties run without syft."""
+
+from .local import LocalParty
+from .local import LocalPointer
+from .process import ProcessParty
+from .process import ProcessPointer
+from .process import close_parties
+from .process import launch_parties
+
+__all__ = [
+    "LocalParty",
+    "LocalPointer",
+    "ProcessParty",
+    "ProcessPointer",
+    "launch_parties",
+    "close_parties",
+]
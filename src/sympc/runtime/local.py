@@ -0,0 +1,412 @@
+"""Parties that run in the same process as the orchestrator, without syft.
+
+With the syft VirtualMachines each command goes through the syft pointers, the
+serialization and the AST checks (see :mod:`sympc.api`) - for small tensors this
+costs more than the computation itself. A :class:`LocalParty` holds the objects
+that were sent to it and runs the functions directly on them, such that only the
+cost of the protocols is measured.
+
+A LocalParty can be used instead of a syft client::
+
+    session = Session(parties=[LocalParty(f"P_{i}") for i in range(2)])
+    SessionManager.setup_mpc(session)
+
+The objects are not serialized (neither copied) when they are sent to a party or
+used as arguments - the parties should not modify the objects they did not create.
+"""
+
+# stdlib
+from copy import deepcopy
+import inspect
+from types import ModuleType
+from types import SimpleNamespace
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import Optional
+from uuid import UUID
+from uuid import uuid4
+
+# third party
+import torch
+
+import sympc
+from sympc.session import Session
+from sympc.session import set_session
+
+# Types from "syft.lib.python" that might be created at the parties
+PYTHON_TYPES = SimpleNamespace(
+    Bool=bool,
+    Dict=dict,
+    Float=float,
+    Int=int,
+    List=list,
+    String=str,
+    Tuple=tuple,
+)
+
+# The operators are looked up on the type, such that they are forwarded explicitly
+FORWARDED_OPERATORS = [
+    "__add__",
+    "__radd__",
+    "__sub__",
+    "__rsub__",
+    "__mul__",
+    "__rmul__",
+    "__matmul__",
+    "__rmatmul__",
+    "__truediv__",
+    "__rtruediv__",
+    "__floordiv__",
+    "__mod__",
+    "__pow__",
+    "__neg__",
+    "__xor__",
+    "__and__",
+    "__or__",
+    "__lt__",
+    "__le__",
+    "__gt__",
+    "__ge__",
+    "__getitem__",
+    "__setitem__",
+]
+
+
+def receive_session(session: Session) -> None:
+    """Set up a session received by a party, like when it is deserialized by syft.
+
+    The session gets its own CryptoStore and it is registered such that the party
+    functions can get it.
+
+    Args:
+        session (Session): The session.
+    """
+    from sympc.store import CryptoStore
+
+    session.crypto_store = CryptoStore()
+    set_session(session)
+
+
+class LocalPointer:
+    """Pointer to an object held by a :class:`LocalParty`.
+
+    It has the same interface as the syft pointers that are used by SyMPC - the
+    methods and the attributes of the object are accessed through the pointer and
+    the results are kept by the party.
+
+    Attributes:
+        client (LocalParty): The party that holds the object.
+        id_at_location (UUID): Identifies the object.
+    """
+
+    __slots__ = {"client", "id_at_location", "_obj"}
+
+    def __init__(self, client: "LocalParty", obj: Any) -> None:
+        """Initializer.
+
+        Args:
+            client (LocalParty): The party that holds the object.
+            obj (Any): The object.
+        """
+        self.client = client
+        self.id_at_location: UUID = uuid4()
+        self._obj = obj
+
+    @property
+    def __name__(self) -> str:
+        """Name of the pointer (like for the syft pointers).
+
+        Returns:
+            str: The name of the type of the object followed by "Pointer".
+        """
+        return f"{type(self._obj).__name__}Pointer"
+
+    def get(self, *args: Any, **kwargs: Any) -> Any:
+        """Get the object.
+
+        Args:
+            *args (Any): Ignored (used by the syft pointers).
+            **kwargs (Any): Ignored (used by the syft pointers).
+
+        Returns:
+            Any: The object.
+        """
+        return self._obj
+
+    def get_copy(self, *args: Any, **kwargs: Any) -> Any:
+        """Get a copy of the object, the party keeps using the object.
+
+        Args:
+            *args (Any): Ignored (used by the syft pointers).
+            **kwargs (Any): Ignored (used by the syft pointers).
+
+        Returns:
+            Any: The copy of the object.
+        """
+        return deepcopy(self._obj)
+
+    def request(self, *args: Any, **kwargs: Any) -> None:
+        """Request access to the object, it is always granted.
+
+        Args:
+            *args (Any): Ignored (used by the syft pointers).
+            **kwargs (Any): Ignored (used by the syft pointers).
+        """
+
+    def resolve_pointer_type(self) -> "LocalPointer":
+        """Resolve the type of the pointer, it is always known.
+
+        Returns:
+            LocalPointer: The pointer.
+        """
+        return self
+
+    def __getattr__(self, name: str) -> Any:
+        """Access an attribute (or a method) of the object.
+
+        Args:
+            name (str): Name of the attribute.
+
+        Returns:
+            Any: A pointer to the attribute or a function that runs the method at
+            the party.
+
+        Raises:
+            AttributeError: For the special attributes (they are not forwarded).
+        """
+        if name.startswith("__"):
+            raise AttributeError(name)
+
+        attr = getattr(self._obj, name)
+        if callable(attr):
+            return self.client.wrap_function(attr)
+
+        return LocalPointer(self.client, attr)
+
+    def __iter__(self) -> Iterator["LocalPointer"]:
+        """Iterate over the items of the object.
+
+        Returns:
+            Iterator[LocalPointer]: Pointers to the items.
+        """
+        return (LocalPointer(self.client, item) for item in self._obj)
+
+    def __len__(self) -> int:
+        """Length of the object.
+
+        Returns:
+            int: The length.
+        """
+        return len(self._obj)
+
+    def __repr__(self) -> str:
+        """Representation.
+
+        Returns:
+            str: The name of the pointer and of the party.
+        """
+        return f"<{self.__name__} -> {self.client.name}:{self.id_at_location}>"
+
+
+def _forward_operator(name: str) -> Callable[..., Any]:
+    """Create a method that applies an operator on the object held by the party.
+
+    Args:
+        name (str): Name of the operator.
+
+    Returns:
+        Callable[..., Any]: The method.
+    """
+
+    def method(self: LocalPointer, *args: Any) -> Any:
+        return self.client.wrap_function(getattr(self._obj, name))(*args)
+
+    method.__name__ = name
+    return method
+
+
+for _name in FORWARDED_OPERATORS:
+    setattr(LocalPointer, _name, _forward_operator(_name))
+
+
+class _LocalAttribute:
+    """Module, class or object accessed through a :class:`LocalParty`.
+
+    It mirrors the syft AST - for example "party.sympc.tensor.ShareTensor" resolves
+    to the class and calling it creates the object at the party.
+    """
+
+    __slots__ = {"_party", "_target"}
+
+    def __init__(self, party: "LocalParty", target: Any) -> None:
+        """Initializer.
+
+        Args:
+            party (LocalParty): The party.
+            target (Any): The module, class or object.
+        """
+        self._party = party
+        self._target = target
+
+    def __getattr__(self, name: str) -> Any:
+        """Access an attribute of the target.
+
+        Args:
+            name (str): Name of the attribute.
+
+        Returns:
+            Any: The attribute (a function that runs at the party for the callables
+            that are not modules or classes).
+
+        Raises:
+            AttributeError: For the special attributes (they are not forwarded).
+        """
+        if name.startswith("__"):
+            raise AttributeError(name)
+
+        attr = getattr(self._target, name)
+        if isinstance(attr, (ModuleType, SimpleNamespace)) or inspect.isclass(attr):
+            return _LocalAttribute(self._party, attr)
+
+        if callable(attr):
+            return self._party.wrap_function(attr)
+
+        return attr
+
+    def __call__(self, *args: Any, **kwargs: Any) -> LocalPointer:
+        """Call the target at the party (for example to create an object).
+
+        Args:
+            *args (Any): Args.
+            **kwargs (Any): Kwargs.
+
+        Returns:
+            LocalPointer: Pointer to the result.
+        """
+        return self._party.wrap_function(self._target)(*args, **kwargs)
+
+
+class LocalParty:
+    """A party that runs in the same process as the orchestrator.
+
+    The functions that are run with "parallel_execution" are resolved like for the
+    syft clients (by their module and their name) and are called directly on the
+    objects held by the party.
+
+    Attributes:
+        name (str): Name of the party.
+        class_name (str): Name of the type of the party (like for the syft clients).
+        sessions (Dict[UUID, Session]): The sessions that were sent to the party.
+    """
+
+    __slots__ = {"name", "sessions"}
+
+    class_name = "LocalParty"
+
+    def __init__(self, name: Optional[str] = None) -> None:
+        """Initializer.
+
+        Args:
+            name (Optional[str]): Name of the party. Defaults to a random name.
+        """
+        self.name = name if name is not None else f"local_{uuid4().hex[:8]}"
+        self.sessions: Dict[UUID, Session] = {}
+
+    @property
+    def sympc(self) -> _LocalAttribute:
+        """Access the SyMPC package at the party.
+
+        Returns:
+            _LocalAttribute: The package.
+        """
+        return _LocalAttribute(self, sympc)
+
+    @property
+    def torch(self) -> _LocalAttribute:
+        """Access the torch package at the party.
+
+        Returns:
+            _LocalAttribute: The package.
+        """
+        return _LocalAttribute(self, torch)
+
+    @property
+    def python(self) -> _LocalAttribute:
+        """Access the python types at the party (like "syft.lib.python").
+
+        Returns:
+            _LocalAttribute: The types.
+        """
+        return _LocalAttribute(self, PYTHON_TYPES)
+
+    def receive_object(self, obj: Any) -> LocalPointer:
+        """Receive an object from the orchestrator.
+
+        A session is set up like when it is deserialized by syft (see
+        :func:`receive_session`).
+
+        Args:
+            obj (Any): The object (it is not copied).
+
+        Returns:
+            LocalPointer: Pointer to the object.
+        """
+        if isinstance(obj, Session):
+            receive_session(obj)
+            self.sessions[obj.uuid] = obj
+
+        return LocalPointer(self, obj)
+
+    def _unwrap(self, obj: Any) -> Any:
+        """Replace the pointers (to objects held by the party) with the objects.
+
+        Args:
+            obj (Any): An argument.
+
+        Returns:
+            Any: The argument without pointers.
+
+        Raises:
+            ValueError: If a pointer is to an object held by another party.
+        """
+        if isinstance(obj, LocalPointer):
+            if obj.client is not self:
+                raise ValueError(
+                    f"{self.name} can not use an object held by {obj.client.name}"
+                )
+            return obj._obj
+
+        if type(obj) in {list, tuple}:
+            return type(obj)(self._unwrap(el) for el in obj)
+
+        if type(obj) is dict:
+            return {key: self._unwrap(value) for key, value in obj.items()}
+
+        return obj
+
+    def wrap_function(self, func: Callable[..., Any]) -> Callable[..., LocalPointer]:
+        """Wrap a function such that it is run on the objects held by the party.
+
+        Args:
+            func (Callable[..., Any]): The function.
+
+        Returns:
+            Callable[..., LocalPointer]: A function that returns a pointer to the
+            result.
+        """
+
+        def wrapper(*args: Any, **kwargs: Any) -> LocalPointer:
+            res = func(*self._unwrap(args), **self._unwrap(kwargs))
+            return LocalPointer(self, res)
+
+        return wrapper
+
+    def __repr__(self) -> str:
+        """Representation.
+
+        Returns:
+            str: The name of the party.
+        """
+        return f"<{type(self).__name__}: {self.name}>"
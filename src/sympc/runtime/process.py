@@ -0,0 +1,880 @@
+"""Parties that run in their own processes and talk with the orchestrator by sockets.
+
+This is how the parties run in a deployment - each command and each object goes
+through the serialization and the socket, such that the benchmarks measure the real
+serialization time, the latency and the bandwidth. The parties can be connected
+over TCP (on localhost) or over Unix sockets::
+
+    parties = launch_parties(3, family="AF_UNIX")
+    session = Session(parties=parties)
+    SessionManager.setup_mpc(session)
+    ...
+    close_parties(parties)
+
+Each party (a worker process) has its own sessions and CryptoStores. The objects are
+serialized with pickle, the connections are authenticated with a random key (only
+the processes started by the orchestrator can connect).
+
+The parties can not send values directly to each other, the sessions should not use
+a channel (the shares can be moved with the "shared_memory" transport).
+"""
+
+# stdlib
+from importlib import import_module
+import multiprocessing
+from multiprocessing.connection import Client
+from multiprocessing.connection import Connection
+from multiprocessing.connection import Listener
+import os
+import pickle  # nosec
+import threading
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+from uuid import UUID
+from uuid import uuid4
+
+from sympc.runtime.local import FORWARDED_OPERATORS
+from sympc.runtime.local import PYTHON_TYPES
+from sympc.runtime.local import receive_session
+from sympc.session import Session
+
+# Time (in seconds) to wait for a worker to start
+DEFAULT_START_TIMEOUT = 120.0
+
+# A path to an object held by a worker: the id of the object followed by the
+# attributes ("attr", name) and the items ("item", key) that are accessed
+Path = Tuple[Tuple[str, Any], ...]
+
+
+class _Ref:
+    """Reference to an object held by a worker (used in the messages)."""
+
+    __slots__ = {"obj_id", "path"}
+
+    def __init__(self, obj_id: UUID, path: Path) -> None:
+        """Initializer.
+
+        Args:
+            obj_id (UUID): Identifies the object.
+            path (Path): The attributes and the items that are accessed.
+        """
+        self.obj_id = obj_id
+        self.path = path
+
+    def __getstate__(self) -> Tuple[UUID, Path]:
+        """Get the state that is pickled.
+
+        Returns:
+            Tuple[UUID, Path]: The id and the path.
+        """
+        return self.obj_id, self.path
+
+    def __setstate__(self, state: Tuple[UUID, Path]) -> None:
+        """Set the state that was pickled.
+
+        Args:
+            state (Tuple[UUID, Path]): The id and the path.
+        """
+        self.obj_id, self.path = state
+
+
+def _session_state(session: Session) -> Dict[str, Any]:
+    """Get the fields of a session that are sent to a party.
+
+    The same fields are sent by the syft serialization, the others are used only by
+    the orchestrator.
+
+    Args:
+        session (Session): The session.
+
+    Returns:
+        Dict[str, Any]: The fields.
+    """
+    return {
+        "uuid": session.uuid,
+        "rank": session.rank,
+        "nr_parties": session.nr_parties,
+        "ring_size": session.ring_size,
+        "config": session.config,
+        "protocol": session.protocol,
+    }
+
+
+def _session_from_state(state: Dict[str, Any]) -> Session:
+    """Create the session received by a party.
+
+    Args:
+        state (Dict[str, Any]): The fields from :func:`_session_state`.
+
+    Returns:
+        Session: The session.
+    """
+    session = Session(
+        config=state["config"],
+        ring_size=state["ring_size"],
+        protocol=state["protocol"],
+    )
+    session.uuid = state["uuid"]
+    session.rank = state["rank"]
+    session.nr_parties = state["nr_parties"]
+    receive_session(session)
+    return session
+
+
+class _Worker:
+    """Runs the commands received from the orchestrator.
+
+    Attributes:
+        objects (Dict[UUID, Any]): The objects held by the party.
+    """
+
+    __slots__ = {"objects"}
+
+    def __init__(self) -> None:
+        """Initializer."""
+        self.objects: Dict[UUID, Any] = {}
+
+    def _resolve(self, ref: _Ref) -> Any:
+        """Get the object for a reference.
+
+        Args:
+            ref (_Ref): The reference.
+
+        Returns:
+            Any: The object.
+        """
+        obj = self.objects[ref.obj_id]
+        for kind, key in ref.path:
+            obj = getattr(obj, key) if kind == "attr" else obj[key]
+
+        return obj
+
+    def _resolve_args(self, obj: Any) -> Any:
+        """Replace the references with the objects.
+
+        Args:
+            obj (Any): An argument.
+
+        Returns:
+            Any: The argument without references.
+        """
+        if isinstance(obj, _Ref):
+            return self._resolve(obj)
+
+        if type(obj) in {list, tuple}:
+            return type(obj)(self._resolve_args(el) for el in obj)
+
+        if type(obj) is dict:
+            return {key: self._resolve_args(value) for key, value in obj.items()}
+
+        return obj
+
+    @staticmethod
+    def _resolve_function(name: str) -> Any:
+        """Get a function (or a class) by its module and its name.
+
+        Args:
+            name (str): Like "sympc.protocol.fss.fss.mask_builder".
+
+        Returns:
+            Any: The function.
+        """
+        parts = name.split(".")
+        if parts[0] == "python":
+            return getattr(PYTHON_TYPES, parts[1])
+
+        target = import_module(parts[0])
+        for i, part in enumerate(parts[1:], start=1):
+            # The submodules that are not imported by their package
+            if not hasattr(target, part):
+                import_module(".".join(parts[: i + 1]))
+            target = getattr(target, part)
+
+        return target
+
+    def _store(self, obj: Any) -> Tuple[UUID, str]:
+        """Keep an object.
+
+        Args:
+            obj (Any): The object.
+
+        Returns:
+            Tuple[UUID, str]: The id of the object and the name of its type.
+        """
+        obj_id = uuid4()
+        self.objects[obj_id] = obj
+        return obj_id, type(obj).__name__
+
+    def handle(self, command: str, *args: Any) -> Any:
+        """Run a command.
+
+        Args:
+            command (str): The command.
+            *args (Any): Args of the command.
+
+        Returns:
+            Any: The result that is sent back.
+
+        Raises:
+            ValueError: If the command is not known.
+        """
+        if command == "store":
+            (obj,) = args
+            return self._store(obj)
+
+        if command == "session":
+            (state,) = args
+            return self._store(_session_from_state(state))
+
+        if command == "call":
+            target, call_args, call_kwargs = args
+            if isinstance(target, _Ref):
+                func = self._resolve(target)
+            else:
+                func = self._resolve_function(target)
+
+            call_args = self._resolve_args(call_args)
+            call_kwargs = self._resolve_args(call_kwargs)
+            return self._store(func(*call_args, **call_kwargs))
+
+        if command == "get":
+            (ref,) = args
+            return self._resolve(ref)
+
+        if command == "type":
+            (ref,) = args
+            return type(self._resolve(ref)).__name__
+
+        if command == "len":
+            (ref,) = args
+            return len(self._resolve(ref))
+
+        raise ValueError(f"Unknown command {command}")
+
+    def release(self, obj_ids: List[UUID]) -> None:
+        """Remove the objects that are not used anymore by the orchestrator.
+
+        Args:
+            obj_ids (List[UUID]): The ids of the objects.
+        """
+        for obj_id in obj_ids:
+            self.objects.pop(obj_id, None)
+
+
+def _serve(conn: Connection) -> None:
+    """Run the commands received on a connection until it is closed.
+
+    Args:
+        conn (Connection): Connection with the orchestrator.
+    """
+    worker = _Worker()
+
+    while True:
+        try:
+            message = conn.recv_bytes()
+        except EOFError:
+            return
+
+        released, command, args = pickle.loads(message)  # nosec
+        worker.release(released)
+
+        if command == "close":
+            conn.send_bytes(pickle.dumps((True, None)))
+            return
+
+        try:
+            reply = (True, worker.handle(command, *args))
+        except Exception as e:
+            reply = (False, e)
+
+        try:
+            data = pickle.dumps(reply, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            data = pickle.dumps((False, RuntimeError(f"{type(e).__name__}: {e}")))
+
+        conn.send_bytes(data)
+
+
+def run_worker(family: str, authkey: bytes, ready: Connection) -> None:
+    """Entry point of a party process.
+
+    The worker listens on a new address, sends it to the orchestrator and serves
+    the first connection it gets.
+
+    Args:
+        family (str): "AF_INET" (TCP on localhost) or "AF_UNIX".
+        authkey (bytes): Key used to authenticate the orchestrator.
+        ready (Connection): Pipe used to send the address to the orchestrator.
+    """
+    address = ("127.0.0.1", 0) if family == "AF_INET" else None
+    with Listener(address=address, family=family, authkey=authkey) as listener:
+        ready.send(listener.address)
+        ready.close()
+        conn = listener.accept()
+
+    with conn:
+        _serve(conn)
+
+
+class ProcessPointer:
+    """Pointer to an object held by a :class:`ProcessParty`.
+
+    It has the same interface as the syft pointers that are used by SyMPC. The
+    attributes are resolved at the party only when they are used - calling a method
+    needs a single message.
+
+    Attributes:
+        client (ProcessParty): The party that holds the object.
+        id_at_location (UUID): Identifies the object.
+    """
+
+    __slots__ = {"client", "id_at_location", "_path", "_base", "_type_name"}
+
+    def __init__(
+        self,
+        client: "ProcessParty",
+        id_at_location: UUID,
+        type_name: Optional[str] = None,
+        path: Path = (),
+        base: Optional["ProcessPointer"] = None,
+    ) -> None:
+        """Initializer.
+
+        Args:
+            client (ProcessParty): The party that holds the object.
+            id_at_location (UUID): Identifies the object.
+            type_name (Optional[str]): The name of the type of the object (asked to
+                the party when it is needed if None). Defaults to None.
+            path (Path): The attributes and the items that are accessed. Defaults
+                to ().
+            base (Optional[ProcessPointer]): The pointer from which this one is
+                derived (the object is released when the base is not used anymore).
+                Defaults to None.
+        """
+        self.client = client
+        self.id_at_location = id_at_location
+        self._type_name = type_name
+        self._path = path
+        self._base = base
+
+    def _ref(self) -> _Ref:
+        """Get the reference used in the messages.
+
+        Returns:
+            _Ref: The reference.
+        """
+        return _Ref(self.id_at_location, self._path)
+
+    def _derive(self, kind: str, key: Any) -> "ProcessPointer":
+        """Get a pointer to an attribute or an item of the object.
+
+        Args:
+            kind (str): "attr" or "item".
+            key (Any): Name of the attribute or key of the item.
+
+        Returns:
+            ProcessPointer: The pointer.
+        """
+        base = self._base if self._base is not None else self
+        return ProcessPointer(
+            self.client,
+            self.id_at_location,
+            path=self._path + ((kind, key),),
+            base=base,
+        )
+
+    @property
+    def __name__(self) -> str:
+        """Name of the pointer (like for the syft pointers).
+
+        Returns:
+            str: The name of the type of the object followed by "Pointer".
+        """
+        if self._type_name is None:
+            self._type_name = self.client.send_command("type", self._ref())
+
+        return f"{self._type_name}Pointer"
+
+    def get(self, *args: Any, **kwargs: Any) -> Any:
+        """Get the object from the party.
+
+        Args:
+            *args (Any): Ignored (used by the syft pointers).
+            **kwargs (Any): Ignored (used by the syft pointers).
+
+        Returns:
+            Any: The object.
+        """
+        return self.client.send_command("get", self._ref())
+
+    def get_copy(self, *args: Any, **kwargs: Any) -> Any:
+        """Get the object from the party, the party keeps using the object.
+
+        Args:
+            *args (Any): Ignored (used by the syft pointers).
+            **kwargs (Any): Ignored (used by the syft pointers).
+
+        Returns:
+            Any: The object.
+        """
+        return self.get()
+
+    def request(self, *args: Any, **kwargs: Any) -> None:
+        """Request access to the object, it is always granted.
+
+        Args:
+            *args (Any): Ignored (used by the syft pointers).
+            **kwargs (Any): Ignored (used by the syft pointers).
+        """
+
+    def resolve_pointer_type(self) -> "ProcessPointer":
+        """Resolve the type of the pointer, it is asked when it is needed.
+
+        Returns:
+            ProcessPointer: The pointer.
+        """
+        return self
+
+    def __getattr__(self, name: str) -> "ProcessPointer":
+        """Access an attribute (or a method) of the object.
+
+        Args:
+            name (str): Name of the attribute.
+
+        Returns:
+            ProcessPointer: A pointer to the attribute (it can be called).
+
+        Raises:
+            AttributeError: For the special attributes (they are not forwarded).
+        """
+        if name.startswith("__"):
+            raise AttributeError(name)
+
+        return self._derive("attr", name)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> "ProcessPointer":
+        """Call the object at the party.
+
+        Args:
+            *args (Any): Args.
+            **kwargs (Any): Kwargs.
+
+        Returns:
+            ProcessPointer: Pointer to the result.
+        """
+        return self.client.call(self._ref(), args, kwargs)
+
+    def __iter__(self) -> Iterator["ProcessPointer"]:
+        """Iterate over the items of the object.
+
+        Returns:
+            Iterator[ProcessPointer]: Pointers to the items.
+        """
+        return iter([self._derive("item", i) for i in range(len(self))])
+
+    def __len__(self) -> int:
+        """Length of the object.
+
+        Returns:
+            int: The length.
+        """
+        return self.client.send_command("len", self._ref())
+
+    def __del__(self) -> None:
+        """Release the object at the party (with the next message)."""
+        # The pointer might not be fully initialized
+        client = getattr(self, "client", None)
+        if client is not None and getattr(self, "_base", True) is None:
+            client.release(self.id_at_location)
+
+    def __repr__(self) -> str:
+        """Representation.
+
+        Returns:
+            str: The party and the id of the object.
+        """
+        return f"<ProcessPointer -> {self.client.name}:{self.id_at_location}>"
+
+
+def _forward_operator(name: str) -> Any:
+    """Create a method that applies an operator on the object held by the party.
+
+    Args:
+        name (str): Name of the operator.
+
+    Returns:
+        Any: The method.
+    """
+
+    def method(self: ProcessPointer, *args: Any) -> ProcessPointer:
+        return self._derive("attr", name)(*args)
+
+    method.__name__ = name
+    return method
+
+
+for _name in FORWARDED_OPERATORS:
+    setattr(ProcessPointer, _name, _forward_operator(_name))
+
+
+class _RemoteAttribute:
+    """Module, class or function accessed through a :class:`ProcessParty`.
+
+    It mirrors the syft AST - for example "party.sympc.tensor.ShareTensor" is
+    resolved by the party when it is called.
+    """
+
+    __slots__ = {"_party", "_name"}
+
+    def __init__(self, party: "ProcessParty", name: str) -> None:
+        """Initializer.
+
+        Args:
+            party (ProcessParty): The party.
+            name (str): The path of the attribute (like "sympc.tensor").
+        """
+        self._party = party
+        self._name = name
+
+    def __getattr__(self, name: str) -> "_RemoteAttribute":
+        """Access an attribute.
+
+        Args:
+            name (str): Name of the attribute.
+
+        Returns:
+            _RemoteAttribute: The attribute.
+
+        Raises:
+            AttributeError: For the special attributes (they are not forwarded).
+        """
+        if name.startswith("__"):
+            raise AttributeError(name)
+
+        return _RemoteAttribute(self._party, f"{self._name}.{name}")
+
+    def __call__(self, *args: Any, **kwargs: Any) -> ProcessPointer:
+        """Call the function at the party.
+
+        Args:
+            *args (Any): Args.
+            **kwargs (Any): Kwargs.
+
+        Returns:
+            ProcessPointer: Pointer to the result.
+        """
+        return self._party.call(self._name, args, kwargs)
+
+
+class ProcessParty:
+    """A party that runs in its own process.
+
+    The functions that are run with "parallel_execution" are resolved like for the
+    syft clients (by their module and their name), the party runs them and keeps the
+    results. A party can be used by multiple threads, the messages are sent one at
+    a time.
+
+    Attributes:
+        name (str): Name of the party.
+        class_name (str): Name of the type of the party (like for the syft clients).
+        family (str): "AF_INET" (TCP on localhost) or "AF_UNIX".
+        process (multiprocessing.Process): The process of the party.
+        bytes_sent (int): Number of bytes sent to the party.
+        bytes_received (int): Number of bytes received from the party.
+        messages (int): Number of messages (each one has a reply).
+    """
+
+    __slots__ = {
+        "name",
+        "family",
+        "process",
+        "bytes_sent",
+        "bytes_received",
+        "messages",
+        "_conn",
+        "_lock",
+        "_released",
+    }
+
+    class_name = "ProcessParty"
+
+    def __init__(
+        self,
+        name: Optional[str] = None,
+        family: str = "AF_INET",
+        timeout: float = DEFAULT_START_TIMEOUT,
+    ) -> None:
+        """Start the process of the party and connect to it.
+
+        Args:
+            name (Optional[str]): Name of the party. Defaults to a random name.
+            family (str): "AF_INET" (TCP on localhost) or "AF_UNIX". Defaults to
+                "AF_INET".
+            timeout (float): Time (in seconds) to wait for the process to start.
+
+        Raises:
+            ValueError: If the family is not supported.
+            TimeoutError: If the process did not start in time.
+        """
+        if family not in {"AF_INET", "AF_UNIX"}:
+            raise ValueError(f"Family {family} not supported")
+
+        self.name = name if name is not None else f"process_{uuid4().hex[:8]}"
+        self.family = family
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.messages = 0
+        self._lock = threading.Lock()
+        self._released: List[UUID] = []
+
+        authkey = os.urandom(32)
+        context = multiprocessing.get_context("spawn")
+        ready_recv, ready_send = context.Pipe(duplex=False)
+        self.process = context.Process(
+            target=run_worker,
+            args=(family, authkey, ready_send),
+            name=self.name,
+            daemon=True,
+        )
+        self.process.start()
+        ready_send.close()
+
+        if not ready_recv.poll(timeout):
+            self.process.kill()
+            raise TimeoutError(f"Party {self.name} did not start in {timeout}s")
+
+        address = ready_recv.recv()
+        ready_recv.close()
+        self._conn = Client(address, family=family, authkey=authkey)
+
+    @property
+    def sympc(self) -> _RemoteAttribute:
+        """Access the SyMPC package at the party.
+
+        Returns:
+            _RemoteAttribute: The package.
+        """
+        return _RemoteAttribute(self, "sympc")
+
+    @property
+    def torch(self) -> _RemoteAttribute:
+        """Access the torch package at the party.
+
+        Returns:
+            _RemoteAttribute: The package.
+        """
+        return _RemoteAttribute(self, "torch")
+
+    @property
+    def python(self) -> _RemoteAttribute:
+        """Access the python types at the party (like "syft.lib.python").
+
+        Returns:
+            _RemoteAttribute: The types.
+        """
+        return _RemoteAttribute(self, "python")
+
+    def send_command(self, command: str, *args: Any) -> Any:
+        """Send a command to the party and wait for the reply.
+
+        Args:
+            command (str): The command.
+            *args (Any): Args of the command.
+
+        Returns:
+            Any: The reply.
+
+        Raises:
+            res: The exception raised by the party (if any).
+        """
+        with self._lock:
+            released, self._released = self._released, []
+            data = pickle.dumps(
+                (released, command, args), protocol=pickle.HIGHEST_PROTOCOL
+            )
+            self._conn.send_bytes(data)
+            reply = self._conn.recv_bytes()
+
+            self.bytes_sent += len(data)
+            self.bytes_received += len(reply)
+            self.messages += 1
+
+        ok, res = pickle.loads(reply)  # nosec
+        if not ok:
+            raise res
+
+        return res
+
+    def _unwrap(self, obj: Any) -> Any:
+        """Replace the pointers (to objects held by the party) with references.
+
+        Args:
+            obj (Any): An argument.
+
+        Returns:
+            Any: The argument that can be sent.
+
+        Raises:
+            ValueError: If a pointer is to an object held by another party.
+        """
+        if isinstance(obj, ProcessPointer):
+            if obj.client is not self:
+                raise ValueError(
+                    f"{self.name} can not use an object held by {obj.client.name}"
+                )
+            return obj._ref()
+
+        if type(obj) in {list, tuple}:
+            return type(obj)(self._unwrap(el) for el in obj)
+
+        if type(obj) is dict:
+            return {key: self._unwrap(value) for key, value in obj.items()}
+
+        return obj
+
+    def call(
+        self, target: Any, args: Tuple[Any, ...], kwargs: Dict[str, Any]
+    ) -> ProcessPointer:
+        """Call a function (by its name) or an object held by the party.
+
+        Args:
+            target (Any): The name of the function or the reference to the object.
+            args (Tuple[Any, ...]): Args.
+            kwargs (Dict[str, Any]): Kwargs.
+
+        Returns:
+            ProcessPointer: Pointer to the result.
+        """
+        obj_id, type_name = self.send_command(
+            "call", target, self._unwrap(args), self._unwrap(kwargs)
+        )
+        return ProcessPointer(self, obj_id, type_name)
+
+    def receive_object(self, obj: Any) -> ProcessPointer:
+        """Send an object to the party.
+
+        A session is set up like when it is deserialized by syft (see
+        :func:`sympc.runtime.local.receive_session`).
+
+        Args:
+            obj (Any): The object.
+
+        Returns:
+            ProcessPointer: Pointer to the object.
+        """
+        if isinstance(obj, Session):
+            obj_id, type_name = self.send_command("session", _session_state(obj))
+        else:
+            obj_id, type_name = self.send_command("store", obj)
+
+        return ProcessPointer(self, obj_id, type_name)
+
+    def release(self, obj_id: UUID) -> None:
+        """Release an object, the party is notified with the next message.
+
+        Args:
+            obj_id (UUID): Identifies the object.
+        """
+        self._released.append(obj_id)
+
+    def traffic(self) -> Dict[str, int]:
+        """Get the traffic with the party.
+
+        Returns:
+            Dict[str, int]: The bytes sent, the bytes received and the messages.
+        """
+        return {
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "messages": self.messages,
+        }
+
+    def reset_traffic(self) -> None:
+        """Reset the traffic counters."""
+        with self._lock:
+            self.bytes_sent = 0
+            self.bytes_received = 0
+            self.messages = 0
+
+    def close(self) -> None:
+        """Stop the process of the party."""
+        if self._conn.closed:
+            return
+
+        try:
+            self.send_command("close")
+        except (EOFError, OSError):
+            pass
+
+        self._conn.close()
+        self.process.join(timeout=10)
+        if self.process.is_alive():
+            self.process.kill()
+
+    def __enter__(self) -> "ProcessParty":
+        """Use the party as a context manager (it is closed at the end).
+
+        Returns:
+            ProcessParty: The party.
+        """
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Close the party.
+
+        Args:
+            *args (Any): The exception (if any).
+        """
+        self.close()
+
+    def __repr__(self) -> str:
+        """Representation.
+
+        Returns:
+            str: The name of the party.
+        """
+        return f"<{type(self).__name__}: {self.name}>"
+
+
+def launch_parties(
+    nr_parties: int,
+    family: str = "AF_INET",
+    timeout: float = DEFAULT_START_TIMEOUT,
+) -> List[ProcessParty]:
+    """Start the processes for multiple parties.
+
+    Args:
+        nr_parties (int): Number of parties.
+        family (str): "AF_INET" (TCP on localhost) or "AF_UNIX". Defaults to
+            "AF_INET".
+        timeout (float): Time (in seconds) to wait for each process to start.
+
+    Returns:
+        List[ProcessParty]: The parties.
+
+    Raises:
+        Exception: If a process fails to start (the started ones are stopped).
+    """
+    parties = []
+    try:
+        for i in range(nr_parties):
+            parties.append(ProcessParty(f"P_{i}", family=family, timeout=timeout))
+    except Exception:
+        close_parties(parties)
+        raise
+
+    return parties
+
+
+def close_parties(parties: List[ProcessParty]) -> None:
+    """Stop the processes of the parties.
+
+    Args:
+        parties (List[ProcessParty]): The parties.
+    """
+    for party in parties:
+        party.close()
@@ -12,10 +12,14 @@ Example:
 
 
 # stdlib
+from concurrent.futures import Executor
+from contextlib import contextmanager
 from copy import deepcopy
 import operator
+import threading
 from typing import Any
 from typing import Dict
+from typing import Iterator
 from typing import List
 from typing import Optional
 from typing import Union
@@ -27,10 +31,16 @@ import torch
 
 from sympc.config import Config
 from sympc.protocol.protocol import Protocol
+from sympc.utils import CommunicationStats
 from sympc.utils import generate_random_element
 from sympc.utils import get_new_generator
 from sympc.utils import get_type_from_ring
 
+# Default encoder precision for the rings that are too small for the default Config.
+# A product of two fixed point values is computed before it is truncated, the ring
+# should keep twice the number of fractional bits
+RING_SIZE_TO_PRECISION = {2 ** 32: 8}
+
 
 class Session:
     """Class used to keep information about computation done in SMPC.
@@ -59,6 +69,32 @@ class Session:
         max_value (int): the maximum value allowed for tensors' values
         tensor_type (Union[torch.dtype): tensor type used in the computation, this is used
             such that we get the "modulo" operation for free
+        lazy (bool): if the share-local operations should be recorded and executed only
+            when the shares are needed (used only by the orchestrator)
+        stats (CommunicationStats): the communication done by the orchestrator with the
+            parties (recorded only when used as a context manager)
+        channel (Optional[str]): the name of the channel (see sympc.utils.channel)
+            used by the parties to open the masked values between them, if None the
+            values are opened by the orchestrator (used only by the orchestrator)
+        fss_threads (Optional[int]): the number of threads each party uses for the FSS
+            keys, if None the cores are split between the parties (used only by the
+            orchestrator)
+        transport (Optional[str]): the name of the transport (see
+            sympc.utils.transport) used to move the shares between the orchestrator
+            and the parties that run on the same host, if None the shares are
+            serialized (used only by the orchestrator)
+        executors (Dict[str, Executor]): the executors used only for this session
+            (for example by the protocols at the parties), shut down with the session
+        primitives_lock (threading.RLock): held by the orchestrator while it gives
+            positions to the operations and while it sends crypto primitives to the
+            parties, such that all the parties have the primitives in the same order
+            (used only by the orchestrator)
+        primitive_positions (Dict[Any, int]): the position of the next primitive that
+            is given to an operation, for each key of the CryptoStore (used only by the
+            orchestrator)
+        primitive_counts (Dict[Any, int]): the number of primitives sent to the
+            parties, for the keys of the CryptoStore that are counted by the protocol
+            (used only by the orchestrator)
     """
 
     # Those values are not used at comparison
@@ -70,6 +106,15 @@ class Session:
         "crypto_store",
         "przs_generators",
         "session_ptrs",
+        "lazy",
+        "stats",
+        "channel",
+        "fss_threads",
+        "transport",
+        "executors",
+        "primitives_lock",
+        "primitive_positions",
+        "primitive_counts",
     }
 
     __slots__ = {
@@ -93,6 +138,15 @@ class Session:
         "max_value",
         "tensor_type",
         "autograd_active",
+        "lazy",
+        "stats",
+        "channel",
+        "fss_threads",
+        "transport",
+        "executors",
+        "primitives_lock",
+        "primitive_positions",
+        "primitive_counts",
     }
 
     def __init__(
@@ -109,7 +163,8 @@ class Session:
             parties (Optional[List[Any]): Used to send/receive messages:
             ring_size (int): Field used for the operations applied on the shares
             config (Optional[Config]): Configuration used for information needed
-                by the Fixed Point Encoder. Defaults None
+                by the Fixed Point Encoder. Defaults None (the default Config, with a
+                lower precision for the small rings - see RING_SIZE_TO_PRECISION)
             protocol (Optional[str]): Protocol. Defaults None
             ttp (Optional[Any]): Trusted third party. Defaults None.
 
@@ -158,7 +213,13 @@ class Session:
                 "Malicious security cannot be provided to less than 3 parties"
             )
 
-        self.config = config if config else Config()
+        if config is None:
+            precision = RING_SIZE_TO_PRECISION.get(ring_size)
+            config = Config()
+            if precision is not None:
+                config = Config(encoder_precision=precision)
+
+        self.config = config
 
         self.przs_generators: List[Optional[torch.Generator]] = []
 
@@ -177,6 +238,43 @@ class Session:
 
         self.autograd_active = False
 
+        self.lazy = False
+
+        self.stats = CommunicationStats(self)
+
+        self.channel: Optional[str] = None
+
+        self.fss_threads: Optional[int] = None
+
+        self.transport: Optional[str] = None
+
+        self.executors: Dict[str, Executor] = {}
+
+        self.primitives_lock = threading.RLock()
+
+        self.primitive_positions: Dict[Any, int] = {}
+        self.primitive_counts: Dict[Any, int] = {}
+
+    def reserve_position(self, key: Any, nr_instances: int) -> int:
+        """Give to an operation the position of its primitives in the CryptoStores.
+
+        The parties take the primitives found at the position (see
+        :meth:`CryptoStore.reserve_primitives`), whatever the order in which the
+        operations reach them.
+
+        Args:
+            key (Any): The key of the primitives in the CryptoStores.
+            nr_instances (int): Number of primitives used by the operation.
+
+        Returns:
+            int: The position of the first primitive.
+        """
+        with self.primitives_lock:
+            position = self.primitive_positions.get(key, 0)
+            self.primitive_positions[key] = position + nr_instances
+
+        return position
+
     def get_protocol(self) -> Protocol:
         """Get protocol.
 
@@ -293,6 +391,43 @@ class Session:
         generator_next = get_new_generator(seed_next)
         self.przs_generators = [generator_current, generator_next]
 
+    @contextmanager
+    def lazy_mode(self) -> Iterator["Session"]:
+        """Record the share-local operations and execute them only when needed.
+
+        The linear operations (add, sub, mul with a public value, reshape, transpose,
+        sum...) applied on the MPCTensors from this session are fused and executed
+        with one call for each party when a non-linear operation (or a reconstruction)
+        needs the shares.
+
+        Yields:
+            Session: The session.
+        """
+        lazy = self.lazy
+        self.lazy = True
+        try:
+            yield self
+        finally:
+            self.lazy = lazy
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Release the resources used only by this session.
+
+        The executors used by "parallel_execution" are shared by all the sessions, they
+        are not shut down (see "shutdown_executors") such that the other sessions keep
+        running. The orchestrator asks the parties to release the resources they use
+        for this session.
+
+        Args:
+            wait (bool): Wait for the pending tasks to finish. Defaults to True.
+        """
+        for session_ptr in self.session_ptrs:
+            session_ptr.shutdown(wait)
+
+        executors, self.executors = self.executors, {}
+        for executor in executors.values():
+            executor.shutdown(wait=wait)
+
     def __eq__(self, other: Any) -> bool:
         """Check if "self" is equal with another object given a set of attributes to compare.
 
@@ -316,7 +451,7 @@ class Session:
         Returns:
             A copy of the current Session.
         """
-        session = Session()
+        session = Session(ring_size=self.ring_size)
         session.nr_parties = self.nr_parties
         session.config = deepcopy(self.config)
         session.protocol = self.protocol
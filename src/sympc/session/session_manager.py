@@ -10,6 +10,7 @@ from uuid import UUID
 from uuid import uuid4
 
 from sympc.session.session import Session
+from sympc.utils import send_to_party
 
 
 class SessionManager:
@@ -52,7 +53,7 @@ class SessionManager:
             # And a new uuid
             session_party.uuid = uuid4()
             uuids[rank] = session_party.uuid
-            session.session_ptrs.append(session_party.send(party))  # type: ignore
+            session.session_ptrs.append(send_to_party(session_party, party))
 
         session.uuid = uuid4()
         session.rank_to_uuid = uuids
@@ -2,6 +2,7 @@
 
 from sympc.store.crypto_primitive_provider import CryptoPrimitiveProvider
 from sympc.store.crypto_store import CryptoStore
+from sympc.store.preprocessing import PreprocessingPlanner
 
 
 def register_primitive_generator(name: str):
@@ -58,4 +59,4 @@ def register_primitive_store_get(name):
     return register_get
 
 
-__all__ = ["CryptoStore", "CryptoPrimitiveProvider"]
+__all__ = ["CryptoStore", "CryptoPrimitiveProvider", "PreprocessingPlanner"]
@@ -3,6 +3,7 @@
 # stdlib
 import itertools
 import json
+import time
 from typing import Any
 from typing import Callable
 from typing import DefaultDict
@@ -10,6 +11,9 @@ from typing import Dict
 from typing import List
 
 from sympc.session import Session
+from sympc.utils import is_recording
+from sympc.utils import payload_nbytes
+from sympc.utils import record_round
 
 
 class CryptoPrimitiveProvider:
@@ -66,9 +70,11 @@ class CryptoPrimitiveProvider:
         if p_kwargs is not None:
             """Do not transfer the primitives if there is not specified a
             values for populate kwargs."""
-            CryptoPrimitiveProvider._transfer_primitives_to_parties(
-                op_str, primitives, session.session_ptrs, p_kwargs
-            )
+            # All the parties should get the primitives in the same order
+            with session.primitives_lock:
+                CryptoPrimitiveProvider._transfer_primitives_to_parties(
+                    op_str, primitives, session.session_ptrs, p_kwargs
+                )
 
         # Since we do not have (YET!) the possiblity to return typed tuples from a remote
         # execute function we are using this
@@ -89,11 +95,21 @@ class CryptoPrimitiveProvider:
                 f"Primitives Len {len(primitives)} != Sessions Len {len(sessions)}"
             )
 
+        start = time.perf_counter()
         for primitives_party, session in zip(primitives, sessions):
             session.crypto_store.populate_store(
                 op_str, primitives_party, **p_kwargs  # TODO
             )
 
+        if is_recording():
+            record_round(
+                [session.client for session in sessions],
+                [payload_nbytes(primitives_party) for primitives_party in primitives],
+                [0] * len(sessions),
+                time.perf_counter() - start,
+                f"primitives_{op_str}",
+            )
+
     @staticmethod
     def get_state() -> str:
         """Get the state of a CryptoProvider.
@@ -1,11 +1,82 @@
 """CryptoStore manages the needed crypto primitives."""
 
 # stdlib
+from collections import deque
+import threading
 from typing import Any
 from typing import Callable
 from typing import Dict
 from typing import Iterable
 from typing import List
+from typing import Tuple
+from typing import Union
+
+from sympc.store.exceptions import EmptyPrimitiveStore
+
+PrimitiveKey = Tuple[str, Tuple[Tuple[int, ...], ...]]
+
+
+def get_primitive_key(
+    op_str: str, *shapes: Union[Tuple[int, ...], Any]
+) -> PrimitiveKey:
+    """Build the key under which the primitives are kept in the store.
+
+    Args:
+        op_str (str): Operator.
+        *shapes (Union[Tuple[int, ...], torch.Size]): Shapes of the operands.
+
+    Returns:
+        PrimitiveKey: A (op_str, shapes) tuple.
+    """
+    return op_str, tuple(tuple(shape) for shape in shapes)
+
+
+def add_primitives_to_queue(
+    store: Dict[Any, Any], key: PrimitiveKey, primitives: Iterable[Any]
+) -> None:
+    """Append primitives at the end of the queue specific for a key.
+
+    Args:
+        store (Dict[Any, Any]): The CryptoStore.
+        key (PrimitiveKey): The key for the primitives.
+        primitives (Iterable[Any]): Primitives to append.
+    """
+    try:
+        queue = store[key]
+    except KeyError:
+        queue = store[key] = deque()
+
+    queue.extend(primitives)
+
+
+def get_primitive_from_queue(
+    store: Dict[Any, Any], key: PrimitiveKey, remove: bool = True
+) -> Any:
+    """Retrieve the first primitive from the queue specific for a key.
+
+    Args:
+        store (Dict[Any, Any]): The CryptoStore.
+        key (PrimitiveKey): The key for the primitives.
+        remove (bool): True if the primitive should be removed from the queue, if False
+            the primitive is only peeked.
+
+    Returns:
+        Any: The primitive.
+
+    Raises:
+        EmptyPrimitiveStore: If there is no primitive in the store for the key.
+    """
+    queue = store.get(key, None)
+    if queue is None:
+        raise EmptyPrimitiveStore(f"{key} does not exists in the store")
+
+    if not queue:
+        raise EmptyPrimitiveStore(f"No primitive in the store for {key}")
+
+    if remove:
+        return queue.popleft()
+
+    return queue[0]
 
 
 class CryptoStore:
@@ -16,7 +87,7 @@ class CryptoStore:
 
     """
 
-    __slots__ = {"store"}
+    __slots__ = {"store", "_heads", "_aside", "_lock"}
 
     _func_add_store: Dict[Any, Callable] = {}
     _func_get_store: Dict[Any, Callable] = {}
@@ -24,13 +95,83 @@ class CryptoStore:
     def __init__(self):
         """Initializer."""
         self.store: Dict[Any, Any] = {}
+        # Position (in the order in which the primitives were added) of the first
+        # primitive in the queue, for each key
+        self._heads: Dict[Any, int] = {}
+        # The primitives taken out of a queue for the operations that did not
+        # reach the party yet, by key and by position
+        self._aside: Dict[Any, Dict[int, Any]] = {}
+        self._lock = threading.Lock()
+
+    def reserve_primitives(
+        self,
+        key: PrimitiveKey,
+        position: int,
+        nr_instances: int,
+        take: Callable[[int], Any],
+    ) -> Any:
+        """Take the primitives found at a position of the queue for a key.
+
+        The orchestrator gives to each operation the position of its primitives (see
+        :meth:`Session.reserve_position`), such that all the parties use the same
+        primitives for an operation even if the operations reach them in a different
+        order. The primitives in front of the position are kept aside for the
+        operations that did not reach the party yet.
+
+        Args:
+            key (PrimitiveKey): The key of the queue.
+            position (int): Position of the first primitive for the operation.
+            nr_instances (int): Number of primitives for the operation.
+            take (Callable[[int], Any]): Removes a number of primitives from the front
+                of the queue and returns them (as a value that can be sliced).
+
+        Returns:
+            Any: The primitives.
+
+        Raises:
+            EmptyPrimitiveStore: If the queue does not have the primitives yet.
+            ValueError: If the primitives at the position were already used.
+        """
+        position = int(position)
+        end = position + int(nr_instances)
+
+        with self._lock:
+            head = self._heads.get(key, 0)
+            aside = self._aside.setdefault(key, {})
+
+            if position >= head:
+                available = len(self.store.get(key, ()))
+                if available < end - head:
+                    raise EmptyPrimitiveStore(
+                        f"Not enough primitives for {key}: {end - head} required, "
+                        f"but only {available} available"
+                    )
+
+                if position > head:
+                    aside[head] = take(position - head)
+
+                self._heads[key] = end
+                return take(end - position)
+
+            for start in list(aside):
+                chunk = aside[start]
+                if start <= position and end <= start + len(chunk):
+                    del aside[start]
+                    if start < position:
+                        aside[start] = chunk[: position - start]
+                    if end < start + len(chunk):
+                        aside[end] = chunk[end - start :]
+
+                    return chunk[position - start : end - start]
+
+        raise ValueError(f"The primitives at {position} for {key} were already used")
 
     def populate_store(
         self,
         op_str: str,
         primitives: Iterable[Any],
         *args: List[Any],
-        **kwargs: Dict[Any, Any]
+        **kwargs: Dict[Any, Any],
     ) -> None:
         """Populate items.
 
@@ -48,6 +189,9 @@ class CryptoStore:
     ) -> List[Any]:
         """Get primitives from store.
 
+        Passing remove=False (if the registered getter supports it) only peeks
+        at the primitives without consuming them.
+
         Args:
             op_str (str): Operator to get.
             nr_instances (int): Number of instances.
@@ -60,3 +204,37 @@ class CryptoStore:
         retrieve_func = CryptoStore._func_get_store[op_str]
         primitives = retrieve_func(self.store, nr_instances, *args, **kwargs)
         return primitives
+
+    def use_disk(self, directory: str) -> None:
+        """Keep the primitives in files from a directory instead of memory.
+
+        The primitives that are already in the directory are reused and the ones that
+        are in memory are moved to disk. Each party should use its own directory.
+
+        Args:
+            directory (str): The directory for the files.
+        """
+        from sympc.store.disk_store import DiskStore
+
+        disk_store = DiskStore(str(directory))
+        for key, primitives in self.store.items():
+            if isinstance(primitives, deque):
+                disk_store[key].extend(primitives)
+            else:
+                disk_store[key] = primitives
+
+        self.store = disk_store
+
+    def available(self, op_str: str, *shapes: Tuple[int, ...]) -> int:
+        """Count the primitives that are available in the store.
+
+        Args:
+            op_str (str): Operator.
+            *shapes (Tuple[int, ...]): Shapes of the operands for which the
+                primitives were generated.
+
+        Returns:
+            int: Number of primitives that can be retrieved.
+        """
+        key = get_primitive_key(op_str, *shapes)
+        return len(self.store.get(key, ()))
@@ -0,0 +1,441 @@
+"""Keep the crypto primitives on disk instead of memory.
+
+The primitives for a key (an operation and the shapes of its operands) are appended to
+a binary file. All the instances for a key have the same layout, such that instance
+"i" starts at "i * instance_nbytes". When a primitive is retrieved, the tensors are
+zero-copy views (using :class:`numpy.memmap`) on the file - only the pages that are
+used are loaded in memory.
+
+The layout is saved in a metadata file and the cursor (that keeps track of the
+primitives that were consumed) in a small mapped file, such that a store can be
+reopened by another process - for example the parties generate the primitives
+overnight and use them later. Consuming a primitive only updates the mapped cursor,
+no file is written.
+
+The primitives are shares of secret values - the directory and the files are created
+such that only their owner can access them.
+"""
+
+# stdlib
+import hashlib
+import json
+import os
+import threading
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from uuid import UUID
+
+# third party
+import numpy as np
+import torch
+
+from sympc.config import Config
+from sympc.store.crypto_store import PrimitiveKey
+from sympc.tensor import ShareTensor
+
+METADATA_EXTENSION = ".json"
+DATA_EXTENSION = ".bin"
+CURSOR_EXTENSION = ".cursor"
+
+# The primitives are secret, only the owner of the party can access the files
+DIRECTORY_MODE = 0o700
+FILE_MODE = 0o600
+
+# Kinds of values that can be kept in a primitive
+SHARE_KIND = "share"
+TENSOR_KIND = "tensor"
+NDARRAY_KIND = "ndarray"
+
+
+def _key_to_filename(key: PrimitiveKey) -> str:
+    """Get the name of the files (without extension) used for a key.
+
+    Args:
+        key (PrimitiveKey): The key for the primitives.
+
+    Returns:
+        str: The name for the files.
+    """
+    op_str = key[0] if isinstance(key, tuple) else key
+    digest = hashlib.sha256(repr(key).encode()).hexdigest()[:16]
+    return f"{op_str}_{digest}"
+
+
+def _open_private(path: str, flags: int, mode: str) -> Any:
+    """Open a file that only the owner can access (it is created if needed).
+
+    Args:
+        path (str): Path of the file.
+        flags (int): Flags for :func:`os.open` (O_CREAT is always added).
+        mode (str): Mode for :func:`os.fdopen`.
+
+    Returns:
+        Any: The file object.
+
+    Raises:
+        BaseException: If the file object can not be created (the file is closed).
+    """
+    fd = os.open(path, flags | os.O_CREAT, FILE_MODE)
+    try:
+        return os.fdopen(fd, mode)
+    except BaseException:
+        os.close(fd)
+        raise
+
+
+def _freeze_key(key: Any) -> Any:
+    """Transform a key that was saved as json back to a tuple.
+
+    Args:
+        key (Any): The key from the metadata file.
+
+    Returns:
+        Any: The key.
+    """
+    if isinstance(key, list):
+        return tuple(_freeze_key(el) for el in key)
+
+    return key
+
+
+def _to_numpy(value: Any) -> np.ndarray:
+    """Get the values that should be written for a part of a primitive.
+
+    Args:
+        value (Any): A ShareTensor, a tensor or an array.
+
+    Returns:
+        np.ndarray: The values.
+    """
+    if isinstance(value, ShareTensor):
+        value = value.tensor
+
+    if isinstance(value, torch.Tensor):
+        return value.detach().contiguous().numpy()
+
+    return np.ascontiguousarray(value)
+
+
+def _get_layout(value: Any) -> Dict[str, Any]:
+    """Describe a part of a primitive.
+
+    Args:
+        value (Any): A ShareTensor, a tensor or an array.
+
+    Returns:
+        Dict[str, Any]: The kind, shape and dtype of the value and the attributes
+        needed to rebuild a ShareTensor.
+
+    Raises:
+        TypeError: If the value can not be kept on disk.
+    """
+    layout: Dict[str, Any] = {"session_uuid": None, "config": None}
+
+    if isinstance(value, ShareTensor):
+        layout["kind"] = SHARE_KIND
+        if value.session_uuid is not None:
+            layout["session_uuid"] = str(value.session_uuid)
+        layout["config"] = {
+            "encoder_base": value.config.encoder_base,
+            "encoder_precision": value.config.encoder_precision,
+        }
+    elif isinstance(value, torch.Tensor):
+        layout["kind"] = TENSOR_KIND
+    elif isinstance(value, np.ndarray):
+        layout["kind"] = NDARRAY_KIND
+    else:
+        raise TypeError(f"{type(value)} can not be kept on disk")
+
+    array = _to_numpy(value)
+    layout["shape"] = list(array.shape)
+    layout["dtype"] = array.dtype.str
+
+    return layout
+
+
+class DiskPrimitiveQueue:
+    """Queue of primitives (for a key) kept in an append-only file.
+
+    It has the same interface as the deque used by :class:`CryptoStore`.
+
+    Attributes:
+        key (PrimitiveKey): The key for the primitives.
+        data_path (str): The file with the primitives.
+        metadata_path (str): The file with the layout and the number of primitives.
+        cursor_path (str): The file with the cursor.
+        layout (Optional[List[Dict[str, Any]]]): The layout of each part of a primitive
+            (None if no primitive was added).
+        size (int): Number of primitives in the file.
+    """
+
+    __slots__ = {
+        "key",
+        "data_path",
+        "metadata_path",
+        "cursor_path",
+        "layout",
+        "size",
+        "_cursor",
+        "_lock",
+    }
+
+    def __init__(self, directory: str, key: PrimitiveKey) -> None:
+        """Initializer - the primitives that are already on disk are reused.
+
+        Args:
+            directory (str): The directory for the files.
+            key (PrimitiveKey): The key for the primitives.
+        """
+        filename = os.path.join(directory, _key_to_filename(key))
+        self.key = key
+        self.data_path = f"{filename}{DATA_EXTENSION}"
+        self.metadata_path = f"{filename}{METADATA_EXTENSION}"
+        self.cursor_path = f"{filename}{CURSOR_EXTENSION}"
+        self.layout: Optional[List[Dict[str, Any]]] = None
+        self.size = 0
+        self._lock = threading.Lock()
+
+        if os.path.exists(self.metadata_path):
+            with open(self.metadata_path) as f:
+                metadata = json.load(f)
+
+            self.layout = metadata["layout"]
+            self.size = metadata["size"]
+
+        with _open_private(self.cursor_path, os.O_RDWR, "r+b") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                os.ftruncate(f.fileno(), np.dtype(np.int64).itemsize)
+            # The mapping is kept after the file is closed
+            self._cursor = np.memmap(f, dtype=np.int64, mode="r+", shape=(1,))
+
+        if self.head > self.size:
+            # The queue was emptied before the cursor was reset
+            self.head = 0
+
+    @property
+    def head(self) -> int:
+        """Index of the first primitive that was not consumed.
+
+        Returns:
+            int: The index.
+        """
+        return int(self._cursor[0])
+
+    @head.setter
+    def head(self, value: int) -> None:
+        """Move the cursor.
+
+        Args:
+            value (int): Index of the first primitive that was not consumed.
+        """
+        self._cursor[0] = value
+
+    @property
+    def instance_nbytes(self) -> int:
+        """Number of bytes for a primitive.
+
+        Returns:
+            int: Number of bytes.
+        """
+        if self.layout is None:
+            return 0
+
+        return sum(
+            int(np.prod(part["shape"])) * np.dtype(part["dtype"]).itemsize
+            for part in self.layout
+        )
+
+    def _save_metadata(self) -> None:
+        """Save the layout and the number of primitives."""
+        metadata = {
+            "key": self.key,
+            "layout": self.layout,
+            "size": self.size,
+        }
+
+        tmp_path = f"{self.metadata_path}.tmp"
+        with _open_private(tmp_path, os.O_WRONLY | os.O_TRUNC, "w") as f:
+            json.dump(metadata, f)
+
+        os.replace(tmp_path, self.metadata_path)
+
+    def extend(self, primitives: Iterable[Any]) -> None:
+        """Append primitives at the end of the file.
+
+        Args:
+            primitives (Iterable[Any]): Primitives, each one is a list of ShareTensors,
+                tensors or arrays.
+
+        Raises:
+            ValueError: If a primitive does not have the layout of the queue.
+        """
+        with self._lock:
+            with _open_private(self.data_path, os.O_WRONLY | os.O_APPEND, "ab") as f:
+                for primitive in primitives:
+                    if not isinstance(primitive, (list, tuple)):
+                        primitive = [primitive]
+
+                    layout = [_get_layout(value) for value in primitive]
+                    if self.layout is None:
+                        self.layout = layout
+                    elif layout != self.layout:
+                        raise ValueError(
+                            f"Primitive layout {layout} is different from {self.layout}"
+                        )
+
+                    for value in primitive:
+                        f.write(_to_numpy(value).tobytes())
+
+                    self.size += 1
+
+            self._save_metadata()
+
+    def _load(self, index: int) -> List[Any]:
+        """Load a primitive as views on the file.
+
+        Args:
+            index (int): Index of the primitive in the file.
+
+        Returns:
+            List[Any]: The parts of the primitive.
+        """
+        offset = index * self.instance_nbytes
+        primitive = []
+
+        for part in self.layout:
+            dtype = np.dtype(part["dtype"])
+            shape = tuple(part["shape"])
+            nbytes = int(np.prod(shape)) * dtype.itemsize
+
+            if nbytes:
+                # Copy-on-write, such that the values on disk are never modified
+                array = np.memmap(
+                    self.data_path, dtype=dtype, mode="c", offset=offset, shape=shape
+                )
+            else:
+                array = np.empty(shape, dtype=dtype)
+
+            offset += nbytes
+
+            if part["kind"] == NDARRAY_KIND:
+                primitive.append(array)
+                continue
+
+            tensor = torch.from_numpy(array)
+            if part["kind"] == TENSOR_KIND:
+                primitive.append(tensor)
+                continue
+
+            session_uuid = part["session_uuid"]
+            share = ShareTensor(
+                session_uuid=UUID(session_uuid) if session_uuid is not None else None,
+                config=Config(**part["config"]),
+            )
+            share.tensor = tensor
+            primitive.append(share)
+
+        return primitive
+
+    def popleft(self) -> List[Any]:
+        """Consume the first primitive.
+
+        Only the mapped cursor is updated. When all the primitives were consumed the
+        file is emptied.
+
+        Returns:
+            List[Any]: The primitive.
+
+        Raises:
+            IndexError: If there is no primitive left.
+        """
+        with self._lock:
+            if self.head >= self.size:
+                raise IndexError("pop from an empty queue")
+
+            primitive = self._load(self.head)
+            self.head += 1
+
+            if self.head == self.size:
+                # The views that were returned keep the (unlinked) file mapped
+                os.remove(self.data_path)
+                self.size = 0
+                self._save_metadata()
+                self.head = 0
+
+        return primitive
+
+    def __getitem__(self, index: int) -> List[Any]:
+        """Get a primitive without consuming it.
+
+        Args:
+            index (int): Index of the primitive (relative to the first one that was
+                not consumed).
+
+        Returns:
+            List[Any]: The primitive.
+
+        Raises:
+            IndexError: If the index is not valid.
+        """
+        if not 0 <= index < len(self):
+            raise IndexError("queue index out of range")
+
+        return self._load(self.head + index)
+
+    def flush(self) -> None:
+        """Write the cursor to the disk (it is written by the system otherwise)."""
+        self._cursor.flush()
+
+    def __len__(self) -> int:
+        """Number of primitives that were not consumed.
+
+        Returns:
+            int: Number of primitives.
+        """
+        return self.size - self.head
+
+
+class DiskStore(dict):
+    """Store that keeps the queues of primitives on disk.
+
+    It is used as :attr:`CryptoStore.store` - a queue is created for a key the first
+    time the key is accessed (such that :func:`add_primitives_to_queue` appends to a
+    file).
+
+    Attributes:
+        directory (str): The directory for the files.
+    """
+
+    def __init__(self, directory: str) -> None:
+        """Initializer - the queues that are already in the directory are reopened.
+
+        Args:
+            directory (str): The directory for the files.
+        """
+        super().__init__()
+        self.directory = directory
+        os.makedirs(directory, mode=DIRECTORY_MODE, exist_ok=True)
+
+        for filename in sorted(os.listdir(directory)):
+            if not filename.endswith(METADATA_EXTENSION):
+                continue
+
+            with open(os.path.join(directory, filename)) as f:
+                key = _freeze_key(json.load(f)["key"])
+
+            self[key] = DiskPrimitiveQueue(directory, key)
+
+    def __missing__(self, key: PrimitiveKey) -> DiskPrimitiveQueue:
+        """Create the queue for a key.
+
+        Args:
+            key (PrimitiveKey): The key for the primitives.
+
+        Returns:
+            DiskPrimitiveQueue: The queue.
+        """
+        queue = self[key] = DiskPrimitiveQueue(self.directory, key)
+        return queue
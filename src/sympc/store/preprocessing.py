@@ -0,0 +1,205 @@
+"""Plan the crypto primitives needed by a computation and generate them in bulk.
+
+The planner groups the primitives requests (recorded with the primitive logging from
+:class:`CryptoPrimitiveProvider` or with a dry run of the computation) that have the
+same signature - the same operation and the same shapes. All the primitives for a group
+are generated with one call to the provider, for as many batches as requested.
+
+Example:
+    >>> planner = PreprocessingPlanner(session)
+    >>> planner.trace(mpc_model, x_mpc)
+    >>> planner.generate(nr_batches=10)
+    >>> # The next 10 forward passes use only the primitives from the store
+"""
+
+# stdlib
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+import inspect
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from sympc.session import Session
+from sympc.store.crypto_primitive_provider import CryptoPrimitiveProvider
+
+PrimitiveRequest = Tuple[str, Optional[Dict[str, Any]], Dict[str, Any]]
+
+
+def _freeze(value: Any) -> Any:
+    """Transform a value such that it can be used as a dictionary key.
+
+    The lists (that appear when the log was serialized as json) and the sizes are
+    transformed to tuples such that they are grouped with the initial values.
+
+    Args:
+        value (Any): The value.
+
+    Returns:
+        Any: The hashable value.
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(el)) for key, el in value.items()))
+
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(el) for el in value)
+
+    return value
+
+
+class PreprocessingPlanner:
+    """Generate the crypto primitives needed for multiple runs of a computation.
+
+    Attributes:
+        session (Session): The session used for the computation.
+        requests (List[PrimitiveRequest]): The (op_str, p_kwargs, g_kwargs) recorded
+            for one run of the computation.
+    """
+
+    __slots__ = {"session", "requests", "_executor"}
+
+    def __init__(
+        self,
+        session: Session,
+        primitive_log: Optional[Dict[str, List[Tuple[Any, Any]]]] = None,
+    ) -> None:
+        """Initializer.
+
+        Args:
+            session (Session): The session used for the computation.
+            primitive_log (Optional[Dict[str, List[Tuple[Any, Any]]]]): A log created
+                with the primitive logging (see
+                :meth:`CryptoPrimitiveProvider.stop_logging`). Defaults to None.
+        """
+        self.session = session
+        self.requests: List[PrimitiveRequest] = []
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        if primitive_log is not None:
+            self.add_log(primitive_log)
+
+    def add_log(self, primitive_log: Dict[str, List[Tuple[Any, Any]]]) -> None:
+        """Add the requests from a primitive log.
+
+        Args:
+            primitive_log (Dict[str, List[Tuple[Any, Any]]]): A log created with the
+                primitive logging.
+        """
+        for op_str, args in primitive_log.items():
+            for p_kwargs, g_kwargs in args:
+                self.requests.append((op_str, p_kwargs, g_kwargs))
+
+    def trace(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run the computation once and record the primitives it needs.
+
+        The primitive logging should not be active when calling this method.
+
+        Args:
+            fn (Callable[..., Any]): The computation (for example a model).
+            *args (Any): Arguments for the computation.
+            **kwargs (Any): Keyword arguments for the computation.
+
+        Returns:
+            Any: The result of the computation.
+        """
+        CryptoPrimitiveProvider.start_logging()
+        try:
+            res = fn(*args, **kwargs)
+        finally:
+            primitive_log = CryptoPrimitiveProvider.stop_logging()
+
+        self.add_log(primitive_log)
+        return res
+
+    def plan(self) -> List[Tuple[str, Dict[str, Any], Dict[str, Any], int]]:
+        """Group the requests that have the same signature.
+
+        The primitives that are not stored at the parties (the requests without a
+        populate kwargs) are used only by the orchestrator, and are not planned.
+
+        Returns:
+            List[Tuple[str, Dict[str, Any], Dict[str, Any], int]]: The (op_str,
+            p_kwargs, g_kwargs, count) for each group, in the order of the first
+            request from the group.
+        """
+        groups: Dict[Any, List[Any]] = {}
+        for op_str, p_kwargs, g_kwargs in self.requests:
+            if p_kwargs is None:
+                continue
+
+            key = (op_str, _freeze(p_kwargs), _freeze(g_kwargs))
+            if key in groups:
+                groups[key][3] += 1
+            else:
+                groups[key] = [op_str, p_kwargs, g_kwargs, 1]
+
+        return [tuple(group) for group in groups.values()]
+
+    def generate(self, nr_batches: int = 1) -> None:
+        """Generate and transfer to the parties the primitives for multiple runs.
+
+        Args:
+            nr_batches (int): Number of runs of the computation. Defaults to 1.
+
+        Raises:
+            ValueError: If the number of batches is not positive.
+        """
+        if nr_batches < 1:
+            raise ValueError(f"Number of batches should be positive, got {nr_batches}")
+
+        for op_str, p_kwargs, g_kwargs, count in self.plan():
+            generator = CryptoPrimitiveProvider._func_providers[op_str]
+            parameters = inspect.signature(generator).parameters
+            nr_instances = count * nr_batches
+
+            if "n_values" in g_kwargs:
+                # The primitives for all the values are generated at once
+                n_values = g_kwargs["n_values"] * nr_instances
+                bulk_calls = [{**g_kwargs, "n_values": n_values}]
+            elif "n_instances" in parameters or any(
+                param.kind == inspect.Parameter.VAR_KEYWORD
+                for param in parameters.values()
+            ):
+                bulk_calls = [{**g_kwargs, "n_instances": nr_instances}]
+            else:
+                bulk_calls = [g_kwargs] * nr_instances
+
+            for bulk_g_kwargs in bulk_calls:
+                CryptoPrimitiveProvider.generate_primitives(
+                    op_str,
+                    session=self.session,
+                    g_kwargs=bulk_g_kwargs,
+                    p_kwargs=p_kwargs,
+                )
+
+    def generate_in_background(self, nr_batches: int = 1) -> Future:
+        """Generate the primitives for multiple runs in a background worker.
+
+        The primitives are added to the stores while the online phase is running, the
+        requests are served in the order in which they were submitted.
+
+        Args:
+            nr_batches (int): Number of runs of the computation. Defaults to 1.
+
+        Returns:
+            Future: Completed when all the primitives are at the parties.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="sympc-preprocessing"
+            )
+
+        return self._executor.submit(self.generate, nr_batches)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the background worker.
+
+        Args:
+            wait (bool): Wait for the pending generations to finish. Defaults to True.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
@@ -2,7 +2,10 @@
 
 
 from .share_tensor import ShareTensor  # isort:skip
+from . import lazy
 from . import static
+from .bit_share_tensor import BitShareTensor
+from .mpc_bit_tensor import MPCBitTensor
 from .mpc_tensor import METHODS_TO_ADD
 from .mpc_tensor import MPCTensor
 from .replicatedshare_tensor import ReplicatedSharedTensor
@@ -11,6 +14,9 @@ __all__ = [
     "ShareTensor",
     "ReplicatedSharedTensor",
     "MPCTensor",
+    "BitShareTensor",
+    "MPCBitTensor",
     "METHODS_TO_ADD",
     "static",
+    "lazy",
 ]
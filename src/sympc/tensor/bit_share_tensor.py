@@ -0,0 +1,357 @@
+"""Share of bits (XOR secret sharing) with the bits packed 8 per byte.
+
+The comparisons (see :mod:`sympc.protocol.fss`) output bits - instead of keeping each
+bit in a 64 bits arithmetic share, the parties can keep them packed such that a mask
+takes 64 times less memory (and 64 times less bandwidth when it is opened).
+
+The bits are converted to arithmetic shares only when they are needed (for example to
+multiply them with a secret value) using random bits that are shared in both ways
+(daBits).
+"""
+
+# stdlib
+from typing import Any
+from typing import Optional
+from typing import Tuple
+from typing import Union
+from uuid import UUID
+
+# third party
+import numpy as np
+import torch
+
+from sympc.session import get_session
+from sympc.tensor.share_tensor import ShareTensor
+
+# The primitives for an operation are reserved by the mask step and used by the
+# second step of the operation
+RESERVED_DABITS = "b2a_reserved_dabits"
+RESERVED_BIT_TRIPLE = "bit_and_reserved_triple"
+
+
+def pack_bits(bits: Union[torch.Tensor, np.ndarray]) -> torch.Tensor:
+    """Pack bits, 8 per byte.
+
+    Args:
+        bits (Union[torch.Tensor, np.ndarray]): The bits (any non zero value is 1).
+
+    Returns:
+        torch.Tensor: The packed bits (uint8, one dimension).
+    """
+    if isinstance(bits, torch.Tensor):
+        bits = bits.detach().cpu().numpy()
+
+    bits = (np.asarray(bits) != 0).astype(np.uint8).reshape(-1)
+    return torch.from_numpy(np.packbits(bits, bitorder="little"))
+
+
+def unpack_bits(packed: torch.Tensor, shape: Tuple[int, ...]) -> torch.Tensor:
+    """Unpack bits that were packed with :func:`pack_bits`.
+
+    Args:
+        packed (torch.Tensor): The packed bits.
+        shape (Tuple[int, ...]): The shape of the bits.
+
+    Returns:
+        torch.Tensor: The bits (uint8).
+    """
+    shape = torch.Size(shape)
+    bits = np.unpackbits(
+        packed.cpu().numpy(), count=shape.numel(), bitorder="little"
+    ).reshape(shape)
+    return torch.from_numpy(bits)
+
+
+class BitShareTensor:
+    """Single share of bits, the bits are XOR shared between the parties.
+
+    The packed bits are sent as plain tensors, a BitShareTensor never leaves the
+    party that holds it.
+
+    Attributes:
+        tensor (torch.Tensor): The packed bits.
+        shape (torch.Size): The shape of the (unpacked) bits.
+        session_uuid (Optional[UUID]): Keep track from which session the share belongs.
+    """
+
+    __slots__ = {"tensor", "shape", "session_uuid"}
+
+    def __init__(
+        self,
+        data: Optional[Union[torch.Tensor, np.ndarray]] = None,
+        session_uuid: Optional[UUID] = None,
+    ) -> None:
+        """Initializer.
+
+        Args:
+            data (Optional[Union[torch.Tensor, np.ndarray]]): The bits of the share.
+                Defaults to None.
+            session_uuid (Optional[UUID]): The session from which the share belongs.
+                Defaults to None.
+        """
+        self.session_uuid = session_uuid
+        self.shape = torch.Size([0])
+        self.tensor = torch.empty(0, dtype=torch.uint8)
+
+        if data is not None:
+            self.shape = torch.Size(data.shape)
+            self.tensor = pack_bits(data)
+
+    @staticmethod
+    def from_packed(
+        packed: torch.Tensor,
+        shape: Tuple[int, ...],
+        session_uuid: Optional[UUID] = None,
+    ) -> "BitShareTensor":
+        """Create a share from bits that are already packed.
+
+        Args:
+            packed (torch.Tensor): The packed bits.
+            shape (Tuple[int, ...]): The shape of the bits.
+            session_uuid (Optional[UUID]): The session from which the share belongs.
+                Defaults to None.
+
+        Returns:
+            BitShareTensor: The share.
+        """
+        res = BitShareTensor(session_uuid=session_uuid)
+        res.shape = torch.Size(shape)
+        res.tensor = packed
+        return res
+
+    def bits(self) -> torch.Tensor:
+        """Unpack the bits of the share.
+
+        Returns:
+            torch.Tensor: The bits (uint8).
+        """
+        return unpack_bits(self.tensor, self.shape)
+
+    def get_packed(self) -> torch.Tensor:
+        """Get the packed bits, such that they can be sent to the orchestrator.
+
+        Returns:
+            torch.Tensor: The packed bits.
+        """
+        return self.tensor
+
+    def numel(self) -> int:
+        """Number of bits.
+
+        Returns:
+            int: Number of bits.
+        """
+        return self.shape.numel()
+
+    @property
+    def nbytes(self) -> int:
+        """Number of bytes used to keep the bits.
+
+        Returns:
+            int: Number of bytes.
+        """
+        return self.tensor.numel()
+
+    def _packed_operand(
+        self, y: Union["BitShareTensor", torch.Tensor, int]
+    ) -> torch.Tensor:
+        """Get the packed bits of the other operand.
+
+        Args:
+            y (Union[BitShareTensor, torch.Tensor, int]): Share or public bits.
+
+        Returns:
+            torch.Tensor: The packed bits.
+
+        Raises:
+            ValueError: If the shape of the operand is different.
+        """
+        if isinstance(y, BitShareTensor):
+            if y.shape != self.shape:
+                raise ValueError(f"Shapes do not match {self.shape} {y.shape}")
+
+            return y.tensor
+
+        y = torch.as_tensor(y).expand(self.shape)
+        return pack_bits(y)
+
+    def xor(self, y: Union["BitShareTensor", torch.Tensor, int]) -> "BitShareTensor":
+        """Apply the "xor" operation between "self" and "y".
+
+        A public value should be added by a single party.
+
+        Args:
+            y (Union[BitShareTensor, torch.Tensor, int]): self xor y
+
+        Returns:
+            BitShareTensor: Result of the operation.
+        """
+        packed = self.tensor ^ self._packed_operand(y)
+        return BitShareTensor.from_packed(packed, self.shape, self.session_uuid)
+
+    def and_(self, y: Union[torch.Tensor, int]) -> "BitShareTensor":
+        """Apply the "and" operation between "self" and a public value.
+
+        Args:
+            y (Union[torch.Tensor, int]): self and y
+
+        Returns:
+            BitShareTensor: Result of the operation.
+
+        Raises:
+            ValueError: If "y" is a share - the "and" between two shares needs
+                communication (see :class:`sympc.tensor.MPCBitTensor`).
+        """
+        if isinstance(y, BitShareTensor):
+            raise ValueError("The and between two shares is done with MPCBitTensor")
+
+        packed = self.tensor & self._packed_operand(y)
+        return BitShareTensor.from_packed(packed, self.shape, self.session_uuid)
+
+    def __eq__(self, other: Any) -> bool:
+        """Equal operator.
+
+        Args:
+            other (Any): Object to compare.
+
+        Returns:
+            bool: True if the shares have the same bits.
+        """
+        if not isinstance(other, BitShareTensor):
+            return False
+
+        return (
+            self.session_uuid == other.session_uuid
+            and self.shape == other.shape
+            and bool((self.tensor == other.tensor).all())
+        )
+
+    def __repr__(self) -> str:
+        """Representation.
+
+        Returns:
+            str: The shape and the number of bytes of the share.
+        """
+        return f"[{type(self).__name__}]\n\t| shape: {self.shape}, bytes: {self.nbytes}"
+
+    __xor__ = xor
+    __and__ = and_
+
+
+def b2a_mask(x: BitShareTensor, op_id: str) -> torch.Tensor:
+    """Mask the bits with random bits (daBits) to convert them to arithmetic shares.
+
+    The daBits are removed from the store and reserved for :func:`b2a_finish`.
+
+    Args:
+        x (BitShareTensor): Share of the bits.
+        op_id (str): Identifies the conversion.
+
+    Returns:
+        torch.Tensor: Share of the masked bits (packed).
+    """
+    session = get_session(x.session_uuid)
+    crypto_store = session.crypto_store
+
+    primitives = crypto_store.get_primitives_from_store("dabit", x.numel(), remove=True)
+    crypto_store.store[(RESERVED_DABITS, str(op_id))] = primitives
+
+    r_packed, _ = primitives
+    return x.tensor ^ r_packed
+
+
+def b2a_finish(
+    session_uuid_str: str, c_packed: torch.Tensor, shape: Tuple[int, ...], op_id: str
+) -> ShareTensor:
+    """Compute the arithmetic share of the bits from the opened masked bits.
+
+    If "c = x xor r" then "x = c + r - 2 * c * r", where "c" is public and "r" is a
+    daBit (for which the parties hold arithmetic shares).
+
+    Args:
+        session_uuid_str (str): UUID to identify the session on each party side.
+        c_packed (torch.Tensor): The masked bits (packed).
+        shape (Tuple[int, ...]): The shape of the bits.
+        op_id (str): Identifies the conversion.
+
+    Returns:
+        ShareTensor: Arithmetic share of the bits.
+    """
+    session = get_session(session_uuid_str)
+    _, r_share = session.crypto_store.store.pop((RESERVED_DABITS, str(op_id)))
+
+    shape = torch.Size(shape)
+    c = unpack_bits(c_packed, shape).long()
+
+    tensor = (1 - 2 * c) * r_share.tensor.view(shape)
+    if session.rank == 0:
+        tensor += c
+
+    scale = session.config.encoder_base ** session.config.encoder_precision
+    result = ShareTensor(session_uuid=UUID(session_uuid_str), config=session.config)
+    result.tensor = (tensor * scale).to(session.tensor_type)
+    return result
+
+
+def bit_and_mask(
+    x: BitShareTensor, y: BitShareTensor, op_id: str
+) -> Tuple[torch.Tensor, torch.Tensor]:
+    """Mask the bits with a triple of random bits (a, b, a and b).
+
+    The triple is removed from the store and reserved for :func:`bit_and_finish`.
+
+    Args:
+        x (BitShareTensor): Share of the first bits.
+        y (BitShareTensor): Share of the second bits.
+        op_id (str): Identifies the operation.
+
+    Returns:
+        Tuple[torch.Tensor, torch.Tensor]: The shares of "x xor a" and "y xor b".
+
+    Raises:
+        ValueError: If the shapes are different.
+    """
+    if x.shape != y.shape:
+        raise ValueError(f"Shapes do not match {x.shape} {y.shape}")
+
+    session = get_session(x.session_uuid)
+    crypto_store = session.crypto_store
+
+    primitives = crypto_store.get_primitives_from_store(
+        "beaver_bit_and", x.numel(), remove=True
+    )
+    crypto_store.store[(RESERVED_BIT_TRIPLE, str(op_id))] = primitives
+
+    a_packed, b_packed, _ = primitives
+    return x.tensor ^ a_packed, y.tensor ^ b_packed
+
+
+def bit_and_finish(
+    session_uuid_str: str,
+    e_packed: torch.Tensor,
+    f_packed: torch.Tensor,
+    shape: Tuple[int, ...],
+    op_id: str,
+) -> BitShareTensor:
+    """Compute the share of "x and y" from the opened masked bits.
+
+    Args:
+        session_uuid_str (str): UUID to identify the session on each party side.
+        e_packed (torch.Tensor): The opened "x xor a" (packed).
+        f_packed (torch.Tensor): The opened "y xor b" (packed).
+        shape (Tuple[int, ...]): The shape of the bits.
+        op_id (str): Identifies the operation.
+
+    Returns:
+        BitShareTensor: Share of "x and y".
+    """
+    session = get_session(session_uuid_str)
+    a_packed, b_packed, c_packed = session.crypto_store.store.pop(
+        (RESERVED_BIT_TRIPLE, str(op_id))
+    )
+
+    packed = c_packed ^ (e_packed & b_packed) ^ (f_packed & a_packed)
+    if session.rank == 0:
+        packed ^= e_packed & f_packed
+
+    return BitShareTensor.from_packed(packed, shape, UUID(session_uuid_str))
@@ -0,0 +1,187 @@
+"""Lazy execution of the share-local operations applied on a MPCTensor.
+
+When the lazy mode is active for a session (see :meth:`Session.lazy_mode`), the
+linear operations that each party can compute on its own share (add, sub, mul with a
+public value, reshape, transpose, sum...) are only recorded. The recorded operations
+are executed with a single call for each party when the shares are needed - for
+example by a multiplication between two secrets, a comparison or a reconstruction.
+
+Contains functions that are run at:
+
+* the party that orchestrates the computation
+* the parties that hold the shares
+"""
+
+# stdlib
+import operator
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from sympc.session import Session
+from sympc.session import get_session
+from sympc.tensor.share_tensor import ShareTensor
+from sympc.utils import parallel_execution
+
+# Operations between a secret and a public value that are recorded
+LAZY_PUBLIC_OPS = {"add", "sub", "mul", "matmul", "truediv"}
+
+# Operations between two secrets that are recorded
+LAZY_PRIVATE_OPS = {"add", "sub"}
+
+# Methods that are recorded
+LAZY_METHODS = {
+    "reshape",
+    "view",
+    "transpose",
+    "t",
+    "sum",
+    "flatten",
+    "squeeze",
+    "unsqueeze",
+}
+
+# Name of the instruction used for the methods
+METHOD_OP = "method"
+
+
+""" Functions that are executed at the orchestrator """
+
+
+def is_lazy(session: Session) -> bool:
+    """Check if the operations for a session should be recorded.
+
+    Args:
+        session (Session): Session used for the computation.
+
+    Returns:
+        bool: True if the operations should be recorded.
+    """
+    return session.lazy and session.protocol.share_class == ShareTensor
+
+
+def record(
+    session: Session,
+    op_str: str,
+    operands: List[Any],
+    params: List[Any],
+    shape: Tuple[int, ...],
+) -> Any:
+    """Record an operation.
+
+    Args:
+        session (Session): Session used for the computation.
+        op_str (str): The operation.
+        operands (List[MPCTensor]): The secrets on which the operation is applied.
+        params (List[Any]): The public values needed by the operation.
+        shape (Tuple[int, ...]): The shape of the result.
+
+    Returns:
+        Any: A MPCTensor that holds the recorded operation.
+    """
+    from sympc.tensor import MPCTensor
+
+    return MPCTensor(
+        session=session, shape=shape, pending_ops=(op_str, operands, params)
+    )
+
+
+def compile_ops(tensor: Any) -> Tuple[List[Any], List[List[Any]]]:
+    """Transform the graph of recorded operations into a list of instructions.
+
+    The secrets that hold shares (the leaves of the graph) are the inputs of the
+    program. An instruction refers to the input "i" with the value "-i - 1" and to
+    the output of the instruction "j" with the value "j".
+
+    Args:
+        tensor (Any): The MPCTensor with recorded operations.
+
+    Returns:
+        Tuple[List[MPCTensor], List[List[Any]]]: The inputs and the instructions.
+    """
+    inputs: List[Any] = []
+    program: List[List[Any]] = []
+    refs: Dict[int, int] = {}
+
+    stack = [(tensor, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if id(node) in refs:
+            continue
+
+        if node.pending_ops is None:
+            refs[id(node)] = -len(inputs) - 1
+            inputs.append(node)
+            continue
+
+        op_str, operands, params = node.pending_ops
+        if expanded:
+            program.append([op_str, [refs[id(el)] for el in operands], params])
+            refs[id(node)] = len(program) - 1
+        else:
+            stack.append((node, True))
+            stack.extend((el, False) for el in reversed(operands))
+
+    return inputs, program
+
+
+def execute(tensor: Any) -> None:
+    """Execute the recorded operations for a tensor.
+
+    Each party runs all the operations with one call, after this the tensor holds
+    pointers to the resulting shares.
+
+    Args:
+        tensor (Any): The MPCTensor with recorded operations.
+    """
+    session = tensor.session
+    inputs, program = compile_ops(tensor)
+
+    args = [
+        [program] + [el.share_ptrs[rank] for el in inputs]
+        for rank in range(session.nr_parties)
+    ]
+    shares = parallel_execution(run_ops, session.parties)(args)
+
+    tensor.share_ptrs = shares
+    tensor.pending_ops = None
+
+
+""" Functions that are executed at each party that holds shares """
+
+
+def run_ops(program: List[List[Any]], *shares: ShareTensor) -> ShareTensor:
+    """Run the instructions recorded by the orchestrator.
+
+    Args:
+        program (List[List[Any]]): The instructions (see :func:`compile_ops`).
+        *shares (ShareTensor): The inputs for the instructions.
+
+    Returns:
+        ShareTensor: The result of the last instruction.
+    """
+    session = get_session(str(shares[0].session_uuid))
+    values: List[ShareTensor] = []
+
+    for op_str, refs, params in program:
+        op_str = str(op_str)
+        operands = [shares[-ref - 1] if ref < 0 else values[ref] for ref in refs]
+
+        if op_str == METHOD_OP:
+            method_name, method_args, method_kwargs = params
+            method = getattr(operands[0], str(method_name))
+            kwargs = {str(key): value for key, value in method_kwargs.items()}
+            res = method(*method_args, **kwargs)
+        elif len(operands) == 2:
+            res = getattr(operator, op_str)(*operands)
+        elif op_str in {"add", "sub"} and session.rank != 0:
+            # Only the rank 0 party has to add the public value
+            res = operands[0]
+        else:
+            (y,) = params
+            res = getattr(operator, op_str)(operands[0], y)
+
+        values.append(res)
+
+    return values[-1]
@@ -0,0 +1,228 @@
+"""Bits (like the results of comparisons) XOR shared between the parties.
+
+Each party holds a :class:`BitShareTensor` with the bits packed 8 per byte.
+"""
+
+# stdlib
+from functools import reduce
+import operator
+from typing import Any
+from typing import List
+from typing import Tuple
+from typing import Union
+from uuid import uuid4
+
+# third party
+import torch
+
+from sympc.session import Session
+from sympc.tensor.bit_share_tensor import b2a_finish
+from sympc.tensor.bit_share_tensor import b2a_mask
+from sympc.tensor.bit_share_tensor import bit_and_finish
+from sympc.tensor.bit_share_tensor import bit_and_mask
+from sympc.tensor.bit_share_tensor import unpack_bits
+from sympc.tensor.mpc_tensor import MPCTensor
+from sympc.utils import parallel_execution
+
+
+def _open_packed(share_ptrs: List[Any]) -> torch.Tensor:
+    """Get the packed shares from the parties and xor them.
+
+    Args:
+        share_ptrs (List[Any]): Pointers to the packed shares.
+
+    Returns:
+        torch.Tensor: The packed bits.
+    """
+    return reduce(operator.xor, [share_ptr.get() for share_ptr in share_ptrs])
+
+
+class MPCBitTensor:
+    """Bits XOR shared between the parties.
+
+    The "xor" and the "and" with a public value are computed locally, the "and"
+    between two secret values needs a triple of random bits and one round of
+    communication.
+
+    Attributes:
+        session (Session): The session.
+        share_ptrs (List[Any]): Pointers to the BitShareTensors held by the parties.
+        shape (torch.Size): The shape of the bits.
+    """
+
+    __slots__ = {"session", "share_ptrs", "shape"}
+
+    def __init__(
+        self, session: Session, shares: List[Any], shape: Tuple[int, ...]
+    ) -> None:
+        """Initializer.
+
+        Args:
+            session (Session): The session.
+            shares (List[Any]): Pointers to the BitShareTensors held by the parties.
+            shape (Tuple[int, ...]): The shape of the bits.
+        """
+        self.session = session
+        self.share_ptrs = list(shares)
+        self.shape = torch.Size(shape)
+
+    def numel(self) -> int:
+        """Number of bits.
+
+        Returns:
+            int: Number of bits.
+        """
+        return self.shape.numel()
+
+    def xor(self, y: Union["MPCBitTensor", torch.Tensor, int]) -> "MPCBitTensor":
+        """Apply the "xor" operation between "self" and "y".
+
+        Args:
+            y (Union[MPCBitTensor, torch.Tensor, int]): self xor y
+
+        Returns:
+            MPCBitTensor: Result of the operation.
+        """
+        if isinstance(y, MPCBitTensor):
+            shares = [
+                x_share.xor(y_share)
+                for x_share, y_share in zip(self.share_ptrs, y.share_ptrs)
+            ]
+        else:
+            # Only the rank 0 party has to add the public value
+            shares = list(self.share_ptrs)
+            shares[0] = shares[0].xor(torch.as_tensor(y))
+
+        return MPCBitTensor(self.session, shares, self.shape)
+
+    def and_(self, y: Union["MPCBitTensor", torch.Tensor, int]) -> "MPCBitTensor":
+        """Apply the "and" operation between "self" and "y".
+
+        Args:
+            y (Union[MPCBitTensor, torch.Tensor, int]): self and y
+
+        Returns:
+            MPCBitTensor: Result of the operation.
+        """
+        if not isinstance(y, MPCBitTensor):
+            y = torch.as_tensor(y)
+            shares = [share.and_(y) for share in self.share_ptrs]
+            return MPCBitTensor(self.session, shares, self.shape)
+
+        return self._and_private(y)
+
+    def _and_private(self, y: "MPCBitTensor") -> "MPCBitTensor":
+        """Compute the "and" between two secret values with a triple of random bits.
+
+        Args:
+            y (MPCBitTensor): The second value.
+
+        Returns:
+            MPCBitTensor: Result of the operation.
+        """
+        from sympc.store.exceptions import EmptyPrimitiveStore
+
+        session = self.session
+        op_id = uuid4().hex
+        args = [
+            [x_share, y_share, op_id]
+            for x_share, y_share in zip(self.share_ptrs, y.share_ptrs)
+        ]
+
+        try:
+            masks = parallel_execution(bit_and_mask, session.parties)(args)
+        except EmptyPrimitiveStore:
+            _generate_bit_primitives("beaver_bit_and", session, self.numel())
+            masks = parallel_execution(bit_and_mask, session.parties)(args)
+
+        e_shares, f_shares = zip(*masks)
+        e_packed = _open_packed(e_shares)
+        f_packed = _open_packed(f_shares)
+
+        args = [
+            [str(remote_session_uuid), e_packed, f_packed, tuple(self.shape), op_id]
+            for remote_session_uuid in session.rank_to_uuid.values()
+        ]
+        shares = parallel_execution(bit_and_finish, session.parties)(args)
+
+        return MPCBitTensor(session, shares, self.shape)
+
+    def invert(self) -> "MPCBitTensor":
+        """Flip the bits.
+
+        Returns:
+            MPCBitTensor: The flipped bits.
+        """
+        return self.xor(1)
+
+    def reconstruct(self) -> torch.Tensor:
+        """Request and get the shares from all the parties and reconstruct the bits.
+
+        Returns:
+            torch.Tensor: The bits (uint8).
+        """
+        packed = _open_packed([share.get_packed() for share in self.share_ptrs])
+        return unpack_bits(packed, self.shape)
+
+    def to_arithmetic(self) -> MPCTensor:
+        """Convert the bits to arithmetic shares (fixed point encoded).
+
+        Each bit is masked with a random bit for which the parties also hold an
+        arithmetic share (a daBit), the masked bits are opened (packed) and each party
+        computes locally its arithmetic share.
+
+        Returns:
+            MPCTensor: The bits as arithmetic shares.
+        """
+        from sympc.store.exceptions import EmptyPrimitiveStore
+
+        session = self.session
+        op_id = uuid4().hex
+        args = [[share, op_id] for share in self.share_ptrs]
+
+        try:
+            masked = parallel_execution(b2a_mask, session.parties)(args)
+        except EmptyPrimitiveStore:
+            _generate_bit_primitives("dabit", session, self.numel())
+            masked = parallel_execution(b2a_mask, session.parties)(args)
+
+        c_packed = _open_packed(masked)
+
+        args = [
+            [str(remote_session_uuid), c_packed, tuple(self.shape), op_id]
+            for remote_session_uuid in session.rank_to_uuid.values()
+        ]
+        shares = parallel_execution(b2a_finish, session.parties)(args)
+
+        return MPCTensor(shares=shares, session=session, shape=self.shape)
+
+    def __repr__(self) -> str:
+        """Representation.
+
+        Returns:
+            str: The shape of the bits.
+        """
+        return f"[{type(self).__name__}]\n\t| shape: {self.shape}"
+
+    __xor__ = xor
+    __and__ = and_
+    __invert__ = invert
+
+
+def _generate_bit_primitives(op_str: str, session: Session, numel: int) -> None:
+    """Generate the primitives for an operation on bits and send them to the parties.
+
+    Args:
+        op_str (str): The primitive ("dabit" or "beaver_bit_and").
+        session (Session): Session used for the computation.
+        numel (int): Number of bits.
+    """
+    from sympc.store import CryptoPrimitiveProvider
+
+    g_kwargs = {"nr_parties": session.nr_parties, "numel": numel}
+    if op_str == "dabit" and session.ring_size != 2 ** 64:
+        g_kwargs["ring_size"] = session.ring_size
+
+    CryptoPrimitiveProvider.generate_primitives(
+        op_str, session=session, g_kwargs=g_kwargs, p_kwargs={"numel": numel}
+    )
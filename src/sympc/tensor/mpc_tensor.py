@@ -1,6 +1,7 @@
 """Class used to orchestrate the computation on shared values."""
 
 # stdlib
+import asyncio
 import functools
 from functools import lru_cache
 import operator
@@ -21,7 +22,9 @@ from sympc.config import Config
 from sympc.encoder import FixedPointEncoder
 from sympc.session import Session
 from sympc.tensor import ShareTensor
+from sympc.utils import get_ring_from_type
 from sympc.utils import ispointer
+from sympc.utils import op_scope
 
 from .tensor import SyMPCTensor
 
@@ -39,10 +42,23 @@ METHODS_FORWARD_ALL_SHARES = {
     "narrow",
     "dim",
     "transpose",
+    "index_select",
 }
 TRUNCATED_OPS = {"mul", "matmul", "conv2d", "conv_transpose2d"}
 
 
+@lru_cache(maxsize=None)
+def _get_shares_generator() -> torch.Generator:
+    """Get the generator used to split a secret into shares.
+
+    Creating a new generator is expensive, the same one is reused for all the calls.
+
+    Returns:
+        torch.Generator: A cryptographically secure generator.
+    """
+    return csprng.create_random_device_generator()
+
+
 def wrapper_getattribute(func: Callable[..., Any]) -> Callable[..., Any]:
     """Wrapper to make sure that we call __getattribute__ before anything else.
 
@@ -108,6 +124,8 @@ class MPCTensor(metaclass=SyMPCTensor):
         "ctx",
         "parents",
         "nr_out_edges",
+        # Operations recorded in the lazy mode (the shares are not computed yet)
+        "pending_ops",
     }
 
     # Used by the SyMPCTensor metaclass
@@ -125,6 +143,7 @@ class MPCTensor(metaclass=SyMPCTensor):
         "narrow",
         "dim",
         "transpose",
+        "index_select",
     }
     PROPERTIES_FORWARD = {"T"}
 
@@ -135,6 +154,7 @@ class MPCTensor(metaclass=SyMPCTensor):
         shape: Optional[Union[torch.Size, List[int], Tuple[int, ...]]] = None,
         shares: Optional[List[ShareTensor]] = None,
         requires_grad: bool = False,
+        pending_ops: Optional[Tuple[str, List["MPCTensor"], List[Any]]] = None,
     ) -> None:
         """Initializer for the MPCTensor. It can be used in two ways.
 
@@ -154,10 +174,14 @@ class MPCTensor(metaclass=SyMPCTensor):
             shares (Optional[List[ShareTensor]]): In case the shares are already at the
                 parties involved in the computation. Defaults to None
             requires_grad: (bool): Specify if the MPCTensor is required for gradient computation
+            pending_ops (Optional[Tuple[str, List[MPCTensor], List[Any]]]): Operation
+                recorded in the lazy mode - the shares are computed when they are needed.
+                Defaults to None.
 
         Raises:
             ValueError: If session is not provided as argument or in the ShareTensor.
         """
+        self.pending_ops = pending_ops
         self.session = session
 
         if len(self.session.session_ptrs) == 0:
@@ -190,10 +214,14 @@ class MPCTensor(metaclass=SyMPCTensor):
                     tensor_type=tensor_type,
                 )
 
-        if not ispointer(shares[0]):
-            shares = self.session.protocol.distribute_shares(shares, self.session)
+        if pending_ops is None:
+            if not ispointer(shares[0]):
+                shares = self.session.protocol.distribute_shares(shares, self.session)
 
-        self.share_ptrs = shares
+            self.share_ptrs = shares
+        else:
+            # Populated when the recorded operations are executed
+            self.share_ptrs = None
 
         if shape is not None:
             self.shape = shape
@@ -329,31 +357,35 @@ class MPCTensor(metaclass=SyMPCTensor):
                 "Secret should be a ShareTensor, torchTensor, float or int."
             )
 
-        op = operator.sub
-        shape = secret.shape
+        if tensor_type is None:
+            tensor_type = secret.tensor.dtype
 
-        random_shares = []
-        generator = csprng.create_random_device_generator()
-
-        for _ in range(nr_parties - 1):
-            rand_value = torch.empty(size=shape, dtype=tensor_type).random_(
-                generator=generator
-            )
-            share = ShareTensor(data=rand_value, config=config)
-            share.tensor = rand_value
-
-            random_shares.append(share)
+        # Draw all the random values at once - r_0, r_1, ..., r_{n-2}
+        shape = secret.shape
+        rand_values = torch.empty(
+            size=(nr_parties - 1, *shape), dtype=tensor_type
+        ).random_(generator=_get_shares_generator())
+
+        # The shares are the differences between consecutive values from
+        # [0, r_0, r_1, ..., r_{n-2}, secret] (they sum up to the secret)
+        bounds = torch.cat(
+            [
+                rand_values.new_zeros((1, *shape)),
+                rand_values,
+                secret.tensor.to(tensor_type).unsqueeze(0),
+            ]
+        )
+        values = bounds[1:] - bounds[:-1]
 
+        ring_size = get_ring_from_type(tensor_type)
         shares = []
-        for i in range(nr_parties):
-            if i == 0:
-                share = random_shares[i]
-            elif i < nr_parties - 1:
-                share = op(random_shares[i], random_shares[i - 1])
-            else:
-                share = op(secret, random_shares[i - 1])
-
+        for value in values.unbind(0):
+            share = ShareTensor(config=config, ring_size=ring_size)
+            # Each share should own its memory - a view would keep (and might send)
+            # the values of all the shares
+            share.tensor = value.clone()
             shares.append(share)
+
         return shares
 
     def reconstruct(
@@ -372,10 +404,17 @@ class MPCTensor(metaclass=SyMPCTensor):
         Returns:
             torch.Tensor. The secret reconstructed.
         """
-        result = self.session.protocol.share_class.reconstruct(
+        share_class = self.session.protocol.share_class
+
+        kwargs = {}
+        if self.session.transport is not None and share_class is ShareTensor:
+            kwargs["transport"] = self.session.transport
+
+        result = share_class.reconstruct(
             self.share_ptrs,
             get_shares=get_shares,
             security_type=self.session.protocol.security_type,
+            **kwargs,
         )
 
         if get_shares:
@@ -394,6 +433,44 @@ class MPCTensor(metaclass=SyMPCTensor):
 
     get = reconstruct
 
+    async def reconstruct_async(
+        self, decode: bool = True, get_shares: bool = False
+    ) -> Union[torch.Tensor, List[torch.Tensor]]:
+        """Reconstruct the secret without blocking the event loop.
+
+        Args:
+            decode (bool): True if decode using FixedPointEncoder. Defaults to True
+            get_shares (bool): Retrieve only shares.
+
+        Returns:
+            torch.Tensor. The secret reconstructed.
+        """
+        share_class = self.session.protocol.share_class
+        if not hasattr(share_class, "reconstruct_async"):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                None, functools.partial(self.reconstruct, decode, get_shares)
+            )
+
+        result = await share_class.reconstruct_async(
+            self.share_ptrs,
+            get_shares=get_shares,
+            security_type=self.session.protocol.security_type,
+        )
+
+        if get_shares:
+            return result
+
+        if decode:
+            fp_encoder = FixedPointEncoder(
+                base=self.session.config.encoder_base,
+                precision=self.session.config.encoder_precision,
+            )
+
+            result = fp_encoder.decode(result)
+
+        return result
+
     def get_shares(self):
         """Get the shares.
 
@@ -425,6 +502,7 @@ class MPCTensor(metaclass=SyMPCTensor):
         """
         res = self.__apply_op(y, "sub")
         self.share_ptrs = res.share_ptrs
+        self.pending_ops = None
         return self
 
     def sub(self, y: Union["MPCTensor", torch.Tensor, float, int]) -> "MPCTensor":
@@ -471,6 +549,32 @@ class MPCTensor(metaclass=SyMPCTensor):
         """
         return self.__apply_op(y, "matmul")
 
+    async def mul_async(
+        self, y: Union["MPCTensor", torch.Tensor, float, int]
+    ) -> "MPCTensor":
+        """Apply the "mul" operation between "self" and "y" as a coroutine.
+
+        Args:
+            y (Union["MPCTensor", torch.Tensor, float, int]): self * y
+
+        Returns:
+            MPCTensor. Result of the operation.
+        """
+        return await self.__apply_op_async(y, "mul")
+
+    async def matmul_async(
+        self, y: Union["MPCTensor", torch.Tensor, float, int]
+    ) -> "MPCTensor":
+        """Apply the "matmul" operation between "self" and "y" as a coroutine.
+
+        Args:
+            y (Union["MPCTensor", torch.Tensor, float, int]): self @ y
+
+        Returns:
+            MPCTensor. Result of the operation.
+        """
+        return await self.__apply_op_async(y, "matmul")
+
     def conv2d(
         self,
         weight: Union["MPCTensor", torch.Tensor, float, int],
@@ -601,8 +705,15 @@ class MPCTensor(metaclass=SyMPCTensor):
             return self.mul(reciprocal(y))
 
         from sympc.protocol.spdz import spdz
+        from sympc.tensor import lazy
+
+        if lazy.is_lazy(self.session) and self.session.nr_parties == 2:
+            # The division is done locally by each party
+            return lazy.record(self.session, "truediv", [self], [y], self.shape)
+
+        with op_scope("truediv"):
+            result = spdz.public_divide(self, y)
 
-        result = spdz.public_divide(self, y)
         return result
 
     def pow(self, power: int) -> "MPCTensor":
@@ -654,7 +765,6 @@ class MPCTensor(metaclass=SyMPCTensor):
         Raises:
             ValueError: If session from MPCTensor and "y" is not the same.
             TypeError: If MPC tensors are not of same share class
-            NotImplementedError: When op has not been implemented yet
         """
         if self.session.protocol.share_class != y.session.protocol.share_class:
             raise TypeError("Both MPC tensors should be of same share class.")
@@ -670,22 +780,25 @@ class MPCTensor(metaclass=SyMPCTensor):
             from sympc.tensor import ReplicatedSharedTensor
 
             if self.session.protocol.share_class == ShareTensor:
-                result = spdz.mul_master(self, y, op_str, kwargs_)
+                with op_scope(op_str):
+                    result = spdz.mul_master(self, y, op_str, kwargs_)
                 result.shape = MPCTensor._get_shape(op_str, self.shape, y.shape)
 
             elif self.session.protocol.share_class == ReplicatedSharedTensor:
-                if op_str == "mul":
-                    result = Falcon.mul_master(self, y, self.session)
-                    result.shape = MPCTensor._get_shape("mul", self.shape, y.shape)
-                else:
-                    raise NotImplementedError(
-                        f"{op_str} has not implemented for ReplicatedSharedTensor"
-                    )
+                with op_scope(op_str):
+                    result = Falcon.mul_master(self, y, self.session, op_str, kwargs_)
+                result.shape = MPCTensor._get_shape(
+                    op_str, self.shape, y.shape, **kwargs_
+                )
 
             else:
                 raise TypeError("Invalid Share Class")
 
         elif op_str in {"sub", "add"}:
+            from sympc.tensor import lazy
+
+            if lazy.is_lazy(self.session):
+                return lazy.record(self.session, op_str, [self, y], [], self.shape)
 
             op = getattr(operator, op_str)
             shares = [
@@ -714,6 +827,10 @@ class MPCTensor(metaclass=SyMPCTensor):
             TypeError: if share_class is not supported.
         """
         from sympc.tensor import ReplicatedSharedTensor
+        from sympc.tensor import lazy
+
+        if lazy.is_lazy(self.session) and op_str in lazy.LAZY_PUBLIC_OPS:
+            return lazy.record(self.session, op_str, [self], [y], self.shape)
 
         op = getattr(operator, op_str)
         if op_str in {"mul", "matmul"}:
@@ -783,13 +900,15 @@ class MPCTensor(metaclass=SyMPCTensor):
                 self.session.config.encoder_base
                 ** self.session.config.encoder_precision
             )
-            result = input_tensor.truediv(scale)
+            with op_scope("truncate"):
+                result = input_tensor.truediv(scale)
         elif (
             op_str in TRUNCATED_OPS
             and (not is_private)
             and self.session.protocol.share_class == ReplicatedSharedTensor
         ):
-            result = ABY3.truncate(input_tensor, self.session)
+            with op_scope("truncate"):
+                result = ABY3.truncate(input_tensor, self.session)
         else:
             result = input_tensor
 
@@ -832,6 +951,59 @@ class MPCTensor(metaclass=SyMPCTensor):
 
         return result
 
+    async def __apply_op_async(
+        self,
+        y: Union["MPCTensor", torch.Tensor, float, int],
+        op_str: str,
+        kwargs_: Dict[Any, Any] = {},
+    ) -> "MPCTensor":
+        """Apply an operation on "self" and "y" without blocking the event loop.
+
+        The SPDZ multiplication between two secrets is awaited natively, the other
+        cases run the synchronous implementation in the default executor.
+
+        Args:
+            y: tensor to apply the operation.
+            op_str: the operation.
+            kwargs_ (dict): kwargs for some operations like conv2d
+
+        Returns:
+            MPCTensor. the operation "op_str" applied on "self" and "y"
+
+        Raises:
+            ValueError: If session from MPCTensor and "y" is not the same.
+        """
+        loop = asyncio.get_running_loop()
+
+        is_private = isinstance(y, MPCTensor)
+        if not (
+            is_private
+            and op_str in TRUNCATED_OPS
+            and self.session.protocol.share_class == ShareTensor
+            and y.session.protocol.share_class == ShareTensor
+        ):
+            return await loop.run_in_executor(
+                None, functools.partial(self.__apply_op, y, op_str, kwargs_)
+            )
+
+        if y.session.uuid != self.session.uuid:
+            raise ValueError(
+                f"Need same session {self.session.uuid} and {y.session.uuid}"
+            )
+
+        from sympc.protocol.spdz import spdz
+
+        with op_scope(op_str):
+            result = await spdz.mul_master_async(self, y, op_str, kwargs_)
+        result.shape = MPCTensor._get_shape(op_str, self.shape, y.shape, **kwargs_)
+
+        if self.session.nr_parties > 2:
+            result = await loop.run_in_executor(
+                None, self.truncate, result, op_str, is_private
+            )
+
+        return result
+
     def __len__(self) -> int:
         """Return the length of MPCTensor.
 
@@ -874,6 +1046,15 @@ class MPCTensor(metaclass=SyMPCTensor):
         Returns:
             The attribute specific for this instance
         """
+        if attr_name == "share_ptrs":
+            # In the lazy mode the shares are computed only when they are needed
+            if object.__getattribute__(self, "pending_ops") is not None:
+                from sympc.tensor import lazy
+
+                lazy.execute(self)
+
+            return object.__getattribute__(self, attr_name)
+
         # TODO: Fix this
         from sympc.grads import GRAD_FUNCS
         from sympc.tensor.static import STATIC_FUNCS
@@ -1009,6 +1190,17 @@ class MPCTensor(metaclass=SyMPCTensor):
         def method_all_shares(
             _self: "MPCTensor", *args: List[Any], **kwargs: Dict[Any, Any]
         ) -> Any:
+            from sympc.tensor import lazy
+
+            if lazy.is_lazy(_self.session) and method_name in lazy.LAZY_METHODS:
+                new_shape = getattr(torch.empty(_self.shape), method_name)(
+                    *args, **kwargs
+                ).shape
+                params = [method_name, list(args), dict(kwargs)]
+                return lazy.record(
+                    _self.session, lazy.METHOD_OP, [_self], params, new_shape
+                )
+
             shares = []
 
             for share in _self.share_ptrs:
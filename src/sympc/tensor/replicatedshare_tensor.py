@@ -2,6 +2,7 @@
 
 # stdlib
 import operator
+import time
 from typing import Any
 from typing import Callable
 from typing import Dict
@@ -20,8 +21,12 @@ from sympc.encoder import FixedPointEncoder
 from sympc.session import Session
 from sympc.tensor import ShareTensor
 from sympc.utils import get_type_from_ring
+from sympc.utils import is_recording
 from sympc.utils import islocal
 from sympc.utils import parallel_execution
+from sympc.utils import payload_nbytes
+from sympc.utils import record_round
+from sympc.utils import send_to_party
 
 from .tensor import SyMPCTensor
 
@@ -302,18 +307,21 @@ class ReplicatedSharedTensor(metaclass=SyMPCTensor):
         """
         return self.__apply_op(y, "sub")
 
-    def mul(self, y: Union[int, float, torch.Tensor]) -> "ReplicatedSharedTensor":
-        """Apply the "mul" operation between "self" and "y".
+    def __apply_mul_op(
+        self, y: Union[int, float, torch.Tensor, "ReplicatedSharedTensor"], op_str: str
+    ) -> "ReplicatedSharedTensor":
+        """Apply a multiplication operation ("mul" or "matmul") on "self" and "y".
 
         Args:
-            y: self*y
+            y (Union[int, float, torch.Tensor, "ReplicatedSharedTensor"]): Tensor to
+                apply the operation.
+            op_str (str): The operation.
 
         Returns:
             ReplicatedSharedTensor: Result of the operation.
 
         Raises:
             ValueError: Raised when private mul is performed parties!=3.
-
         """
         y_tensor, session = self.sanity_checks(self, y)
         is_private = isinstance(y, ReplicatedSharedTensor)
@@ -322,13 +330,14 @@ class ReplicatedSharedTensor(metaclass=SyMPCTensor):
             if session.nr_parties == 3:
                 from sympc.protocol import Falcon
 
-                result = [Falcon.multiplication_protocol(self, y_tensor)]
+                result = [Falcon.multiplication_protocol(self, y_tensor, op_str)]
             else:
                 raise ValueError(
                     "Private mult between ReplicatedSharedTensors is allowed only for 3 parties"
                 )
         else:
-            result = [share * y_tensor.shares[0] for share in self.shares]
+            op = getattr(operator, op_str)
+            result = [op(share, y_tensor.shares[0]) for share in self.shares]
 
         tensor = ReplicatedSharedTensor(
             ring_size=self.ring_size, session_uuid=self.session_uuid, config=self.config
@@ -337,6 +346,17 @@ class ReplicatedSharedTensor(metaclass=SyMPCTensor):
 
         return tensor
 
+    def mul(self, y: Union[int, float, torch.Tensor]) -> "ReplicatedSharedTensor":
+        """Apply the "mul" operation between "self" and "y".
+
+        Args:
+            y: self*y
+
+        Returns:
+            ReplicatedSharedTensor: Result of the operation.
+        """
+        return self.__apply_mul_op(y, "mul")
+
     def truediv(self, y: Union[int, torch.Tensor]) -> "ReplicatedSharedTensor":
         """Apply the "div" operation between "self" and "y".
 
@@ -377,27 +397,36 @@ class ReplicatedSharedTensor(metaclass=SyMPCTensor):
         res.shares = [share >> y for share in self.shares]
         return res
 
-    def matmul(self, y):
+    def matmul(
+        self, y: Union[torch.Tensor, "ReplicatedSharedTensor"]
+    ) -> "ReplicatedSharedTensor":
         """Apply the "matmul" operation between "self" and "y".
 
         Args:
-            y: self@y
+            y (Union[torch.Tensor, "ReplicatedSharedTensor"]): self@y
 
-        Raises:
-            NotImplementedError: Raised when implementation not present
+        Returns:
+            ReplicatedSharedTensor: Result of the operation.
         """
-        raise NotImplementedError
+        return self.__apply_mul_op(y, "matmul")
 
-    def rmatmul(self, y):
+    def rmatmul(self, y: torch.Tensor) -> "ReplicatedSharedTensor":
         """Apply the "rmatmul" operation between "y" and "self".
 
         Args:
-            y: self@y
+            y (torch.Tensor): y@self
 
-        Raises:
-            NotImplementedError: Raised when implementation not present
+        Returns:
+            ReplicatedSharedTensor: Result of the operation.
         """
-        raise NotImplementedError
+        y_tensor, _ = self.sanity_checks(self, y)
+
+        tensor = ReplicatedSharedTensor(
+            ring_size=self.ring_size, session_uuid=self.session_uuid, config=self.config
+        )
+        tensor.shares = [y_tensor.shares[0] @ share for share in self.shares]
+
+        return tensor
 
     def xor(self, y):
         """Apply the "xor" operation between "self" and "y".
@@ -519,9 +548,15 @@ class ReplicatedSharedTensor(metaclass=SyMPCTensor):
         """
         request = ReplicatedSharedTensor._request_and_get
         request_wrap = parallel_execution(request)
+        start = time.perf_counter()
         args = [[share] for share in share_ptrs[:2]]
         local_shares = request_wrap(args)
 
+        if is_recording():
+            ReplicatedSharedTensor._record_reconstruct(
+                share_ptrs[:2], local_shares, time.perf_counter() - start
+            )
+
         shares = [local_shares[0].shares[0]]
         shares.extend(local_shares[1].shares)
 
@@ -552,9 +587,15 @@ class ReplicatedSharedTensor(metaclass=SyMPCTensor):
         # Get shares from all parties
         request = ReplicatedSharedTensor._request_and_get
         request_wrap = parallel_execution(request)
+        start = time.perf_counter()
         args = [[share] for share in share_ptrs]
         local_shares = request_wrap(args)
 
+        if is_recording():
+            ReplicatedSharedTensor._record_reconstruct(
+                share_ptrs, local_shares, time.perf_counter() - start
+            )
+
         all_shares = [rst.shares for rst in local_shares]
         # reconstruct shares from all parties and verify
         value = None
@@ -575,6 +616,27 @@ class ReplicatedSharedTensor(metaclass=SyMPCTensor):
 
         return value
 
+    @staticmethod
+    def _record_reconstruct(
+        share_ptrs: List["ReplicatedSharedTensor"],
+        local_shares: List["ReplicatedSharedTensor"],
+        elapsed: float,
+    ) -> None:
+        """Record the communication done to get the shares from the parties.
+
+        Args:
+            share_ptrs (List[ReplicatedSharedTensor]): The pointers to the shares.
+            local_shares (List[ReplicatedSharedTensor]): The shares that were received.
+            elapsed (float): Time spent (in seconds).
+        """
+        record_round(
+            [share_ptr.client for share_ptr in share_ptrs],
+            [0] * len(share_ptrs),
+            [payload_nbytes(share) for share in local_shares],
+            elapsed,
+            "reconstruct",
+        )
+
     @staticmethod
     def reconstruct(
         share_ptrs: List["ReplicatedSharedTensor"],
@@ -648,7 +710,8 @@ class ReplicatedSharedTensor(metaclass=SyMPCTensor):
             party_shares,
             config=Config(encoder_base=1, encoder_precision=0),
             session_uuid=session.rank_to_uuid[party_rank],
-        ).send(party)
+        )
+        tensor = send_to_party(tensor, party)
 
         return tensor
 
@@ -680,7 +743,26 @@ class ReplicatedSharedTensor(metaclass=SyMPCTensor):
             [shares, party_rank, session] for party_rank in range(session.nr_parties)
         ]
 
-        return [ReplicatedSharedTensor.distribute_shares_to_party(*arg) for arg in args]
+        start = time.perf_counter()
+        share_ptrs = [
+            ReplicatedSharedTensor.distribute_shares_to_party(*arg) for arg in args
+        ]
+
+        if is_recording():
+            # Each party receives all the shares, except the previous one
+            share_nbytes = [payload_nbytes(share) for share in shares]
+            record_round(
+                session.parties,
+                [
+                    sum(share_nbytes) - share_nbytes[rank - 1]
+                    for rank in range(session.nr_parties)
+                ],
+                [0] * len(shares),
+                time.perf_counter() - start,
+                "distribute_shares",
+            )
+
+        return share_ptrs
 
     @staticmethod
     def hook_property(property_name: str) -> Any:
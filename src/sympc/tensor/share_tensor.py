@@ -2,6 +2,7 @@
 
 # stdlib
 import operator
+import time
 from typing import Any
 from typing import Callable
 from typing import Dict
@@ -18,12 +19,93 @@ import sympc
 from sympc.config import Config
 from sympc.encoder import FixedPointEncoder
 from sympc.session import Session
+from sympc.utils import get_transport
 from sympc.utils import get_type_from_ring
+from sympc.utils import is_recording
 from sympc.utils import islocal
 from sympc.utils import parallel_execution
+from sympc.utils import parallel_execution_async
+from sympc.utils import payload_nbytes
+from sympc.utils import record_round
+from sympc.utils import send_to_party
 
 from .tensor import SyMPCTensor
 
+
+def _request_and_get(share_ptr: "ShareTensor") -> "ShareTensor":
+    """Function used to request and get a share - Duet Setup.
+
+    Args:
+        share_ptr (ShareTensor): a ShareTensor
+
+    Returns:
+        ShareTensor. The ShareTensor in local.
+
+    """
+    if not islocal(share_ptr):
+        share_ptr.request(block=True)
+    res = share_ptr.get_copy()
+    return res
+
+
+def load_share(
+    session_uuid_str: str, transport_name: str, descriptor: List[Any]
+) -> "ShareTensor":
+    """Load a share that was exported by the orchestrator with a transport.
+
+    Args:
+        session_uuid_str (str): UUID to identify the session on each party side.
+        transport_name (str): Name of the transport (see sympc.utils.transport).
+        descriptor (List[Any]): The descriptor of the share.
+
+    Returns:
+        ShareTensor: The share.
+    """
+    session = sympc.session.get_session(session_uuid_str)
+    share = ShareTensor(
+        session_uuid=UUID(session_uuid_str),
+        config=session.config,
+        ring_size=session.ring_size,
+    )
+    share.tensor = get_transport(transport_name).load(list(descriptor))
+    return share
+
+
+def export_share(share: "ShareTensor", transport_name: str) -> List[Any]:
+    """Export a share with a transport, such that the orchestrator can load it.
+
+    Args:
+        share (ShareTensor): The share.
+        transport_name (str): Name of the transport (see sympc.utils.transport).
+
+    Returns:
+        List[Any]: The descriptor of the share.
+    """
+    # The party keeps using the share
+    return get_transport(transport_name).export(share.tensor, copy=True)
+
+
+def _record_reconstruct(
+    share_ptrs: List["ShareTensor"],
+    local_shares: List["ShareTensor"],
+    elapsed: float,
+) -> None:
+    """Record the communication done to get the shares from the parties.
+
+    Args:
+        share_ptrs (List[ShareTensor]): The pointers to the shares.
+        local_shares (List[ShareTensor]): The shares that were received.
+        elapsed (float): Time spent (in seconds).
+    """
+    record_round(
+        [share_ptr.client for share_ptr in share_ptrs],
+        [0] * len(share_ptrs),
+        [payload_nbytes(share) for share in local_shares],
+        elapsed,
+        "reconstruct",
+    )
+
+
 PROPERTIES_NEW_SHARE_TENSOR: Set[str] = {"T"}
 METHODS_NEW_SHARE_TENSOR: Set[str] = {
     "squeeze",
@@ -40,6 +122,7 @@ METHODS_NEW_SHARE_TENSOR: Set[str] = {
     "dim",
     "transpose",
     "roll",
+    "index_select",
 }
 
 
@@ -95,6 +178,7 @@ class ShareTensor(metaclass=SyMPCTensor):
         "dim",
         "transpose",
         "roll",
+        "index_select",
     }
     PROPERTIES_FORWARD: Set[str] = {"T", "shape"}
 
@@ -492,6 +576,7 @@ class ShareTensor(metaclass=SyMPCTensor):
         share_ptrs: List["ShareTensor"],
         get_shares=False,
         security_type: str = "semi-honest",
+        transport: Optional[str] = None,
     ) -> torch.Tensor:
         """Reconstruct original value from shares.
 
@@ -499,32 +584,59 @@ class ShareTensor(metaclass=SyMPCTensor):
             share_ptrs (List[ShareTensor]): List of sharetensors.
             get_shares (boolean): retrieve shares or reconstructed value.
             security_type (str): Type of security by protocol.
+            transport (Optional[str]): Name of the transport used to get the shares,
+                if None the shares are serialized. Defaults to None.
 
         Returns:
             plaintext/shares (torch.Tensor/List[torch.Tensors]): Plaintext or list of shares.
 
         """
+        if transport is not None:
+            shares = ShareTensor._get_shares_with_transport(share_ptrs, transport)
+            return shares if get_shares else sum(shares)
 
-        def _request_and_get(share_ptr: ShareTensor) -> ShareTensor:
-            """Function used to request and get a share - Duet Setup.
+        request_wrap = parallel_execution(_request_and_get)
 
-            Args:
-                share_ptr (ShareTensor): a ShareTensor
+        start = time.perf_counter()
+        args = [[share] for share in share_ptrs]
+        local_shares = request_wrap(args)
 
-            Returns:
-                ShareTensor. The ShareTensor in local.
+        if is_recording():
+            _record_reconstruct(share_ptrs, local_shares, time.perf_counter() - start)
 
-            """
-            if not islocal(share_ptr):
-                share_ptr.request(block=True)
-            res = share_ptr.get_copy()
-            return res
+        shares = [share.tensor for share in local_shares]
+
+        if get_shares:
+            return shares
+
+        plaintext = sum(shares)
+
+        return plaintext
+
+    @staticmethod
+    async def reconstruct_async(
+        share_ptrs: List["ShareTensor"],
+        get_shares=False,
+        security_type: str = "semi-honest",
+    ) -> torch.Tensor:
+        """Reconstruct original value from shares without blocking the event loop.
 
-        request = _request_and_get
-        request_wrap = parallel_execution(request)
+        Args:
+            share_ptrs (List[ShareTensor]): List of sharetensors.
+            get_shares (boolean): retrieve shares or reconstructed value.
+            security_type (str): Type of security by protocol.
 
+        Returns:
+            plaintext/shares (torch.Tensor/List[torch.Tensors]): Plaintext or list of shares.
+        """
+        request_wrap = parallel_execution_async(_request_and_get)
+
+        start = time.perf_counter()
         args = [[share] for share in share_ptrs]
-        local_shares = request_wrap(args)
+        local_shares = await request_wrap(args)
+
+        if is_recording():
+            _record_reconstruct(share_ptrs, local_shares, time.perf_counter() - start)
 
         shares = [share.tensor for share in local_shares]
 
@@ -535,25 +647,123 @@ class ShareTensor(metaclass=SyMPCTensor):
 
         return plaintext
 
+    @staticmethod
+    def _get_shares_with_transport(
+        share_ptrs: List["ShareTensor"], transport: str
+    ) -> List[torch.Tensor]:
+        """Get the shares from the parties with a transport.
+
+        Only the descriptors of the shares are serialized.
+
+        Args:
+            share_ptrs (List[ShareTensor]): Pointers to the shares.
+            transport (str): Name of the transport.
+
+        Returns:
+            List[torch.Tensor]: The shares.
+
+        Raises:
+            BaseException: If a share can not be loaded (the others are discarded).
+        """
+        parties = [share_ptr.client for share_ptr in share_ptrs]
+
+        start = time.perf_counter()
+        args = [[share_ptr, transport] for share_ptr in share_ptrs]
+        descriptor_ptrs = parallel_execution(export_share, parties)(args)
+        descriptors = parallel_execution(_request_and_get)(
+            [[descriptor_ptr] for descriptor_ptr in descriptor_ptrs]
+        )
+
+        if is_recording():
+            record_round(
+                parties,
+                [0] * len(parties),
+                [0] * len(parties),
+                time.perf_counter() - start,
+                "reconstruct",
+            )
+
+        receiver = get_transport(transport)
+        descriptors = [list(el) for el in descriptors]
+        shares = []
+        try:
+            for descriptor in descriptors:
+                shares.append(receiver.load(descriptor))
+        except BaseException:
+            # The shares that were not loaded will never be
+            for descriptor in descriptors[len(shares) :]:
+                receiver.discard(descriptor)
+            raise
+
+        return shares
+
     @staticmethod
     def distribute_shares(shares: List["ShareTensor"], session: Session):
         """Distribute a list of shares.
 
+        If the session has a transport, only the descriptors of the shares are
+        serialized (see sympc.utils.transport).
+
         Args:
             shares (List[ShareTensor): list of shares to distribute.
             session (Session): Session for which those shares were generated
 
         Returns:
             List of ShareTensorPointers.
+
+        Raises:
+            BaseException: If the shares can not be delivered with the transport (the
+                exported shares are discarded).
         """
         rank_to_uuid = session.rank_to_uuid
         parties = session.parties
 
+        if session.transport is not None:
+            transport = get_transport(session.transport)
+
+            start = time.perf_counter()
+            descriptors = []
+            try:
+                for share in shares:
+                    descriptors.append(transport.export(share.tensor))
+
+                args = [
+                    [str(uuid), session.transport, descriptor]
+                    for uuid, descriptor in zip(rank_to_uuid.values(), descriptors)
+                ]
+                share_ptrs = parallel_execution(load_share, parties)(args)
+            except BaseException:
+                # The parties that did not load their share will never do it
+                for descriptor in descriptors:
+                    transport.discard(descriptor)
+                raise
+
+            if is_recording():
+                record_round(
+                    parties,
+                    [0] * len(shares),
+                    [0] * len(shares),
+                    time.perf_counter() - start,
+                    "distribute_shares",
+                )
+
+            return share_ptrs
+
+        start = time.perf_counter()
         share_ptrs = []
         for rank, share in enumerate(shares):
             share.session_uuid = rank_to_uuid[rank]
             party = parties[rank]
-            share_ptrs.append(share.send(party))
+            share_ptrs.append(send_to_party(share, party))
+
+        if is_recording():
+            record_round(
+                parties,
+                [payload_nbytes(share) for share in shares],
+                [0] * len(shares),
+                time.perf_counter() - start,
+                "distribute_shares",
+            )
 
         return share_ptrs
 
@@ -15,11 +15,30 @@ from uuid import UUID
 import numpy as np
 import torch
 
+from sympc.encoder import FixedPointEncoder
 from sympc.session import get_session
 from sympc.tensor.mpc_tensor import MPCTensor
 from sympc.tensor.share_tensor import ShareTensor
 from sympc.utils import parallel_execution
 
+ARGMAX_METHODS = {"auto", "pairwise", "tree"}
+
+# Above this number of values in a row, the "auto" method computes the maximum with a
+# tree reduction (the pairwise comparisons for a row grow quadratically)
+PAIRWISE_MAX_ROW_LENGTH = 2 ** 7
+
+COMPARISON_OPS = {"le", "ge", "lt", "gt", "eq", "ne"}
+
+# The comparison that gives the same result when the values are swapped
+SWAPPED_COMPARISON_OPS = {
+    "le": "ge",
+    "ge": "le",
+    "lt": "gt",
+    "gt": "lt",
+    "eq": "eq",
+    "ne": "ne",
+}
+
 
 def stack(tensors: List, dim: int = 0) -> MPCTensor:
     """Concatenates a sequence of tensors along a new dimension.
@@ -37,7 +56,7 @@ def stack(tensors: List, dim: int = 0) -> MPCTensor:
     args = list(
         zip(
             [str(uuid) for uuid in session.rank_to_uuid.values()],
-            *[tensor.share_ptrs for tensor in tensors]
+            *[tensor.share_ptrs for tensor in tensors],
         )
     )
 
@@ -86,7 +105,7 @@ def cat(tensors: List, dim: int = 0) -> MPCTensor:
     args = list(
         zip(
             [str(uuid) for uuid in session.rank_to_uuid.values()],
-            *[tensor.share_ptrs for tensor in tensors]
+            *[tensor.share_ptrs for tensor in tensors],
         )
     )
 
@@ -118,21 +137,104 @@ def cat_share_tensor(session_uuid_str: str, *shares: Tuple[ShareTensor]) -> Shar
     return result
 
 
+def _select_argmax_method(
+    x: MPCTensor, dim: Optional[Union[int, Tuple[int]]], method: str
+) -> str:
+    """Choose the method used to compute the maximum.
+
+    The pairwise method needs a constant number of rounds, but it compares each value
+    with all the other values from its row - the comparisons grow quadratically with
+    the length of the rows (and only linearly with their number). When the rows have
+    more than PAIRWISE_MAX_ROW_LENGTH values the tree reduction is used.
+
+    Args:
+        x (MPCTensor): the MPCTensor on which the maximum is computed
+        dim (Union[int, Tuple[int]): the dimension over which the maximum is computed
+        method (str): "pairwise", "tree" or "auto"
+
+    Returns:
+        str: "pairwise" or "tree"
+
+    Raises:
+        ValueError: If the method is not supported
+    """
+    if method not in ARGMAX_METHODS:
+        raise ValueError(f"Method {method} not supported, use one of {ARGMAX_METHODS}")
+
+    if method != "auto":
+        return method
+
+    row_length = int(np.prod(x.shape)) if dim is None else x.shape[dim]
+    if row_length > PAIRWISE_MAX_ROW_LENGTH:
+        return "tree"
+
+    return "pairwise"
+
+
+def helper_max_tree(
+    x: MPCTensor, dim: Optional[Union[int, Tuple[int]]] = None
+) -> Tuple[MPCTensor, MPCTensor]:
+    """Compute the maximum by comparing the values two by two, like in a tournament.
+
+    Each round halves the number of values - there are log2(row_length) rounds and
+    (row_length - 1) comparisons for each row. The one hot vector is computed with a
+    last comparison against the maximum.
+
+    Args:
+        x (MPCTensor): the MPCTensor on which to compute the maximum
+        dim (Union[int, Tuple[int]): compute the maximum over a specific dimension
+
+    Returns:
+        Tuple[MPCTensor, MPCTensor]: the maximum (keeping the reduced dimension) and the
+        one hot encoding of its position
+    """
+    # The values are reduced over the first dimension
+    rows = x.flatten() if dim is None else x.transpose(0, dim)
+
+    values = rows
+    while values.shape[0] > 1:
+        half = values.shape[0] // 2
+        first = values.narrow(0, 0, half)
+        second = values.narrow(0, half, half)
+
+        is_first = first >= second
+        res = second + is_first * (first - second)
+
+        if values.shape[0] % 2:
+            # The last value goes to the next round
+            res = cat([res, values.narrow(0, 2 * half, 1)])
+
+        values = res
+
+    repeats = [rows.shape[0]] + [1] * (len(rows.shape) - 1)
+    one_hot = rows >= values.repeat(*repeats)
+
+    if dim is not None:
+        values = values.transpose(0, dim)
+        one_hot = one_hot.transpose(0, dim)
+
+    return values, one_hot
+
+
 def helper_argmax(
     x: MPCTensor,
     dim: Optional[Union[int, Tuple[int]]] = None,
     keepdim: bool = False,
     one_hot: bool = False,
+    method: str = "auto",
 ) -> MPCTensor:
-    """Compute argmax using pairwise comparisons. Makes the number of rounds fixed, here it is 2.
+    """Compute argmax using pairwise comparisons or a tree reduction.
 
-    This is inspired from CrypTen.
+    The pairwise comparisons make the number of rounds fixed, here it is 2 - this is
+    inspired from CrypTen. The tree reduction needs log2(row_length) rounds, but only
+    a linear number of comparisons.
 
     Args:
         x (MPCTensor): the MPCTensor on which to compute helper_argmax on
         dim (Union[int, Tuple[int]): compute argmax over a specific dimension(s)
         keepdim (bool): when one_hot is true, keep all the dimensions of the tensor
         one_hot (bool): return the argmax as a one hot vector
+        method (str): "pairwise", "tree" or "auto" (chosen using the size of the tensor)
 
     Returns:
         Given the args, it returns a one hot encoding (as an MPCTensor) or the index
@@ -141,35 +243,17 @@ def helper_argmax(
     Raises:
         ValueError: In case more max values are found and we need to return the index
     """
-    # for each share in MPCTensor
-    #   do the algorithm portrayed in paper (helper_argmax_pairwise)
-    #   results in creating two matrices and subtraction them
-    session = x.session
-
-    prep_x = x.flatten() if dim is None else x
-    args = [
-        [str(uuid), share_ptr_tensor, dim]
-        for uuid, share_ptr_tensor in zip(
-            session.rank_to_uuid.values(), prep_x.share_ptrs
-        )
-    ]
-    shares = parallel_execution(helper_argmax_pairwise, session.parties)(args)
-
-    res_shape = shares[0].shape.get()
-    x_pairwise = MPCTensor(shares=shares, session=x.session, shape=res_shape)
-
-    # with the MPCTensor tensor we check what entries are positive
-    # then we check what columns of M matrix have m-1 non-zero entries after comparison
-    # (by summing over cols)
-    pairwise_comparisons = x_pairwise >= 0
+    method = _select_argmax_method(x, dim, method)
 
     # re-compute row_length
     _dim = -1 if dim is None else dim
     row_length = x.shape[_dim] if x.shape[_dim] > 1 else 2
 
-    result = pairwise_comparisons.sum(0)
-    result = result >= (row_length - 1)
-    res_shape = res_shape[1:]  # Remove the leading dimension because of sum(0)
+    if method == "tree":
+        _, result = helper_max_tree(x, dim=dim)
+        res_shape = result.shape
+    else:
+        result, res_shape = _helper_argmax_one_hot_pairwise(x, dim, row_length)
 
     if not one_hot:
         if dim is None:
@@ -195,24 +279,69 @@ def helper_argmax(
     return result
 
 
+def _helper_argmax_one_hot_pairwise(
+    x: MPCTensor, dim: Optional[Union[int, Tuple[int]]], row_length: int
+) -> Tuple[MPCTensor, Tuple[int, ...]]:
+    """Compute the one hot encoding of the maximum using pairwise comparisons.
+
+    Args:
+        x (MPCTensor): the MPCTensor on which to compute the maximum
+        dim (Union[int, Tuple[int]): compute the maximum over a specific dimension(s)
+        row_length (int): the number of values compared in a row
+
+    Returns:
+        Tuple[MPCTensor, Tuple[int, ...]]: the one hot encoding and its shape
+    """
+    # for each share in MPCTensor
+    #   do the algorithm portrayed in paper (helper_argmax_pairwise)
+    #   results in creating two matrices and subtraction them
+    session = x.session
+
+    prep_x = x.flatten() if dim is None else x
+    args = [
+        [str(uuid), share_ptr_tensor, dim]
+        for uuid, share_ptr_tensor in zip(
+            session.rank_to_uuid.values(), prep_x.share_ptrs
+        )
+    ]
+    shares = parallel_execution(helper_argmax_pairwise, session.parties)(args)
+
+    res_shape = shares[0].shape.get()
+    x_pairwise = MPCTensor(shares=shares, session=x.session, shape=res_shape)
+
+    # with the MPCTensor tensor we check what entries are positive
+    # then we check what columns of M matrix have m-1 non-zero entries after comparison
+    # (by summing over cols)
+    pairwise_comparisons = x_pairwise >= 0
+
+    result = pairwise_comparisons.sum(0)
+    result = result >= (row_length - 1)
+    res_shape = res_shape[1:]  # Remove the leading dimension because of sum(0)
+
+    return result, res_shape
+
+
 def argmax(
     x: MPCTensor,
     dim: Optional[Union[int, Tuple[int]]] = None,
     keepdim=False,
+    method: str = "auto",
 ) -> MPCTensor:
-    """Compute argmax using pairwise comparisons. Makes the number of rounds fixed, here it is 2.
+    """Compute argmax using pairwise comparisons or a tree reduction.
 
-    This is inspired from CrypTen.
+    The pairwise comparisons make the number of rounds fixed, here it is 2 - this is
+    inspired from CrypTen. The tree reduction needs log2(row_length) rounds.
 
     Args:
         x (MPCTensor): the MPCTensor that argmax will be computed on
         dim (Union[int, Tuple[int]): compute argmax over a specific dimension(s)
         keepdim (bool): when one_hot is true and dim is set, keep all the dimensions of the tensor
+        method (str): "pairwise", "tree" or "auto" (chosen using the size of the tensor)
 
     Returns:
         The index of the maximum value as an MPCTensor
     """
-    return helper_argmax(x, dim=dim, keepdim=keepdim, one_hot=False)
+    return helper_argmax(x, dim=dim, keepdim=keepdim, one_hot=False, method=method)
 
 
 def max_mpc(
@@ -220,6 +349,7 @@ def max_mpc(
     dim: Optional[Union[int, Tuple[int]]] = None,
     keepdim: bool = False,
     one_hot: bool = False,
+    method: str = "auto",
 ) -> Union[MPCTensor, Tuple[MPCTensor, MPCTensor]]:
     """Compute the maximum value for an MPCTensor.
 
@@ -228,28 +358,40 @@ def max_mpc(
         dim (Optional[Union[int, Tuple[int]]]): The dimension over which to compute the maximum.
         keepdim (bool): when one_hot is true and dim is set, keep all the dimensions of the tensor
         one_hot (bool): to return the maximum indices as a one hot tensor
+        method (str): "pairwise", "tree" or "auto" (chosen using the size of the tensor)
 
     Returns:
         A tuple representing (max MPCTensor, indices_max MPCTensor)
     """
-    argmax_mpc = helper_argmax(x, dim=dim, keepdim=keepdim, one_hot=True)
-    max_mpc = argmax_mpc * x
-    if dim is None:
-        res = max_mpc.sum()
+    method = _select_argmax_method(x, dim, method)
+
+    if method == "tree":
+        max_mpc, argmax_mpc = helper_max_tree(x, dim=dim)
+        if dim is None:
+            return max_mpc.sum()
+
+        if not keepdim:
+            max_mpc = max_mpc.squeeze(dim)
     else:
+        argmax_mpc = helper_argmax(
+            x, dim=dim, keepdim=keepdim, one_hot=True, method=method
+        )
+        max_mpc = argmax_mpc * x
+        if dim is None:
+            return max_mpc.sum()
 
-        if not one_hot:
-            shape = argmax_mpc.shape
-            size = [1 for _ in range(len(shape))]
-            size[dim] = shape[dim]
-            argmax_mpc = argmax_mpc * torch.Tensor([i for i in range(shape[dim])]).view(
-                size
-            )
-            argmax_mpc = argmax_mpc.sum(dim=dim, keepdim=keepdim)
         max_mpc = max_mpc.sum(dim=dim, keepdim=keepdim)
-        res = max_mpc, argmax_mpc
 
-    return res
+    if not one_hot:
+        shape = argmax_mpc.shape
+        size = [1 for _ in range(len(shape))]
+        size[dim] = shape[dim]
+        argmax_mpc = argmax_mpc * torch.Tensor([i for i in range(shape[dim])]).view(
+            size
+        )
+        argmax_mpc = argmax_mpc.sum(dim=dim, keepdim=keepdim)
+
+    return max_mpc, argmax_mpc
 
 
 def helper_argmax_pairwise(
@@ -285,6 +427,159 @@ def helper_argmax_pairwise(
     return a - b
 
 
+def _comparison_to_fss(
+    x: Union[MPCTensor, torch.Tensor, float, int],
+    y: Union[MPCTensor, torch.Tensor, float, int],
+    op_str: str,
+) -> Tuple[MPCTensor, str, int]:
+    """Rewrite a comparison as a check of "sign * diff <= 0" or "diff == 0".
+
+    Args:
+        x (Union[MPCTensor, torch.Tensor, float, int]): First value.
+        y (Union[MPCTensor, torch.Tensor, float, int]): Second value.
+        op_str (str): The comparison (le, ge, lt, gt, eq or ne).
+
+    Returns:
+        Tuple[MPCTensor, str, int]: The difference, the FSS operation (comp or eq) and
+        the sign that should be applied on the difference.
+
+    Raises:
+        ValueError: If the comparison is not supported or there is no private value.
+    """
+    if op_str not in COMPARISON_OPS:
+        raise ValueError(
+            f"Comparison {op_str} not supported, use one of {COMPARISON_OPS}"
+        )
+
+    if not isinstance(x, MPCTensor):
+        if not isinstance(y, MPCTensor):
+            raise ValueError("At least one of the values should be a MPCTensor")
+
+        x, y = y, x
+        op_str = SWAPPED_COMPARISON_OPS[op_str]
+
+    diff = x - y
+    if op_str in {"lt", "gt"}:
+        # x < y is x - y + 1 <= 0 and x > y is x - y - 1 >= 0 (1 is the smallest
+        # value that can be encoded)
+        fp_encoder = FixedPointEncoder(
+            base=x.session.config.encoder_base,
+            precision=x.session.config.encoder_precision,
+        )
+        one = fp_encoder.decode(1)
+        diff = diff + one if op_str == "lt" else diff - one
+
+    if op_str in {"eq", "ne"}:
+        return diff, "eq", 1
+
+    return diff, "comp", -1 if op_str in {"ge", "gt"} else 1
+
+
+def compare_many(
+    comparisons: List[
+        Tuple[
+            Union[MPCTensor, torch.Tensor, float, int],
+            Union[MPCTensor, torch.Tensor, float, int],
+            str,
+        ]
+    ]
+) -> List[MPCTensor]:
+    """Run multiple comparisons with a single call to the comparison protocol.
+
+    Each comparison is rewritten (locally) as a comparison of a difference with 0, all
+    the differences are flattened and concatenated and compared at once - the keys
+    are generated, the masked values are opened and the keys are evaluated for all
+    the values. The "eq"/"ne" comparisons use other keys than the "le", "ge", "lt" and
+    "gt" comparisons, such that there is one call for each of the two kinds.
+
+    Example:
+        >>> is_positive, in_range = compare_many([(x, 0, "gt"), (y, 5, "le")])
+
+    Args:
+        comparisons (List[Tuple[...]]): The (x, y, op) comparisons, where "op" is one
+            of le, ge, lt, gt, eq and ne. At least one of "x" and "y" should be a
+            MPCTensor.
+
+    Returns:
+        List[MPCTensor]: The result of each comparison, in the same order.
+
+    Raises:
+        ValueError: If there is no comparison.
+    """
+    if not comparisons:
+        raise ValueError("There should be at least one comparison")
+
+    rewritten = [_comparison_to_fss(x, y, op_str) for x, y, op_str in comparisons]
+    session = rewritten[0][0].session
+    protocol = session.get_protocol()
+
+    results: List[Optional[MPCTensor]] = [None] * len(comparisons)
+    for fss_op_str in ("comp", "eq"):
+        positions = [
+            i for i, (_, op_str, _) in enumerate(rewritten) if op_str == fss_op_str
+        ]
+        if not positions:
+            continue
+
+        diffs = [rewritten[i][0] for i in positions]
+        signs = [rewritten[i][2] for i in positions]
+
+        args = list(
+            zip(
+                [str(uuid) for uuid in session.rank_to_uuid.values()],
+                [signs] * session.nr_parties,
+                *[diff.share_ptrs for diff in diffs],
+            )
+        )
+        shares = parallel_execution(helper_compare_many_concat, session.parties)(args)
+        numels = [int(np.prod(diff.shape)) for diff in diffs]
+        values = MPCTensor(shares=shares, session=session, shape=(sum(numels),))
+
+        if fss_op_str == "comp":
+            res = protocol.le(values, 0)
+        else:
+            res = protocol.eq(values, 0)
+
+        offset = 0
+        for i, diff, numel in zip(positions, diffs, numels):
+            results[i] = res.narrow(0, offset, numel).reshape(diff.shape)
+            offset += numel
+
+    for i, (_, _, op_str) in enumerate(comparisons):
+        if op_str == "ne":
+            results[i] = 1 - results[i]
+
+    return results
+
+
+def helper_compare_many_concat(
+    session_uuid_str: str, signs: List[int], *shares: Tuple[ShareTensor]
+) -> ShareTensor:
+    """Helper method that flattens and concatenates the shares of the differences.
+
+    The shares are negated (when the sign is -1) before the concatenation, such that
+    all the values are compared with 0 in the same way.
+
+    Args:
+        session_uuid_str (str): UUID to identify the session on each party side.
+        signs (List[int]): The sign for each share.
+        shares (Tuple[ShareTensor]): Shares of the differences.
+
+    Returns:
+        ShareTensor: Respective shares after concatenation
+    """
+    session = get_session(session_uuid_str)
+    result = ShareTensor(session_uuid=UUID(session_uuid_str), config=session.config)
+
+    result.tensor = torch.cat(
+        [
+            share.tensor.flatten() if sign == 1 else -share.tensor.flatten()
+            for sign, share in zip(signs, shares)
+        ]
+    )
+    return result
+
+
 STATIC_FUNCS: Dict[str, Callable] = {
     "argmax": argmax,
     "max": max_mpc,
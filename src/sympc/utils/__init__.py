@@ -1,21 +1,63 @@
 """Util functions needed around the repository."""
 
+from .channel import Channel
+from .channel import InProcessChannel
+from .channel import get_channel
+from .channel import register_channel
 from .mpc_utils import count_wraps
 from .mpc_utils import decompose
 from .mpc_utils import generate_random_element
 from .mpc_utils import get_new_generator
+from .mpc_utils import get_ring_from_type
 from .mpc_utils import get_type_from_ring
+from .stats import CommunicationStats
+from .stats import is_recording
+from .stats import op_scope
+from .stats import payload_nbytes
+from .stats import record_round
+from .transport import InProcessTransport
+from .transport import SharedMemoryTransport
+from .transport import Transport
+from .transport import get_transport
+from .transport import register_transport
+from .utils import executor_stats
 from .utils import islocal
 from .utils import ispointer
 from .utils import parallel_execution
+from .utils import parallel_execution_async
+from .utils import register_executor
+from .utils import send_to_party
+from .utils import set_executor_max_workers
+from .utils import shutdown_executors
 
 __all__ = [
     "ispointer",
     "islocal",
     "parallel_execution",
+    "parallel_execution_async",
+    "send_to_party",
+    "register_executor",
+    "set_executor_max_workers",
+    "shutdown_executors",
+    "executor_stats",
     "count_wraps",
     "get_new_generator",
     "generate_random_element",
     "get_type_from_ring",
+    "get_ring_from_type",
     "decompose",
+    "CommunicationStats",
+    "op_scope",
+    "is_recording",
+    "payload_nbytes",
+    "record_round",
+    "Channel",
+    "InProcessChannel",
+    "get_channel",
+    "register_channel",
+    "Transport",
+    "InProcessTransport",
+    "SharedMemoryTransport",
+    "get_transport",
+    "register_transport",
 ]
@@ -0,0 +1,143 @@
+"""Channels used by the parties to send values directly to each other.
+
+Some protocols need the parties to open a masked value - instead of sending the shares
+to the orchestrator (that reconstructs the value and sends it back), each party sends
+its share to the other parties through a channel.
+
+A message is identified by a tag (chosen by the orchestrator for each operation) and
+the ranks of the sender and of the receiver.
+"""
+
+# stdlib
+import threading
+from typing import Any
+from typing import Dict
+from typing import Tuple
+
+# The time (in seconds) a party waits for a message
+DEFAULT_TIMEOUT = 60.0
+
+
+class Channel:
+    """Interface for the channels between the parties."""
+
+    def send(self, tag: str, src: int, dst: int, value: Any) -> None:
+        """Send a value to a party.
+
+        Args:
+            tag (str): Identifies the message.
+            src (int): Rank of the sender.
+            dst (int): Rank of the receiver.
+            value (Any): The value.
+
+        Raises:
+            NotImplementedError: If the channel does not implement it.
+        """
+        raise NotImplementedError(f"{type(self).__name__} can not send")
+
+    def recv(
+        self, tag: str, src: int, dst: int, timeout: float = DEFAULT_TIMEOUT
+    ) -> Any:
+        """Receive a value from a party.
+
+        Args:
+            tag (str): Identifies the message.
+            src (int): Rank of the sender.
+            dst (int): Rank of the receiver.
+            timeout (float): Time (in seconds) to wait for the message.
+
+        Raises:
+            NotImplementedError: If the channel does not implement it.
+        """
+        raise NotImplementedError(f"{type(self).__name__} can not receive")
+
+
+class InProcessChannel(Channel):
+    """Channel for the parties that run in the same process (like the VirtualMachines).
+
+    Attributes:
+        messages (Dict[Tuple[str, int, int], Any]): The messages that were sent and not
+            received yet.
+    """
+
+    __slots__ = {"messages", "_cond"}
+
+    def __init__(self) -> None:
+        """Initializer."""
+        self.messages: Dict[Tuple[str, int, int], Any] = {}
+        self._cond = threading.Condition()
+
+    def send(self, tag: str, src: int, dst: int, value: Any) -> None:
+        """Send a value to a party.
+
+        Args:
+            tag (str): Identifies the message.
+            src (int): Rank of the sender.
+            dst (int): Rank of the receiver.
+            value (Any): The value.
+        """
+        with self._cond:
+            self.messages[(tag, src, dst)] = value
+            self._cond.notify_all()
+
+    def recv(
+        self, tag: str, src: int, dst: int, timeout: float = DEFAULT_TIMEOUT
+    ) -> Any:
+        """Receive a value from a party.
+
+        Args:
+            tag (str): Identifies the message.
+            src (int): Rank of the sender.
+            dst (int): Rank of the receiver.
+            timeout (float): Time (in seconds) to wait for the message.
+
+        Returns:
+            Any: The value.
+
+        Raises:
+            TimeoutError: If the message was not sent in time.
+        """
+        key = (tag, src, dst)
+        with self._cond:
+            if not self._cond.wait_for(lambda: key in self.messages, timeout):
+                raise TimeoutError(f"No message from {src} to {dst} for {tag}")
+
+            return self.messages.pop(key)
+
+
+CHANNELS: Dict[str, Channel] = {"in_process": InProcessChannel()}
+
+
+def register_channel(name: str, channel: Channel) -> None:
+    """Register a channel that can be used by the parties.
+
+    Args:
+        name (str): Name of the channel.
+        channel (Channel): The channel.
+
+    Raises:
+        ValueError: If there is already a channel with the same name.
+    """
+    if name in CHANNELS:
+        raise ValueError(f"Channel {name} already registered")
+
+    CHANNELS[name] = channel
+
+
+def get_channel(name: str) -> Channel:
+    """Get a registered channel.
+
+    Args:
+        name (str): Name of the channel.
+
+    Returns:
+        Channel: The channel.
+
+    Raises:
+        ValueError: If there is no channel with that name.
+    """
+    name = str(name)
+    if name not in CHANNELS:
+        raise ValueError(f"Channel {name} not registered")
+
+    return CHANNELS[name]
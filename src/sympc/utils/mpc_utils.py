@@ -18,6 +18,10 @@ RING_SIZE_TO_TYPE = {
     2 ** 64: torch.int64,
 }
 
+TYPE_TO_RING_SIZE = {
+    tensor_type: ring_size for ring_size, tensor_type in RING_SIZE_TO_TYPE.items()
+}
+
 
 def count_wraps(share_list: List[torch.tensor]) -> torch.Tensor:
     """Count overflows and underflows if we reconstruct the original value.
@@ -67,6 +71,24 @@ def get_type_from_ring(ring_size: int) -> torch.dtype:
     return RING_SIZE_TO_TYPE[ring_size]
 
 
+def get_ring_from_type(tensor_type: torch.dtype) -> int:
+    """Ring size/field given the type of a tensor.
+
+    Args:
+        tensor_type (torch.dtype): Type of tensor.
+
+    Returns:
+        int: Ring size.
+
+    Raises:
+        ValueError: If the type is not in `TYPE_TO_RING_SIZE.keys()`.
+    """
+    if tensor_type not in TYPE_TO_RING_SIZE:
+        raise ValueError(f"Tensor type should be in {TYPE_TO_RING_SIZE.keys()}")
+
+    return TYPE_TO_RING_SIZE[tensor_type]
+
+
 def get_new_generator(seed: int) -> torch.Generator:
     """Get a generator that is initialized with seed.
 
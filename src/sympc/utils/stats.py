@@ -0,0 +1,302 @@
+"""Communication accounting for the computation orchestrated on a session.
+
+The orchestrator records each round of communication with the parties (the tensors
+sent with a command, the shares requested back, the primitives transferred by the
+crypto provider). A round is attributed to the outermost operation scope that is
+active (see :func:`op_scope`) - for example "mul", "fss_comp" or "truncate".
+
+The recording is done only while a :class:`CommunicationStats` is used as a context
+manager, such that there is no overhead otherwise.
+
+Example:
+    >>> with session.stats as stats:
+    ...     res = mpc_model(x)
+    >>> print(stats)
+"""
+
+# stdlib
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from dataclasses import field
+import threading
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+# third party
+import torch
+
+# The stats objects that are recording
+_ACTIVE_STATS: List["CommunicationStats"] = []
+
+# The name of the operation for which the communication is done
+_OP_NAME: ContextVar[Optional[str]] = ContextVar("sympc_op_name", default=None)
+
+
+@contextmanager
+def op_scope(op_name: str) -> Iterator[None]:
+    """Attribute the communication done in this scope to an operation.
+
+    If there is already an active scope, the communication is attributed to it (such
+    that the rounds needed by the "truncate" are not reported as "public_divide").
+
+    Args:
+        op_name (str): Name of the operation.
+
+    Yields:
+        None
+    """
+    if _OP_NAME.get() is not None:
+        yield
+        return
+
+    token = _OP_NAME.set(op_name)
+    try:
+        yield
+    finally:
+        _OP_NAME.reset(token)
+
+
+def is_recording() -> bool:
+    """Check if the communication should be recorded.
+
+    Returns:
+        bool: True if there is at least one active recording.
+    """
+    return bool(_ACTIVE_STATS)
+
+
+def payload_nbytes(obj: Any) -> int:
+    """Number of bytes of the tensors from an object (that are sent to a party).
+
+    Pointers do not move any tensor, such that they are not counted.
+
+    Args:
+        obj (Any): The object.
+
+    Returns:
+        int: Number of bytes.
+    """
+    if isinstance(obj, torch.Tensor):
+        return obj.element_size() * obj.nelement()
+
+    if isinstance(obj, (list, tuple)):
+        return sum(payload_nbytes(el) for el in obj)
+
+    if isinstance(obj, dict):
+        return sum(payload_nbytes(el) for el in obj.values())
+
+    # ShareTensor
+    tensor = getattr(obj, "tensor", None)
+    if isinstance(tensor, torch.Tensor):
+        return payload_nbytes(tensor)
+
+    # ReplicatedSharedTensor
+    shares = getattr(obj, "shares", None)
+    if isinstance(shares, list):
+        return payload_nbytes(shares)
+
+    return 0
+
+
+def record_round(
+    parties: Sequence[Any],
+    bytes_sent: Sequence[int],
+    bytes_received: Sequence[int],
+    elapsed: float,
+    op_name: str,
+) -> None:
+    """Record a round of communication with some parties.
+
+    Args:
+        parties (Sequence[Any]): The parties involved in the round.
+        bytes_sent (Sequence[int]): Number of bytes sent to each party.
+        bytes_received (Sequence[int]): Number of bytes received from each party.
+        elapsed (float): Time spent for the round (in seconds).
+        op_name (str): Name of the operation if the round is not done in an
+            operation scope.
+    """
+    op_name = _OP_NAME.get() or op_name
+    for stats in list(_ACTIVE_STATS):
+        stats.record(parties, bytes_sent, bytes_received, elapsed, op_name)
+
+
+@dataclass
+class OpStats:
+    """Communication done for an operation.
+
+    Attributes:
+        rounds (int): Number of communication rounds.
+        bytes_sent (Dict[int, int]): Number of bytes sent to each party (by rank).
+        bytes_received (Dict[int, int]): Number of bytes received from each party
+            (by rank).
+        time (float): Time spent for the communication (in seconds).
+    """
+
+    rounds: int = 0
+    bytes_sent: Dict[int, int] = field(default_factory=dict)
+    bytes_received: Dict[int, int] = field(default_factory=dict)
+    time: float = 0.0
+
+
+class CommunicationStats:
+    """Keep track of the communication done by the orchestrator for a session.
+
+    Attributes:
+        session (Session): The session for which the communication is recorded.
+        ops (Dict[str, OpStats]): The communication done for each operation.
+    """
+
+    __slots__ = {"session", "ops", "_depth", "_lock"}
+
+    def __init__(self, session: Any) -> None:
+        """Initializer.
+
+        Args:
+            session (Any): The session for which the communication is recorded.
+        """
+        self.session = session
+        self.ops: Dict[str, OpStats] = {}
+        self._depth = 0
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "CommunicationStats":
+        """Start recording - the previous records are discarded.
+
+        Returns:
+            CommunicationStats: The stats.
+        """
+        if self._depth == 0:
+            self.reset()
+            _ACTIVE_STATS.append(self)
+
+        self._depth += 1
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Stop recording.
+
+        Args:
+            *args (Any): The exception information (if any).
+        """
+        self._depth -= 1
+        if self._depth == 0:
+            _ACTIVE_STATS.remove(self)
+
+    def reset(self) -> None:
+        """Discard the records."""
+        with self._lock:
+            self.ops = {}
+
+    def record(
+        self,
+        parties: Sequence[Any],
+        bytes_sent: Sequence[int],
+        bytes_received: Sequence[int],
+        elapsed: float,
+        op_name: str,
+    ) -> None:
+        """Record a round of communication if the parties are from this session.
+
+        Args:
+            parties (Sequence[Any]): The parties involved in the round.
+            bytes_sent (Sequence[int]): Number of bytes sent to each party.
+            bytes_received (Sequence[int]): Number of bytes received from each party.
+            elapsed (float): Time spent for the round (in seconds).
+            op_name (str): Name of the operation.
+        """
+        session_parties = self.session.parties
+        ranks = []
+        for party in parties:
+            rank = next(
+                (i for i, el in enumerate(session_parties) if el is party), None
+            )
+            if rank is None:
+                return
+            ranks.append(rank)
+
+        with self._lock:
+            op_stats = self.ops.setdefault(op_name, OpStats())
+            op_stats.rounds += 1
+            op_stats.time += elapsed
+            for rank, sent, received in zip(ranks, bytes_sent, bytes_received):
+                op_stats.bytes_sent[rank] = op_stats.bytes_sent.get(rank, 0) + sent
+                op_stats.bytes_received[rank] = (
+                    op_stats.bytes_received.get(rank, 0) + received
+                )
+
+    @property
+    def rounds(self) -> int:
+        """Total number of communication rounds.
+
+        Returns:
+            int: Number of rounds.
+        """
+        return sum(op_stats.rounds for op_stats in self.ops.values())
+
+    @property
+    def bytes_sent(self) -> int:
+        """Total number of bytes sent to the parties.
+
+        Returns:
+            int: Number of bytes.
+        """
+        return sum(sum(el.bytes_sent.values()) for el in self.ops.values())
+
+    @property
+    def bytes_received(self) -> int:
+        """Total number of bytes received from the parties.
+
+        Returns:
+            int: Number of bytes.
+        """
+        return sum(sum(el.bytes_received.values()) for el in self.ops.values())
+
+    @property
+    def time(self) -> float:
+        """Total time spent for the communication (in seconds).
+
+        Returns:
+            float: Time.
+        """
+        return sum(op_stats.time for op_stats in self.ops.values())
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """Communication done for each operation.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: For each operation the number of rounds, the
+            bytes sent and received for each party and the time spent.
+        """
+        return {
+            op_name: {
+                "rounds": op_stats.rounds,
+                "bytes_sent": dict(op_stats.bytes_sent),
+                "bytes_received": dict(op_stats.bytes_received),
+                "time": op_stats.time,
+            }
+            for op_name, op_stats in self.ops.items()
+        }
+
+    def __str__(self) -> str:
+        """Return the string representation of the stats.
+
+        Returns:
+            str: String representation.
+        """
+        out = f"[{type(self).__name__}]"
+        for op_name, op_stats in sorted(self.ops.items()):
+            sent = sum(op_stats.bytes_sent.values())
+            received = sum(op_stats.bytes_received.values())
+            out = (
+                f"{out}\n\t| {op_name}: rounds {op_stats.rounds}, sent {sent} B, "
+                f"received {received} B, time {op_stats.time:.4f} s"
+            )
+
+        return out
+
+    __repr__ = __str__
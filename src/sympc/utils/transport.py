@@ -0,0 +1,285 @@
+"""Transports used to move the shares between the orchestrator and the parties.
+
+By default a share is serialized by syft when it is sent to a party (or when it is
+received from a party) - the tensor is copied multiple times on the way. When the
+orchestrator and the parties run on the same host, the tensor can be handed over
+through memory that both of them can access, such that only a small descriptor of
+the tensor is serialized.
+
+A transport exports a tensor (the sender should not modify it afterwards) and returns
+a descriptor - a list of strings and integers - that is used by the receiver to load
+the tensor. A descriptor can be loaded only once - if it will not be loaded (the
+delivery failed) the sender discards it.
+"""
+
+# stdlib
+import os
+import tempfile
+import threading
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from uuid import uuid4
+
+# third party
+import numpy as np
+import torch
+
+# Shared memory file system (the files are never written to a disk). The files have
+# random names and are created exclusively, readable only by their owner
+SHM_DIRECTORY = "/dev/shm"  # nosec
+# The files can be read and written only by their owner
+FILE_MODE = 0o600
+
+
+class Transport:
+    """Interface for the transports of the tensors."""
+
+    def export(self, tensor: torch.Tensor, copy: bool = False) -> List[Any]:
+        """Export a tensor, such that it can be loaded by the receiver.
+
+        Args:
+            tensor (torch.Tensor): The tensor.
+            copy (bool): If the sender still uses the tensor (it should be copied).
+                Defaults to False.
+
+        Raises:
+            NotImplementedError: If the transport does not implement it.
+        """
+        raise NotImplementedError(f"{type(self).__name__} can not export")
+
+    def load(self, descriptor: List[Any]) -> torch.Tensor:
+        """Load a tensor that was exported.
+
+        Args:
+            descriptor (List[Any]): The descriptor returned by "export".
+
+        Raises:
+            NotImplementedError: If the transport does not implement it.
+        """
+        raise NotImplementedError(f"{type(self).__name__} can not load")
+
+    def discard(self, descriptor: List[Any]) -> None:
+        """Release a tensor that was exported and will not be loaded.
+
+        Nothing is released by default.
+
+        Args:
+            descriptor (List[Any]): The descriptor returned by "export".
+        """
+
+
+class InProcessTransport(Transport):
+    """Transport for the parties that run in the same process (like VirtualMachines).
+
+    The receiver gets the tensor that was exported, the values are never copied
+    (unless the sender still uses the tensor).
+
+    Attributes:
+        tensors (Dict[str, torch.Tensor]): The tensors that were exported and not
+            loaded yet.
+    """
+
+    __slots__ = {"tensors", "_lock"}
+
+    def __init__(self) -> None:
+        """Initializer."""
+        self.tensors: Dict[str, torch.Tensor] = {}
+        self._lock = threading.Lock()
+
+    def export(self, tensor: torch.Tensor, copy: bool = False) -> List[Any]:
+        """Export a tensor, such that it can be loaded by the receiver.
+
+        Args:
+            tensor (torch.Tensor): The tensor.
+            copy (bool): If the sender still uses the tensor (it should be copied).
+                Defaults to False.
+
+        Returns:
+            List[Any]: The descriptor (the handle of the tensor).
+        """
+        handle = uuid4().hex
+        with self._lock:
+            self.tensors[handle] = tensor.clone() if copy else tensor
+
+        return [handle]
+
+    def load(self, descriptor: List[Any]) -> torch.Tensor:
+        """Load a tensor that was exported.
+
+        Args:
+            descriptor (List[Any]): The descriptor returned by "export".
+
+        Returns:
+            torch.Tensor: The tensor.
+
+        Raises:
+            ValueError: If there is no tensor for the descriptor.
+        """
+        handle = str(descriptor[0])
+        with self._lock:
+            if handle not in self.tensors:
+                raise ValueError(f"No tensor exported for {handle}")
+
+            return self.tensors.pop(handle)
+
+    def discard(self, descriptor: List[Any]) -> None:
+        """Release a tensor that was exported and will not be loaded.
+
+        Args:
+            descriptor (List[Any]): The descriptor returned by "export".
+        """
+        with self._lock:
+            self.tensors.pop(str(descriptor[0]), None)
+
+
+class SharedMemoryTransport(Transport):
+    """Transport for the parties that run in different processes on the same host.
+
+    The tensor is copied once to a file from a shared memory file system. The receiver
+    maps the file (without copying it) and removes it - the memory is released when
+    the tensor is not used anymore.
+
+    The files can be read only by their owner. A sender that fails to deliver a
+    descriptor should discard it, such that the file is removed.
+
+    Attributes:
+        directory (str): The directory where the files are created.
+    """
+
+    __slots__ = {"directory"}
+
+    def __init__(self, directory: Optional[str] = None) -> None:
+        """Initializer.
+
+        Args:
+            directory (Optional[str]): The directory where the files are created.
+                Defaults to the shared memory file system (or the temporary directory
+                if there is none).
+        """
+        if directory is None:
+            directory = SHM_DIRECTORY
+            if not os.path.isdir(directory):
+                directory = tempfile.gettempdir()
+
+        self.directory = directory
+
+    def export(self, tensor: torch.Tensor, copy: bool = False) -> List[Any]:
+        """Export a tensor, such that it can be loaded by the receiver.
+
+        The tensor is always copied (once) to the shared memory.
+
+        Args:
+            tensor (torch.Tensor): The tensor.
+            copy (bool): If the sender still uses the tensor. Defaults to False.
+
+        Returns:
+            List[Any]: The descriptor (the path of the file, the shape and the type).
+
+        Raises:
+            BaseException: If the tensor can not be copied (the file is removed).
+        """
+        array = tensor.detach().cpu().numpy()
+        shape = list(array.shape)
+        dtype = array.dtype.str
+
+        if array.size == 0:
+            return ["", shape, dtype]
+
+        path = os.path.join(self.directory, f"sympc-{uuid4().hex}")
+        fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_RDWR, FILE_MODE)
+        try:
+            with os.fdopen(fd, "r+b") as file:
+                os.ftruncate(file.fileno(), array.nbytes)
+                mapped = np.memmap(
+                    file, dtype=array.dtype, mode="r+", shape=(array.size,)
+                )
+                mapped[:] = array.reshape(-1)
+                mapped.flush()
+                del mapped
+        except BaseException:
+            os.unlink(path)
+            raise
+
+        return [path, shape, dtype]
+
+    def load(self, descriptor: List[Any]) -> torch.Tensor:
+        """Load a tensor that was exported.
+
+        Args:
+            descriptor (List[Any]): The descriptor returned by "export".
+
+        Returns:
+            torch.Tensor: The tensor (that uses the shared memory).
+        """
+        path, shape, dtype = descriptor
+        path = str(path)
+        shape = tuple(int(dim) for dim in shape)
+        dtype = np.dtype(str(dtype))
+
+        if not path:
+            return torch.from_numpy(np.empty(shape, dtype=dtype))
+
+        array = np.memmap(path, dtype=dtype, mode="r+", shape=(int(np.prod(shape)),))
+        # The mapping is kept while the tensor is used
+        os.unlink(path)
+
+        return torch.from_numpy(array).view(shape)
+
+    def discard(self, descriptor: List[Any]) -> None:
+        """Remove the file of a tensor that was exported and will not be loaded.
+
+        Args:
+            descriptor (List[Any]): The descriptor returned by "export".
+        """
+        path = str(descriptor[0])
+        if not path:
+            return
+
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            # The receiver already loaded it
+            pass
+
+
+TRANSPORTS: Dict[str, Transport] = {
+    "in_process": InProcessTransport(),
+    "shared_memory": SharedMemoryTransport(),
+}
+
+
+def register_transport(name: str, transport: Transport) -> None:
+    """Register a transport that can be used to move the shares.
+
+    Args:
+        name (str): Name of the transport.
+        transport (Transport): The transport.
+
+    Raises:
+        ValueError: If there is already a transport with the same name.
+    """
+    if name in TRANSPORTS:
+        raise ValueError(f"Transport {name} already registered")
+
+    TRANSPORTS[name] = transport
+
+
+def get_transport(name: str) -> Transport:
+    """Get a registered transport.
+
+    Args:
+        name (str): Name of the transport.
+
+    Returns:
+        Transport: The transport.
+
+    Raises:
+        ValueError: If there is no transport with that name.
+    """
+    name = str(name)
+    if name not in TRANSPORTS:
+        raise ValueError(f"Transport {name} not registered")
+
+    return TRANSPORTS[name]
@@ -2,18 +2,50 @@
 
 # stdlib
 import asyncio
+from concurrent.futures import Executor
+from concurrent.futures import Future
 from concurrent.futures import ProcessPoolExecutor
 from concurrent.futures import ThreadPoolExecutor
 import functools
 from itertools import repeat
 import operator
+import threading
+import time
 from typing import Any
+from typing import Awaitable
 from typing import Callable
 from typing import Dict
 from typing import List
 from typing import Optional
 from typing import Type
 from typing import Union
+import weakref
+
+from sympc.utils.stats import is_recording
+from sympc.utils.stats import payload_nbytes
+from sympc.utils.stats import record_round
+
+# The executors used by "parallel_execution" are created once and reused by all the
+# calls (and sessions) - creating a pool for each call costs more than the computation
+# itself for small tensors
+_EXECUTORS: Dict[bool, Executor] = {}
+# The tasks submitted to each executor that are not done yet (the retired executors are
+# kept until their tasks are done)
+_EXECUTORS_IN_FLIGHT: Dict[Executor, int] = {}
+_EXECUTORS_LOCK = threading.Lock()
+_EXECUTOR_MAX_WORKERS: Optional[int] = None
+_EXECUTOR_STATS: Dict[str, Union[int, float]] = {
+    "created": 0,
+    "reused": 0,
+    "startup_time": 0.0,
+}
+
+# Other executors (for example the ones used by the protocols at the parties) that are
+# shut down with the executors used by "parallel_execution"
+_REGISTERED_EXECUTORS: "weakref.WeakSet[Executor]" = weakref.WeakSet()
+
+# Keeps track if the current thread is a worker from our thread pool
+_worker_state = threading.local()
 
 
 def ispointer(obj: Any) -> bool:
@@ -43,13 +75,304 @@ def islocal(obj: Any) -> bool:
     return party_type in {"VirtualMachineClient", "DomainClient"}
 
 
+def send_to_party(obj: Any, party: Any) -> Any:
+    """Send an object to a party.
+
+    The parties from the SyMPC runtimes (see sympc.runtime) receive the object
+    themselves, for the syft clients the object is serialized by syft.
+
+    Args:
+        obj (Any): Object to send (the sender should not modify it afterwards).
+        party (Any): The party.
+
+    Returns:
+        Any: Pointer to the object held by the party.
+    """
+    receive = getattr(party, "receive_object", None)
+    if receive is not None:
+        return receive(obj)
+
+    return obj.send(party)
+
+
+def _initializer(event_loop: asyncio.AbstractEventLoop) -> None:
+    """Set the same event loop to other threads/processes.
+
+    This is needed because there are new threads/processes started with
+    the Executor and they do not have have an event loop set
+
+    Args:
+        event_loop (asyncio.AbstractEventLoop): The event loop.
+    """
+    asyncio.set_event_loop(event_loop)
+    _worker_state.is_worker = True
+
+
+def _noop() -> None:
+    """Task used to warm up the workers of a newly created executor."""
+    pass
+
+
+def _retire_executor(executor: Executor) -> None:
+    """Retire an executor, the tasks that were already submitted are still executed.
+
+    The caller should hold "_EXECUTORS_LOCK" and the executor should not be reachable
+    anymore (no task can be submitted to it afterwards).
+
+    Args:
+        executor (Executor): The executor.
+    """
+    executor.shutdown(wait=False)
+    if not _EXECUTORS_IN_FLIGHT.get(executor, 0):
+        _EXECUTORS_IN_FLIGHT.pop(executor, None)
+
+
+def _get_executor(cpu_bound: bool, nr_workers: int, uses_channel: bool) -> Executor:
+    """Get the executor used by "parallel_execution".
+
+    The executor is created at the first call and reused afterwards. If no
+    maximum number of workers was configured, a bigger executor replaces it such
+    that it has at least "nr_workers" workers.
+
+    The tasks that exchange messages between them (over a channel) wait for each
+    other, they should all run at the same time - if the executor does not have
+    enough idle workers, a new executor replaces it.
+
+    The caller should hold "_EXECUTORS_LOCK" while it submits the tasks, such that
+    the executor is not retired in the meantime.
+
+    Args:
+        cpu_bound (bool): If True a process pool is returned, else a thread pool.
+        nr_workers (int): The number of tasks that should run in parallel.
+        uses_channel (bool): If the tasks exchange messages between them.
+
+    Returns:
+        Executor: The executor.
+
+    Raises:
+        ValueError: If the tasks exchange messages between them and the maximum
+            number of workers is smaller than the number of tasks.
+    """
+    executor = _EXECUTORS.get(cpu_bound, None)
+    max_workers = _EXECUTOR_MAX_WORKERS or nr_workers
+
+    if uses_channel and max_workers < nr_workers:
+        raise ValueError(
+            f"{nr_workers} tasks that exchange messages can not run with "
+            f"{max_workers} workers (see set_executor_max_workers)"
+        )
+
+    if executor is not None:
+        large_enough = (
+            _EXECUTOR_MAX_WORKERS is not None or executor._max_workers >= max_workers
+        )
+        idle_workers = executor._max_workers - _EXECUTORS_IN_FLIGHT.get(executor, 0)
+
+        if large_enough and (not uses_channel or idle_workers >= nr_workers):
+            _EXECUTOR_STATS["reused"] += 1
+            return executor
+
+        if _EXECUTOR_MAX_WORKERS is None:
+            max_workers = max(max_workers, executor._max_workers)
+
+        _retire_executor(executor)
+
+    executor_cls: Union[Type[ProcessPoolExecutor], Type[ThreadPoolExecutor]]
+    executor_cls = ProcessPoolExecutor if cpu_bound else ThreadPoolExecutor
+
+    try:
+        event_loop = asyncio.get_event_loop()
+    except RuntimeError:
+        # The executor is created by a thread that has no event loop
+        event_loop = asyncio.new_event_loop()
+
+    start = time.perf_counter()
+    executor = executor_cls(
+        max_workers=max_workers,
+        initializer=_initializer,
+        initargs=(event_loop,),
+    )
+    for future in [executor.submit(_noop) for _ in range(max_workers)]:
+        future.result()
+
+    _EXECUTOR_STATS["startup_time"] = time.perf_counter() - start
+    _EXECUTOR_STATS["created"] += 1
+    _EXECUTORS[cpu_bound] = executor
+
+    return executor
+
+
+def _task_done(executor: Executor, future: Future) -> None:
+    """Keep track of the tasks that are done (and release the retired executors).
+
+    Args:
+        executor (Executor): The executor that ran the task.
+        future (Future): The task.
+    """
+    with _EXECUTORS_LOCK:
+        _EXECUTORS_IN_FLIGHT[executor] -= 1
+        if not _EXECUTORS_IN_FLIGHT[executor] and executor not in _EXECUTORS.values():
+            del _EXECUTORS_IN_FLIGHT[executor]
+
+
+def _submit(
+    cpu_bound: bool,
+    funcs: List[Callable[..., Any]],
+    args: List[List[Any]],
+    kwargs: Dict[Any, Any],
+    uses_channel: bool,
+) -> List[Future]:
+    """Submit a task for each party to the executor used by "parallel_execution".
+
+    Args:
+        cpu_bound (bool): If True the tasks are run by a process pool.
+        funcs (List[Callable[..., Any]]): The function to run for each party.
+        args (List[List[Any]]): Args for each party.
+        kwargs (Dict[Any, Any]): Kwargs (the same for each party).
+        uses_channel (bool): If the tasks exchange messages between them.
+
+    Returns:
+        List[Future]: The tasks.
+    """
+    nr_tasks = len(funcs)
+    with _EXECUTORS_LOCK:
+        executor = _get_executor(cpu_bound, nr_tasks, uses_channel)
+        futures = [
+            executor.submit(funcs[i], *args[i], **kwargs) for i in range(nr_tasks)
+        ]
+        _EXECUTORS_IN_FLIGHT[executor] = (
+            _EXECUTORS_IN_FLIGHT.get(executor, 0) + nr_tasks
+        )
+
+    for future in futures:
+        future.add_done_callback(functools.partial(_task_done, executor))
+
+    return futures
+
+
+def set_executor_max_workers(max_workers: Optional[int] = None) -> None:
+    """Configure the number of workers used by "parallel_execution".
+
+    The running executors are retired and new ones are created at the next call.
+
+    The calls that exchange messages between the parties (over a channel) need a
+    worker for each party - they are rejected if "max_workers" is smaller.
+
+    Args:
+        max_workers (Optional[int]): The maximum number of workers. If None, the
+            executors grow to the number of parties involved in a call. Defaults to None.
+
+    Raises:
+        ValueError: If max_workers is not a positive number.
+    """
+    global _EXECUTOR_MAX_WORKERS
+
+    if max_workers is not None and max_workers <= 0:
+        raise ValueError(f"max_workers should be positive, got {max_workers}")
+
+    with _EXECUTORS_LOCK:
+        for executor in _EXECUTORS.values():
+            _retire_executor(executor)
+
+        _EXECUTORS.clear()
+        _EXECUTOR_MAX_WORKERS = max_workers
+
+
+def register_executor(executor: Executor) -> None:
+    """Register an executor that should be shut down with "shutdown_executors".
+
+    Args:
+        executor (Executor): The executor.
+    """
+    with _EXECUTORS_LOCK:
+        _REGISTERED_EXECUTORS.add(executor)
+
+
+def shutdown_executors(wait: bool = True) -> None:
+    """Shut down the executors used by "parallel_execution" and the registered ones.
+
+    The executors are shared by all the sessions - the tasks that were already
+    submitted are still executed and new executors are created (lazily) if
+    "parallel_execution" is called afterwards.
+
+    Args:
+        wait (bool): Wait for the pending tasks to finish. Defaults to True.
+    """
+    with _EXECUTORS_LOCK:
+        executors = list(_EXECUTORS.values())
+        for executor in executors:
+            _retire_executor(executor)
+
+        _EXECUTORS.clear()
+
+        registered = list(_REGISTERED_EXECUTORS)
+        _REGISTERED_EXECUTORS.clear()
+
+    for executor in registered:
+        executor.shutdown(wait=wait)
+
+    if wait:
+        for executor in executors:
+            executor.shutdown(wait=True)
+
+
+def executor_stats() -> Dict[str, Union[int, float]]:
+    """Statistics about the executors used by "parallel_execution".
+
+    Returns:
+        Dict[str, Union[int, float]]: The number of executors that were created, the
+        number of calls that reused an executor and an estimation of the time saved
+        by not creating (and warming up) a new executor for those calls.
+    """
+    return {
+        "created": _EXECUTOR_STATS["created"],
+        "reused": _EXECUTOR_STATS["reused"],
+        "startup_time_saved": _EXECUTOR_STATS["reused"]
+        * _EXECUTOR_STATS["startup_time"],
+    }
+
+
+def _record_parallel_execution(
+    fn: Callable[..., Any],
+    parties: List[Any],
+    args: List[List[Any]],
+    kwargs: Dict[Any, Any],
+    results: List[Any],
+    elapsed: float,
+) -> None:
+    """Record the communication done to run a function at multiple parties.
+
+    Args:
+        fn (Callable): The function that was run.
+        parties (List[Any]): Clients from syft.
+        args (List[List[Any]]): Args for each party.
+        kwargs (Dict[Any, Any]): Kwargs (the same for each party).
+        results (List[Any]): Results from the parties.
+        elapsed (float): Time spent (in seconds).
+    """
+    kwargs_nbytes = payload_nbytes(kwargs)
+    record_round(
+        parties,
+        [payload_nbytes(party_args) + kwargs_nbytes for party_args in args],
+        [payload_nbytes(res) for res in results],
+        elapsed,
+        fn.__name__,
+    )
+
+
 def parallel_execution(
     fn: Callable[..., Any],
     parties: Union[None, List[Any]] = None,
     cpu_bound: bool = False,
+    uses_channel: bool = False,
 ) -> Callable[..., List[Any]]:
     """Wrap a function such that it can be run in parallel at multiple parties.
 
+    The executor is shared between the calls (see "set_executor_max_workers" and
+    "shutdown_executors"). Calls made from one of its own workers are executed
+    sequentially to avoid waiting for workers that are never released - unless the
+    parties exchange messages between them, then they should run at the same time.
+
     Args:
         fn (Callable): The function to run.
         parties (Union[None, List[Any]]): Clients from syft. If this is set, then the
@@ -58,22 +381,14 @@ def parallel_execution(
             it makes more sense to use processes than threads if it is set then
             processes should be used since they really run in parallel if not then
             it makes sense to use threads since there is no bottleneck on the CPU side
+        uses_channel (bool): If the function exchanges messages between the parties
+            (over a channel), such that all the parties should run it at the same
+            time. Defaults to False.
 
     Returns:
         Callable[..., List[Any]]: A Callable that returns a list of results.
     """
 
-    def initializer(event_loop) -> None:
-        """Set the same event loop to other threads/processes.
-
-        This is needed because there are new threads/processes started with
-        the Executor and they do not have have an event loop set
-
-        Args:
-            event_loop: The event loop.
-        """
-        asyncio.set_event_loop(event_loop)
-
     @functools.wraps(fn)
     def wrapper(
         args: List[List[Any]],
@@ -88,12 +403,6 @@ def parallel_execution(
         Returns:
             List[Any]: Results from the parties
         """
-        executor: Union[Type[ProcessPoolExecutor], Type[ThreadPoolExecutor]]
-        if cpu_bound:
-            executor = ProcessPoolExecutor
-        else:
-            executor = ThreadPoolExecutor
-
         # Each party has a list of args and a dictionary of kwargs
         nr_parties = len(args)
 
@@ -110,18 +419,90 @@ def parallel_execution(
         else:
             funcs = list(repeat(fn, nr_parties))
 
-        futures = []
-        loop = asyncio.get_event_loop()
+        recording = parties and is_recording()
+        if recording:
+            start = time.perf_counter()
+
+        if getattr(_worker_state, "is_worker", False) and not uses_channel:
+            local_shares = [funcs[i](*args[i], **kwargs) for i in range(nr_parties)]
+        else:
+            futures = _submit(cpu_bound, funcs, args, kwargs, uses_channel)
+            local_shares = [f.result() for f in futures]
+
+        if recording:
+            _record_parallel_execution(
+                fn, parties, args, kwargs, local_shares, time.perf_counter() - start
+            )
+
+        return local_shares
+
+    return wrapper
+
+
+def parallel_execution_async(
+    fn: Callable[..., Any],
+    parties: Union[None, List[Any]] = None,
+) -> Callable[..., Awaitable[List[Any]]]:
+    """Wrap a function such that it can be awaited while it runs at multiple parties.
+
+    The calls for each party are run by the executor shared with
+    "parallel_execution" and gathered, such that many operations (coming from
+    different requests) can interleave on the same orchestrator.
+
+    The calls to the parties are blocking - each one holds a worker of the executor
+    until the party answers. At most "max_workers" calls (see
+    "set_executor_max_workers") are in flight at the same time, the other ones wait
+    in the queue of the executor without blocking the event loop.
+
+    Args:
+        fn (Callable): The function to run.
+        parties (Union[None, List[Any]]): Clients from syft. If this is set, then the
+            function should be run remotely. Defaults to None.
+
+    Returns:
+        Callable[..., Awaitable[List[Any]]]: A coroutine function that returns a list
+        of results.
+    """
+
+    @functools.wraps(fn)
+    async def wrapper(
+        args: List[List[Any]],
+        kwargs: Optional[Dict[Any, Dict[Any, Any]]] = None,
+    ) -> List[Any]:
+        """Schedule the calls for each party and wait for all of them.
+
+        Args:
+            args (List[List[Any]]): Args.
+            kwargs (Optional[Dict[Any, Dict[Any, Any]]]): Kwargs. Default to None.
+
+        Returns:
+            List[Any]: Results from the parties
+        """
+        nr_parties = len(args)
+
+        if kwargs is None:
+            kwargs = {}
+
+        if parties:
+            func_name = f"{fn.__module__}.{fn.__qualname__}"
+            attr_getter = operator.attrgetter(func_name)
+            funcs = [attr_getter(party) for party in parties]
+        else:
+            funcs = list(repeat(fn, nr_parties))
+
+        recording = parties and is_recording()
+        if recording:
+            start = time.perf_counter()
 
-        with executor(
-            max_workers=nr_parties, initializer=initializer, initargs=(loop,)
-        ) as executor:
-            for i in range(nr_parties):
-                _args = args[i]
-                _kwargs = kwargs
-                futures.append(executor.submit(funcs[i], *_args, **_kwargs))
+        futures = _submit(False, funcs, args, kwargs, False)
+        local_shares = list(
+            await asyncio.gather(*[asyncio.wrap_future(f) for f in futures])
+        )
 
-        local_shares = [f.result() for f in futures]
+        if recording:
+            _record_parallel_execution(
+                fn, parties, args, kwargs, local_shares, time.perf_counter() - start
+            )
 
         return local_shares
 
@@ -2,7 +2,9 @@
 import pytest
 import torch
 
+from sympc.algorithms.algorithms import argsort
 from sympc.algorithms.algorithms import sort
+from sympc.algorithms.algorithms import topk
 from sympc.session import Session
 from sympc.session import SessionManager
 from sympc.tensor import MPCTensor
@@ -56,3 +58,58 @@ def test_sort_invalidim_exception(get_clients):
 
     with pytest.raises(ValueError):
         sort(mpctensor_list)
+
+
+@pytest.mark.parametrize("ascending", [True, False])
+def test_mpc_sort_tensor(get_clients, ascending):
+    clients = get_clients(2)
+    session = Session(parties=clients)
+    SessionManager.setup_mpc(session)
+
+    secret = torch.Tensor([4, -2, 7, 0, 3, 9, 1])
+    x = MPCTensor(secret=secret, session=session)
+
+    res = sort(x, ascending=ascending).reconstruct()
+    expected, _ = torch.sort(secret, descending=not ascending)
+
+    assert torch.allclose(res, expected)
+
+
+def test_mpc_argsort(get_clients):
+    clients = get_clients(2)
+    session = Session(parties=clients)
+    SessionManager.setup_mpc(session)
+
+    secret = torch.Tensor([4, -2, 7, 0, 3])
+    x = MPCTensor(secret=secret, session=session)
+
+    res = argsort(x).reconstruct()
+
+    assert torch.allclose(res, torch.argsort(secret).float())
+
+
+@pytest.mark.parametrize("largest", [True, False])
+def test_mpc_topk(get_clients, largest):
+    clients = get_clients(2)
+    session = Session(parties=clients)
+    SessionManager.setup_mpc(session)
+
+    secret = torch.Tensor([4, -2, 7, 0, 3, 9])
+    x = MPCTensor(secret=secret, session=session)
+
+    values, indices = topk(x, k=3, largest=largest)
+    expected_values, expected_indices = torch.topk(secret, k=3, largest=largest)
+
+    assert torch.allclose(values.reconstruct(), expected_values)
+    assert torch.allclose(indices.reconstruct(), expected_indices.float())
+
+
+def test_topk_exception(get_clients):
+    clients = get_clients(2)
+    session = Session(parties=clients)
+    SessionManager.setup_mpc(session)
+
+    x = MPCTensor(secret=torch.Tensor([1, 2, 3]), session=session)
+
+    with pytest.raises(ValueError):
+        topk(x, k=4)
@@ -92,6 +92,33 @@ def test_max_pool2d(get_clients, kernel_size, stride, padding) -> None:
     assert np.allclose(res.reconstruct(), res_expected, atol=1e-4)
 
 
+def test_max_pool2d_tree(get_clients) -> None:
+    clients = get_clients(2)
+    session = Session(parties=clients)
+    SessionManager.setup_mpc(session)
+
+    secret = torch.Tensor(
+        [
+            [
+                [0.23, 0.32, 0.62, 2.23, 5.32],
+                [0.2, -0.3, -0.53, -15, 0.32],
+                [0.22, 0.42, -10, -0.55, 2.32],
+                [0.12, 0.22, -10, -0.35, -3.2],
+                [23.12, -4.22, 5.3, -0.12, 6.0],
+            ]
+        ]
+    )
+    mpc = MPCTensor(secret=secret, session=session)
+
+    res, indices = sympc.module.nn.max_pool2d(
+        mpc, kernel_size=3, stride=1, return_indices=True, method="tree"
+    )
+    res_expected = torch.max_pool2d(secret, kernel_size=3, stride=1)
+
+    assert np.allclose(res.reconstruct(), res_expected, atol=1e-4)
+    assert indices.shape == (1, 3, 3, 3, 3)
+
+
 @pytest.mark.order(14)
 def test_max_pool2d_raises_value_error_kernel_gt_input(get_clients) -> None:
     clients = get_clients(2)
@@ -53,7 +53,7 @@ def test_invalid_parties_trunc(get_clients) -> None:
 
 
 @pytest.mark.parametrize("base, precision", [(2, 16), (2, 17), (10, 3), (10, 4)])
-def test_truncation_algorithm1(get_clients, base, precision) -> None:
+def test_truncation_algorithm2(get_clients, base, precision) -> None:
     parties = get_clients(3)
     falcon = Falcon("semi-honest")
     config = Config(encoder_base=base, encoder_precision=precision)
@@ -75,6 +75,57 @@ def test_truncation_algorithm1(get_clients, base, precision) -> None:
     assert np.allclose(result.reconstruct(), expected_res, atol=1e-3)
 
 
+def test_truncation_algorithm2_int32_ring(get_clients) -> None:
+    parties = get_clients(3)
+    falcon = Falcon("semi-honest")
+    session = Session(parties=parties, protocol=falcon, ring_size=2 ** 32)
+    SessionManager.setup_mpc(session)
+
+    x = torch.tensor([[1.24, 4.51, 6.87], [7.87, 13.01, 54.1]])
+    x_mpc = MPCTensor(secret=x, session=session)
+
+    result = ABY3.truncate(x_mpc, session)
+
+    fp_encoder = FixedPointEncoder(
+        base=session.config.encoder_base, precision=session.config.encoder_precision
+    )
+    expected_res = x_mpc.reconstruct(decode=False) // fp_encoder.scale
+    expected_res = fp_encoder.decode(expected_res)
+
+    assert np.allclose(result.reconstruct(), expected_res, atol=1e-2)
+
+
+def test_truncation_pairs_preprocessing(get_clients) -> None:
+    parties = get_clients(3)
+    session = Session(parties=parties, protocol=Falcon("semi-honest"))
+    SessionManager.setup_mpc(session)
+
+    x = torch.tensor([[1.24, -4.51, 6.87], [7.87, 13.01, 54.1]])
+    x_mpc = MPCTensor(secret=x, session=session)
+    shape = tuple(x.shape)
+
+    ABY3.generate_truncation_pairs(session, shape, n_instances=3)
+    for session_ptr in session.session_ptrs:
+        assert session_ptr.crypto_store.available("aby3_trunc_pair", shape).get() == 3
+
+    with session.stats as stats:
+        result = ABY3.truncate(x_mpc, session)
+
+    for session_ptr in session.session_ptrs:
+        assert session_ptr.crypto_store.available("aby3_trunc_pair", shape).get() == 2
+
+    # The pairs are taken from the store - the masked value is opened and sent back
+    assert stats.rounds == 2
+
+    fp_encoder = FixedPointEncoder(
+        base=session.config.encoder_base, precision=session.config.encoder_precision
+    )
+    expected_res = x_mpc.reconstruct(decode=False) // fp_encoder.scale
+    expected_res = fp_encoder.decode(expected_res)
+
+    assert np.allclose(result.reconstruct(), expected_res, atol=1e-3)
+
+
 def test_invalid_parties(get_clients) -> None:
     parties = get_clients(2)
     session = Session(parties=parties)
@@ -92,3 +143,46 @@ def test_invalid_mpc_pointer(get_clients) -> None:
     # passing sharetensor pointer
     with pytest.raises(ValueError):
         ABY3.truncate(x, session)
+
+
+@pytest.mark.parametrize("base, precision", [(2, 16), (10, 4)])
+def test_truncation_between_parties(get_clients, base, precision) -> None:
+    parties = get_clients(3)
+    falcon = Falcon("semi-honest")
+    config = Config(encoder_base=base, encoder_precision=precision)
+    session = Session(parties=parties, protocol=falcon, config=config)
+    session.channel = "in_process"
+    SessionManager.setup_mpc(session)
+
+    x = torch.tensor([[1.24, 4.51, 6.87], [7.87, 1301, -541]])
+    x_mpc = MPCTensor(secret=x, session=session)
+
+    with session.stats as stats:
+        result = ABY3.truncate(x_mpc, session)
+
+    fp_encoder = FixedPointEncoder(
+        base=session.config.encoder_base, precision=session.config.encoder_precision
+    )
+    expected_res = x_mpc.reconstruct(decode=False) // fp_encoder.scale
+    expected_res = fp_encoder.decode(expected_res)
+
+    assert np.allclose(result.reconstruct(), expected_res, atol=1e-3)
+    # A single round, the shares are not sent to the orchestrator
+    assert stats.rounds == 1
+    assert sum(stats.bytes_received.values()) == 0
+
+
+def test_mul_truncation_between_parties(get_clients) -> None:
+    parties = get_clients(3)
+    session = Session(parties=parties, protocol=Falcon("semi-honest"))
+    session.channel = "in_process"
+    SessionManager.setup_mpc(session)
+
+    x_secret = torch.Tensor([[0.125, -1.25], [-4.25, 4]])
+    y_secret = torch.Tensor([[4.5, -2.5], [5, 2.25]])
+    x = MPCTensor(secret=x_secret, session=session)
+    y = MPCTensor(secret=y_secret, session=session)
+
+    result = (x * y).reconstruct()
+
+    assert np.allclose(result, x_secret * y_secret, atol=1e-3)
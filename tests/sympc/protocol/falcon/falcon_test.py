@@ -91,6 +91,55 @@ def test_mul_private_matrix(get_clients, base, precision):
     assert np.allclose(result.reconstruct(), expected_res, atol=1e-3)
 
 
+@pytest.mark.parametrize("base, precision", [(2, 16), (10, 4)])
+def test_matmul_private(get_clients, base, precision):
+    parties = get_clients(3)
+    protocol = Falcon("semi-honest")
+    config = Config(encoder_base=base, encoder_precision=precision)
+    session = Session(protocol=protocol, parties=parties, config=config)
+    SessionManager.setup_mpc(session)
+
+    secret1 = torch.tensor([[-100.25, 20.3, 30.12], [-50.1, 100.217, 1.2]])
+    secret2 = torch.tensor([[-1, 0.28], [-9, 10.18], [32, -23]])
+
+    tensor1 = MPCTensor(secret=secret1, session=session)
+    tensor2 = MPCTensor(secret=secret2, session=session)
+
+    result = tensor1 @ tensor2
+    expected_res = secret1 @ secret2
+    assert result.shape == expected_res.shape
+    assert np.allclose(result.reconstruct(), expected_res, atol=1e-2)
+
+
+@pytest.mark.parametrize("op_str", ["conv2d", "conv_transpose2d"])
+def test_conv_private(get_clients, op_str):
+    parties = get_clients(3)
+    protocol = Falcon("semi-honest")
+    session = Session(protocol=protocol, parties=parties)
+    SessionManager.setup_mpc(session)
+
+    secret = torch.tensor([[[[0.5, -1.25, 3.0], [2.5, 0.75, -4.0], [1.5, 2.0, -0.5]]]])
+    weight = torch.tensor([[[[1.5, -0.25], [0.5, 2.0]]], [[[-1.0, 0.75], [3.0, 1.25]]]])
+    if op_str == "conv_transpose2d":
+        weight = weight.transpose(0, 1)
+
+    x = MPCTensor(secret=secret, session=session)
+    w = MPCTensor(secret=weight, session=session)
+
+    result = getattr(x, op_str)(w, padding=1)
+    expected_res = getattr(torch, op_str)(secret, weight, padding=1)
+    assert result.shape == expected_res.shape
+    assert np.allclose(result.reconstruct(), expected_res, atol=1e-3)
+
+
+def test_multiplication_protocol_invalid_op():
+    x = ReplicatedSharedTensor(shares=[torch.tensor([1]), torch.tensor([2])])
+    y = ReplicatedSharedTensor(shares=[torch.tensor([3]), torch.tensor([4])])
+
+    with pytest.raises(ValueError):
+        Falcon.multiplication_protocol(x, y, "add")
+
+
 @pytest.mark.parametrize("parties", [2, 4])
 def test_mul_private_exception_nothreeparties(get_clients, parties):
     parties = get_clients(parties)
@@ -1,14 +1,22 @@
+# stdlib
+from concurrent.futures import ThreadPoolExecutor
+
 # third party
 import pytest
 import torch
 
 from sympc.protocol import FSS
 from sympc.protocol import Falcon
+from sympc.protocol.fss import fss
+from sympc.protocol.fss.fss import N_CORES
+from sympc.protocol.fss.fss import get_factory
+from sympc.protocol.fss.fss import get_thread_budget
 from sympc.session import Session
 from sympc.session import SessionManager
 from sympc.tensor import MPCTensor
 from sympc.tensor import ShareTensor
 from sympc.utils import ispointer
+from sympc.utils import shutdown_executors
 
 
 def test_share_tensor(get_clients) -> None:
@@ -44,3 +52,140 @@ def test_eq():
 
     # Test different protocol objects
     assert fss != falcon2
+
+
+def test_generate_keys_in_advance(get_clients) -> None:
+    session = Session(parties=get_clients(2))
+    SessionManager.setup_mpc(session)
+
+    FSS.generate_keys(session, n_values=10, op="comp", batch_size=4)
+
+    for session_ptr in session.session_ptrs:
+        assert session_ptr.crypto_store.available("fss_comp").get() == 10
+
+    x = MPCTensor(secret=torch.tensor([-1.0, 0.0, 1.0]), session=session)
+    y = MPCTensor(secret=torch.tensor([0.0, 0.0, 0.0]), session=session)
+
+    res = (x <= y).reconstruct()
+
+    assert (res == torch.tensor([1.0, 1.0, 0.0])).all()
+    for session_ptr in session.session_ptrs:
+        assert session_ptr.crypto_store.available("fss_comp").get() == 7
+
+
+def test_generate_keys_exception() -> None:
+    with pytest.raises(ValueError):
+        FSS.generate_keys(Session(), n_values=0)
+
+
+@pytest.mark.parametrize("op_str, fss_op", [("le", "comp"), ("eq", "eq")])
+def test_comparison_open_between_parties(get_clients, op_str, fss_op) -> None:
+    session = Session(parties=get_clients(2))
+    session.channel = "in_process"
+    SessionManager.setup_mpc(session)
+
+    x_secret = torch.Tensor([[0.125, -1.25], [-4.25, 4]])
+    y_secret = torch.Tensor([[4.5, -1.25], [5, 2.25]])
+    x = MPCTensor(secret=x_secret, session=session)
+    y = MPCTensor(secret=y_secret, session=session)
+
+    with session.stats as stats:
+        result = getattr(x, op_str)(y)
+
+    expected_result = getattr(x_secret, op_str)(y_secret)
+
+    assert (result.reconstruct() == expected_result).all()
+    # The primitives transfer and a single round with the parties
+    assert stats.summary()[f"fss_{fss_op}"]["rounds"] == 2
+
+
+@pytest.mark.parametrize("packed", [False, True])
+def test_comparison_keys_in_advance_single_round(get_clients, packed) -> None:
+    session = Session(parties=get_clients(2))
+    session.channel = "in_process"
+    SessionManager.setup_mpc(session)
+
+    x_secret = torch.Tensor([0.125, -1.25, 4])
+    x = MPCTensor(secret=x_secret, session=session)
+    FSS.generate_keys(session, n_values=3, op="comp")
+
+    with session.stats as stats:
+        result = FSS.le(x, 0, packed=packed)
+
+    # The keys are reserved in the same round as the masked value is opened
+    assert stats.rounds == 1
+
+    if packed:
+        result = result.to_arithmetic()
+    assert (result.reconstruct() == (x_secret <= 0)).all()
+
+
+def test_get_factory() -> None:
+    assert get_factory("eq", 2) is get_factory("eq", 2)
+    assert get_factory("comp", 2) is not get_factory("comp", 1)
+
+    with pytest.raises(ValueError):
+        get_factory("relu", 1)
+
+
+def test_thread_budget() -> None:
+    session = Session()
+    session.nr_parties = 2
+
+    assert get_thread_budget(session, 3) == 3
+    assert get_thread_budget(session) == max(1, N_CORES // 2)
+
+
+@pytest.mark.parametrize("fss_threads", [1, 2])
+def test_comparison_chunked_evaluation(get_clients, monkeypatch, fss_threads) -> None:
+    monkeypatch.setattr(fss, "EVAL_CHUNK_SIZE", 3)
+
+    session = Session(parties=get_clients(2))
+    session.fss_threads = fss_threads
+    SessionManager.setup_mpc(session)
+
+    x_secret = torch.Tensor([[0.125, -1.25, 3], [-4.25, 4, 0]])
+    y_secret = torch.Tensor([[4.5, -1.25, 2], [5, 2.25, 0]])
+    x = MPCTensor(secret=x_secret, session=session)
+    y = MPCTensor(secret=y_secret, session=session)
+
+    assert ((x <= y).reconstruct() == (x_secret <= y_secret)).all()
+    assert ((x == y).reconstruct() == (x_secret == y_secret)).all()
+
+
+def test_eval_executor_per_session() -> None:
+    session = Session()
+    other_session = Session()
+
+    executor = fss._get_eval_executor(session, 2)
+    assert fss._get_eval_executor(session, 2) is executor
+    assert fss._get_eval_executor(other_session, 2) is not executor
+
+    # The pools are shut down with the other executors and created again
+    shutdown_executors()
+    assert fss._get_eval_executor(session, 2) is not executor
+
+    session.shutdown()
+    assert session.executors == {}
+
+
+@pytest.mark.parametrize("channel", [None, "in_process"])
+def test_concurrent_comparisons(get_clients, channel) -> None:
+    session = Session(parties=get_clients(2))
+    session.channel = channel
+    SessionManager.setup_mpc(session)
+
+    secrets = [torch.Tensor([i - 2, 0, 2 - i]) for i in range(5)]
+    values = [MPCTensor(secret=secret, session=session) for secret in secrets]
+    zero = MPCTensor(secret=torch.zeros(3), session=session)
+    FSS.generate_keys(session, n_values=15, op="comp")
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        results = list(executor.map(lambda x: (x <= zero).reconstruct(), values))
+
+    for secret, result in zip(secrets, results):
+        assert (result == (secret <= 0)).all()
+
+    # Each comparison reserved exactly the keys it needed
+    for session_ptr in session.session_ptrs:
+        assert session_ptr.crypto_store.available("fss_comp").get() == 0
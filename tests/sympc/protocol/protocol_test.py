@@ -1,3 +1,6 @@
+# stdlib
+from collections import deque
+
 # third party
 import pytest
 
@@ -6,7 +9,9 @@ from sympc.protocol.beaver.beaver import conv2d_store_get
 from sympc.protocol.beaver.beaver import matmul_store_get
 from sympc.protocol.beaver.beaver import mul_store_get
 from sympc.protocol.fss.fss import _generate_primitive
+from sympc.protocol.fss.fss import add_primitive
 from sympc.protocol.fss.fss import get_primitive
+from sympc.store.crypto_store import get_primitive_key
 from sympc.store.exceptions import EmptyPrimitiveStore
 from sympc.tensor import ShareTensor
 
@@ -54,11 +59,29 @@ def test_exception_unsupported_fss_operation():
 
 def test_exception_insufficient_fss_primitives():
     store = {}
-    store["fss_eq"] = [[10]]
-    with pytest.raises(ValueError):
+    add_primitive(store, [[10]])
+    with pytest.raises(EmptyPrimitiveStore):
         get_primitive(store, 10)
 
 
+def test_fss_primitives_consumed_in_order():
+    store = {}
+    add_primitive(store, [[0], [1], [2]])
+    add_primitive(store, [[3], [4]])
+
+    assert get_primitive(store, 2, remove=False).tolist() == [[0], [1]]
+    assert get_primitive(store, 2).tolist() == [[0], [1]]
+    assert get_primitive(store, 2).tolist() == [[2], [3]]
+
+    queue = store[get_primitive_key("fss_comp")]
+    assert len(queue) == 1
+    assert queue.offset == 1
+
+    assert get_primitive(store, 1).tolist() == [[4]]
+    assert len(queue) == 0
+    assert len(queue.arrays) == 0
+
+
 @pytest.mark.parametrize(
     "function", [mul_store_get, matmul_store_get, conv2d_store_get]
 )
@@ -81,9 +104,9 @@ def test_exception_empty_primitive_store_no_primitive(function):
     b_shape = (2, 2)
 
     store = {
-        "beaver_mul_(2, 2)_(2, 2)": [],
-        "beaver_mat_mul_(2, 2)_(2, 2)": [],
-        "beaver_conv2d_(2, 2)_(2, 2)": [],
+        ("beaver_mul", ((2, 2), (2, 2))): deque(),
+        ("beaver_matmul", ((2, 2), (2, 2))): deque(),
+        ("beaver_conv2d", ((2, 2), (2, 2))): deque(),
     }
 
     with pytest.raises(EmptyPrimitiveStore):
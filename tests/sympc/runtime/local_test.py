@@ -0,0 +1,95 @@
+# third party
+import pytest
+import torch
+
+from sympc.protocol import Falcon
+from sympc.runtime import LocalParty
+from sympc.runtime import LocalPointer
+from sympc.session import Session
+from sympc.session import SessionManager
+from sympc.session import get_session
+from sympc.tensor import MPCTensor
+from sympc.utils import ispointer
+
+
+def get_local_session(nr_parties: int, **kwargs) -> Session:
+    parties = [LocalParty(f"P_{i}") for i in range(nr_parties)]
+    session = Session(parties=parties, **kwargs)
+    SessionManager.setup_mpc(session)
+    return session
+
+
+def test_setup_mpc() -> None:
+    session = get_local_session(3)
+
+    for rank, session_ptr in enumerate(session.session_ptrs):
+        assert ispointer(session_ptr)
+        party_session = session_ptr.get()
+        assert party_session.rank == rank
+        assert party_session.crypto_store is not None
+        assert get_session(session.rank_to_uuid[rank]) is party_session
+
+
+def test_pointer_ops() -> None:
+    party = LocalParty()
+    ptr = party.python.Tuple([torch.tensor([1, 2]), torch.tensor([3, 4])])
+
+    assert isinstance(ptr, LocalPointer)
+    assert ptr.__name__ == "tuplePointer"
+    assert len(ptr) == 2
+
+    x_ptr, y_ptr = ptr
+    assert x_ptr.client is party
+    assert ((x_ptr + y_ptr).get() == torch.tensor([4, 6])).all()
+    assert (x_ptr.sum().get() == 3).all()
+    assert x_ptr.shape.get() == torch.Size([2])
+
+
+def test_pointer_other_party() -> None:
+    alice, bob = LocalParty("alice"), LocalParty("bob")
+    ptr = alice.torch.tensor([1, 2])
+
+    with pytest.raises(ValueError):
+        bob.torch.neg(ptr)
+
+
+@pytest.mark.parametrize("nr_parties", [2, 3])
+@pytest.mark.parametrize("op_str", ["add", "sub", "mul", "matmul"])
+def test_ops_mpc_mpc(nr_parties, op_str) -> None:
+    session = get_local_session(nr_parties)
+
+    x_secret = torch.Tensor([[0.125, -1.25], [-4.25, 4]])
+    y_secret = torch.Tensor([[4.5, -2.5], [5, 2.25]])
+    x = MPCTensor(secret=x_secret, session=session)
+    y = MPCTensor(secret=y_secret, session=session)
+
+    op = getattr(torch.Tensor, op_str)
+    result = op(x, y).reconstruct()
+    expected_result = op(x_secret, y_secret)
+
+    assert torch.allclose(result, expected_result, rtol=10e-4)
+
+
+def test_comparison() -> None:
+    session = get_local_session(2)
+
+    x_secret = torch.Tensor([-2, 0.5, 3, 7])
+    y_secret = torch.Tensor([1, 0.5, -1, 8])
+    x = MPCTensor(secret=x_secret, session=session)
+    y = MPCTensor(secret=y_secret, session=session)
+
+    assert ((x < y).reconstruct() == (x_secret < y_secret).float()).all()
+    assert ((x == y).reconstruct() == (x_secret == y_secret).float()).all()
+
+
+def test_falcon_mul() -> None:
+    session = get_local_session(3, protocol=Falcon())
+
+    x_secret = torch.Tensor([[0.125, -1.25], [-4.25, 4]])
+    y_secret = torch.Tensor([[4.5, -2.5], [5, 2.25]])
+    x = MPCTensor(secret=x_secret, session=session)
+    y = MPCTensor(secret=y_secret, session=session)
+
+    result = (x * y).reconstruct()
+
+    assert torch.allclose(result, x_secret * y_secret, rtol=10e-4)
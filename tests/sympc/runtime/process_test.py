@@ -0,0 +1,75 @@
+# third party
+import pytest
+import torch
+
+from sympc.runtime import ProcessPointer
+from sympc.runtime import close_parties
+from sympc.runtime import launch_parties
+from sympc.session import Session
+from sympc.session import SessionManager
+from sympc.tensor import MPCTensor
+from sympc.utils import ispointer
+
+
+@pytest.fixture(scope="module", params=["AF_INET", "AF_UNIX"])
+def parties(request):
+    parties = launch_parties(2, family=request.param)
+    yield parties
+    close_parties(parties)
+
+
+def test_pointer_ops(parties) -> None:
+    party = parties[0]
+    ptr = party.python.Tuple([torch.tensor([1, 2]), torch.tensor([3, 4])])
+
+    assert isinstance(ptr, ProcessPointer)
+    assert ispointer(ptr)
+    assert ptr.__name__ == "tuplePointer"
+    assert len(ptr) == 2
+
+    x_ptr, y_ptr = ptr
+    assert ((x_ptr + y_ptr).get() == torch.tensor([4, 6])).all()
+    assert x_ptr.shape.get() == torch.Size([2])
+
+
+def test_party_exception(parties) -> None:
+    ptr = parties[0].torch.tensor([1, 2])
+
+    with pytest.raises(RuntimeError):
+        ptr.view(3).get()
+
+    with pytest.raises(ValueError):
+        parties[1].torch.neg(ptr)
+
+
+def test_ops_mpc_mpc(parties) -> None:
+    session = Session(parties=parties)
+    SessionManager.setup_mpc(session)
+
+    x_secret = torch.Tensor([[0.125, -1.25], [-4.25, 4]])
+    y_secret = torch.Tensor([[4.5, -2.5], [5, 2.25]])
+    x = MPCTensor(secret=x_secret, session=session)
+    y = MPCTensor(secret=y_secret, session=session)
+
+    for party in parties:
+        party.reset_traffic()
+
+    result = (x * y).reconstruct()
+
+    assert torch.allclose(result, x_secret * y_secret, rtol=10e-4)
+    for party in parties:
+        traffic = party.traffic()
+        assert traffic["messages"] > 0
+        assert traffic["bytes_received"] > 0
+
+
+def test_comparison(parties) -> None:
+    session = Session(parties=parties)
+    SessionManager.setup_mpc(session)
+
+    x_secret = torch.Tensor([-2, 0.5, 3, 7])
+    y_secret = torch.Tensor([1, 0.5, -1, 8])
+    x = MPCTensor(secret=x_secret, session=session)
+    y = MPCTensor(secret=y_secret, session=session)
+
+    assert ((x < y).reconstruct() == (x_secret < y_secret).float()).all()
@@ -11,6 +11,7 @@ from sympc.config import Config
 from sympc.protocol import Falcon
 from sympc.session import Session
 from sympc.session import SessionManager
+from sympc.tensor import MPCTensor
 from sympc.tensor import ReplicatedSharedTensor
 from sympc.tensor import ShareTensor
 from sympc.utils import generate_random_element
@@ -35,6 +36,8 @@ def test_session_default_init() -> None:
     assert session.ring_size == 2 ** 64
     assert session.min_value == -(2 ** 64) // 2
     assert session.max_value == (2 ** 64 - 1) // 2
+    assert session.lazy is False
+    assert session.channel is None
 
 
 def test_session_custom_init() -> None:
@@ -57,6 +60,13 @@ def test_session_custom_init() -> None:
     assert session.max_value == (2 ** 32 - 1) // 2
 
 
+def test_session_small_ring_default_precision() -> None:
+    """Test the default precision of the encoder for a 2**32 ring."""
+    session = Session(ring_size=2 ** 32)
+    assert session.tensor_type == torch.int32
+    assert session.config == Config(encoder_precision=8)
+
+
 def test_przs_share_tensor() -> None:
     """Test przs_generate_random_share method from Session for ShareTensor."""
     session = Session()  # default protocol: FSS
@@ -297,3 +307,28 @@ def test_prrs_rst_union_resolve(get_clients) -> None:
     share_pt_name = type(resolved_share_pt0).__name__
 
     assert share_pt_name == "ReplicatedSharedTensorPointer"
+
+
+def test_session_shutdown(get_clients) -> None:
+    parties = get_clients(2)
+    session = Session(parties=parties)
+    SessionManager.setup_mpc(session)
+
+    x = MPCTensor(secret=torch.tensor([1.0, 2.0]), session=session)
+    session.shutdown()
+
+    # The executors shared by the sessions are still used
+    assert torch.allclose(x.reconstruct(), torch.tensor([1.0, 2.0]))
+
+
+def test_session_shutdown_other_session(get_clients) -> None:
+    parties = get_clients(2)
+    session = Session(parties=parties)
+    other_session = Session(parties=parties)
+    SessionManager.setup_mpc(session)
+    SessionManager.setup_mpc(other_session)
+
+    x = MPCTensor(secret=torch.tensor([1.0, 2.0]), session=other_session)
+    session.shutdown()
+
+    assert torch.allclose((x * x).reconstruct(), torch.tensor([1.0, 4.0]))
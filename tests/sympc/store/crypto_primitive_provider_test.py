@@ -1,4 +1,5 @@
 # stdlib
+import operator
 from typing import Any
 from typing import Callable
 from typing import Dict
@@ -281,19 +282,23 @@ def test_generate_primitive_from_dict_beaver_matmul(get_clients) -> None:
     a_shape = (2, 3)
     b_shape = (3, 10)
 
-    key = f"beaver_matmul_{a_shape}_{b_shape}"
+    store_client_1 = session.session_ptrs[0].crypto_store
+    triple_client_1 = store_client_1.get_primitives_from_store(
+        "beaver_matmul", a_shape, b_shape, remove=False
+    ).get()
+    store_client_2 = session.session_ptrs[1].crypto_store
+    triple_client_2 = store_client_2.get_primitives_from_store(
+        "beaver_matmul", a_shape, b_shape, remove=False
+    ).get()
 
-    store_client_1 = session.session_ptrs[0].crypto_store.store.get()
-    store_client_2 = session.session_ptrs[1].crypto_store.store.get()
-
-    a_shape_client_1 = tuple(store_client_1.get(key)[0][0].shape)
-    b_shape_client_1 = tuple(store_client_1.get(key)[0][1].shape)
+    a_shape_client_1 = tuple(triple_client_1[0].shape)
+    b_shape_client_1 = tuple(triple_client_1[1].shape)
 
     assert a_shape == a_shape_client_1
     assert b_shape == b_shape_client_1
 
-    a_shape_client_2 = tuple(store_client_2.get(key)[0][0].shape)
-    b_shape_client_2 = tuple(store_client_2.get(key)[0][1].shape)
+    a_shape_client_2 = tuple(triple_client_2[0].shape)
+    b_shape_client_2 = tuple(triple_client_2[1].shape)
 
     assert a_shape == a_shape_client_2
     assert b_shape == b_shape_client_2
@@ -327,19 +332,23 @@ def test_generate_primitive_from_dict_beaver_mul(get_clients) -> None:
         a_shape = arg[1].get("a_shape")
         b_shape = arg[1].get("b_shape")
 
-        key = f"beaver_mul_{a_shape}_{b_shape}"
-
-        store_client_1 = session.session_ptrs[0].crypto_store.store.get()
-        store_client_2 = session.session_ptrs[1].crypto_store.store.get()
+        store_client_1 = session.session_ptrs[0].crypto_store
+        triple_client_1 = store_client_1.get_primitives_from_store(
+            "beaver_mul", a_shape, b_shape, remove=False
+        ).get()
+        store_client_2 = session.session_ptrs[1].crypto_store
+        triple_client_2 = store_client_2.get_primitives_from_store(
+            "beaver_mul", a_shape, b_shape, remove=False
+        ).get()
 
-        a_shape_client_1 = tuple(store_client_1.get(key)[0][0].shape)
-        b_shape_client_1 = tuple(store_client_1.get(key)[0][1].shape)
+        a_shape_client_1 = tuple(triple_client_1[0].shape)
+        b_shape_client_1 = tuple(triple_client_1[1].shape)
 
         assert a_shape == a_shape_client_1
         assert b_shape == b_shape_client_1
 
-        a_shape_client_2 = tuple(store_client_2.get(key)[0][0].shape)
-        b_shape_client_2 = tuple(store_client_2.get(key)[0][1].shape)
+        a_shape_client_2 = tuple(triple_client_2[0].shape)
+        b_shape_client_2 = tuple(triple_client_2[1].shape)
 
         assert a_shape == a_shape_client_2
         assert b_shape == b_shape_client_2
@@ -370,19 +379,108 @@ def test_generate_primitive_from_dict_beaver_conv2d(get_clients) -> None:
     a_shape = (1, 1, 28, 28)
     b_shape = (5, 1, 5, 5)
 
-    key = f"beaver_conv2d_{a_shape}_{b_shape}"
-
-    store_client_1 = session.session_ptrs[0].crypto_store.store.get()
-    store_client_2 = session.session_ptrs[1].crypto_store.store.get()
+    store_client_1 = session.session_ptrs[0].crypto_store
+    triple_client_1 = store_client_1.get_primitives_from_store(
+        "beaver_conv2d", a_shape, b_shape, remove=False
+    ).get()
+    store_client_2 = session.session_ptrs[1].crypto_store
+    triple_client_2 = store_client_2.get_primitives_from_store(
+        "beaver_conv2d", a_shape, b_shape, remove=False
+    ).get()
 
-    a_shape_client_1 = tuple(store_client_1.get(key)[0][0].shape)
-    b_shape_client_1 = tuple(store_client_1.get(key)[0][1].shape)
+    a_shape_client_1 = tuple(triple_client_1[0].shape)
+    b_shape_client_1 = tuple(triple_client_1[1].shape)
 
     assert a_shape == a_shape_client_1
     assert b_shape == b_shape_client_1
 
-    a_shape_client_2 = tuple(store_client_2.get(key)[0][0].shape)
-    b_shape_client_2 = tuple(store_client_2.get(key)[0][1].shape)
+    a_shape_client_2 = tuple(triple_client_2[0].shape)
+    b_shape_client_2 = tuple(triple_client_2[1].shape)
 
     assert a_shape == a_shape_client_2
     assert b_shape == b_shape_client_2
+
+
+@pytest.mark.parametrize(
+    ("op_str", "a_shape", "b_shape"),
+    [("mul", (2, 10), (10,)), ("matmul", (2, 3), (3, 10))],
+)
+@pytest.mark.parametrize("n_instances", [1, 7])
+def test_generate_primitive_beaver_n_instances(
+    get_clients, op_str: str, a_shape: Tuple[int], b_shape: Tuple[int], n_instances
+) -> None:
+    clients = get_clients(2)
+    session = Session(parties=clients)
+    SessionManager.setup_mpc(session)
+
+    CryptoPrimitiveProvider.generate_primitives(
+        f"beaver_{op_str}",
+        session=session,
+        g_kwargs={
+            "a_shape": a_shape,
+            "b_shape": b_shape,
+            "nr_parties": 2,
+            "n_instances": n_instances,
+        },
+        p_kwargs={"a_shape": a_shape, "b_shape": b_shape},
+    )
+
+    store_client_1 = session.session_ptrs[0].crypto_store
+    store_client_2 = session.session_ptrs[1].crypto_store
+
+    op_key = f"beaver_{op_str}"
+    assert store_client_1.available(op_key, a_shape, b_shape).get() == n_instances
+    assert store_client_2.available(op_key, a_shape, b_shape).get() == n_instances
+
+    op = getattr(operator, op_str)
+    for _ in range(n_instances):
+        triple_1 = store_client_1.get_primitives_from_store(
+            op_key, a_shape, b_shape
+        ).get()
+        triple_2 = store_client_2.get_primitives_from_store(
+            op_key, a_shape, b_shape
+        ).get()
+        a, b, c = [sh_1.tensor + sh_2.tensor for sh_1, sh_2 in zip(triple_1, triple_2)]
+
+        assert tuple(a.shape) == a_shape
+        assert tuple(b.shape) == b_shape
+        assert (op(a, b) == c).all()
+
+
+def test_crypto_store_available_and_peek(get_clients) -> None:
+    clients = get_clients(2)
+    session = Session(parties=clients)
+    SessionManager.setup_mpc(session)
+
+    a_shape = (2, 3)
+    b_shape = (2, 3)
+    CryptoPrimitiveProvider.generate_primitives(
+        "beaver_mul",
+        session=session,
+        g_kwargs={
+            "a_shape": a_shape,
+            "b_shape": b_shape,
+            "nr_parties": 2,
+            "n_instances": 3,
+        },
+        p_kwargs={"a_shape": a_shape, "b_shape": b_shape},
+    )
+
+    remote_crypto_store = session.session_ptrs[0].crypto_store
+    assert remote_crypto_store.available("beaver_mul", a_shape, b_shape).get() == 3
+    assert remote_crypto_store.available("beaver_mul", (1,), (1,)).get() == 0
+
+    peeked = remote_crypto_store.get_primitives_from_store(
+        "beaver_mul", a_shape, b_shape, remove=False
+    ).get()
+    assert remote_crypto_store.available("beaver_mul", a_shape, b_shape).get() == 3
+
+    retrieved = remote_crypto_store.get_primitives_from_store(
+        "beaver_mul", a_shape, b_shape
+    ).get()
+    assert remote_crypto_store.available("beaver_mul", a_shape, b_shape).get() == 2
+
+    assert all(
+        (sh_peek.tensor == sh_ret.tensor).all()
+        for sh_peek, sh_ret in zip(peeked, retrieved)
+    )
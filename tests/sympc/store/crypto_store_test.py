@@ -11,6 +11,7 @@ import pytest
 from sympc.store import CryptoStore
 from sympc.store import register_primitive_store_add
 from sympc.store import register_primitive_store_get
+from sympc.store.exceptions import EmptyPrimitiveStore
 
 """
 The functionality is already tested with CryptoStoreProvider
@@ -56,3 +57,26 @@ def test_get_store(nr_instances: int) -> None:
     )
 
     assert primitives[:nr_instances] == primitives_store
+
+
+def test_reserve_primitives_out_of_order() -> None:
+    crypto_store = CryptoStore()
+    crypto_store.store["test_key_store"] = list(range(10))
+
+    def take(nr_instances: int) -> List[int]:
+        queue = crypto_store.store["test_key_store"]
+        primitives, queue[:] = queue[:nr_instances], queue[nr_instances:]
+        return primitives
+
+    # The operations reach the party in a different order than their positions
+    assert crypto_store.reserve_primitives("test_key_store", 6, 2, take) == [6, 7]
+    assert crypto_store.reserve_primitives("test_key_store", 2, 3, take) == [2, 3, 4]
+    assert crypto_store.reserve_primitives("test_key_store", 0, 2, take) == [0, 1]
+    assert crypto_store.reserve_primitives("test_key_store", 5, 1, take) == [5]
+    assert crypto_store.store["test_key_store"] == [8, 9]
+
+    with pytest.raises(ValueError):
+        crypto_store.reserve_primitives("test_key_store", 2, 1, take)
+
+    with pytest.raises(EmptyPrimitiveStore):
+        crypto_store.reserve_primitives("test_key_store", 8, 3, take)
@@ -0,0 +1,134 @@
+# stdlib
+import os
+import stat
+from uuid import uuid4
+
+# third party
+import numpy as np
+import pytest
+import torch
+
+from sympc.config import Config
+from sympc.session import Session
+from sympc.session import SessionManager
+from sympc.store import CryptoStore
+from sympc.store.crypto_store import add_primitives_to_queue
+from sympc.store.crypto_store import get_primitive_from_queue
+from sympc.store.crypto_store import get_primitive_key
+from sympc.store.disk_store import DiskPrimitiveQueue
+from sympc.store.disk_store import DiskStore
+from sympc.store.exceptions import EmptyPrimitiveStore
+from sympc.tensor import MPCTensor
+from sympc.tensor import ShareTensor
+
+
+def _get_share(value: torch.Tensor, session_uuid) -> ShareTensor:
+    share = ShareTensor(session_uuid=session_uuid, config=Config(encoder_precision=0))
+    share.tensor = value
+    return share
+
+
+def test_disk_store_queue(tmp_path) -> None:
+    session_uuid = uuid4()
+    key = get_primitive_key("beaver_mul", (2, 3), (2, 3))
+    primitives = [
+        [
+            _get_share(torch.full((2, 3), i, dtype=torch.long), session_uuid),
+            torch.full((3,), -i, dtype=torch.int32),
+            np.full((2,), i, dtype=np.int64),
+        ]
+        for i in range(3)
+    ]
+
+    store = DiskStore(str(tmp_path))
+    add_primitives_to_queue(store, key, primitives)
+
+    assert isinstance(store[key], DiskPrimitiveQueue)
+    assert len(store[key]) == 3
+
+    peeked = get_primitive_from_queue(store, key, remove=False)
+    assert (peeked[0].tensor == 0).all()
+
+    share, tensor, array = get_primitive_from_queue(store, key)
+    assert share.session_uuid == session_uuid
+    assert share.config == Config(encoder_precision=0)
+    assert tensor.dtype == torch.int32
+    assert (share.tensor == 0).all()
+    assert len(store[key]) == 2
+
+    # The cursor is kept on disk, the consumed primitives are never reloaded
+    store = DiskStore(str(tmp_path))
+    share, tensor, array = get_primitive_from_queue(store, key)
+    assert (share.tensor == 1).all()
+    assert (tensor == -1).all()
+    assert (array == 1).all()
+
+    get_primitive_from_queue(store, key)
+    assert len(store[key]) == 0
+
+    with pytest.raises(EmptyPrimitiveStore):
+        get_primitive_from_queue(store, key)
+
+
+def test_disk_store_pop_keeps_metadata(tmp_path) -> None:
+    key = get_primitive_key("op", (2,))
+    queue = DiskPrimitiveQueue(str(tmp_path), key)
+    queue.extend([[torch.full((2,), i)] for i in range(3)])
+    metadata_mtime = os.stat(queue.metadata_path).st_mtime_ns
+
+    queue.popleft()
+    queue.flush()
+
+    # Only the mapped cursor is updated
+    assert os.stat(queue.metadata_path).st_mtime_ns == metadata_mtime
+    assert len(DiskPrimitiveQueue(str(tmp_path), key)) == 2
+
+
+def test_disk_store_layout_exception(tmp_path) -> None:
+    queue = DiskPrimitiveQueue(str(tmp_path), get_primitive_key("op", (2,)))
+    queue.extend([[torch.zeros(2)]])
+
+    with pytest.raises(ValueError):
+        queue.extend([[torch.zeros(3)]])
+
+
+def test_disk_store_private_files(tmp_path) -> None:
+    directory = tmp_path / "store"
+    store = DiskStore(str(directory))
+    key = get_primitive_key("op", (2,))
+    add_primitives_to_queue(store, key, [[torch.zeros(2)]])
+
+    queue = store[key]
+    paths = [str(directory), queue.data_path, queue.metadata_path, queue.cursor_path]
+    for path in paths:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+        assert mode & (stat.S_IRWXG | stat.S_IRWXO) == 0
+
+
+def test_crypto_store_use_disk(tmp_path) -> None:
+    store = CryptoStore()
+    key = get_primitive_key("beaver_mul", (2,), (2,))
+    add_primitives_to_queue(store.store, key, [[torch.zeros(2)], [torch.ones(2)]])
+
+    store.use_disk(str(tmp_path))
+
+    assert isinstance(store.store, DiskStore)
+    assert store.available("beaver_mul", (2,), (2,)) == 2
+
+
+def test_mul_with_disk_store(get_clients, tmp_path) -> None:
+    clients = get_clients(2)
+    session = Session(parties=clients)
+    SessionManager.setup_mpc(session)
+
+    for rank, session_ptr in enumerate(session.session_ptrs):
+        session_ptr.crypto_store.use_disk(str(tmp_path / f"party_{rank}"))
+
+    x_secret = torch.Tensor([[1, 2], [3, 4]])
+    y_secret = torch.Tensor([[5, 6], [7, 8]])
+    x = MPCTensor(secret=x_secret, session=session)
+    y = MPCTensor(secret=y_secret, session=session)
+
+    res = (x * y).reconstruct()
+
+    assert torch.allclose(res, x_secret * y_secret)
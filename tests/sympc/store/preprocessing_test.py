@@ -0,0 +1,87 @@
+# third party
+import pytest
+import torch
+
+from sympc.session import Session
+from sympc.session import SessionManager
+from sympc.store import PreprocessingPlanner
+from sympc.tensor import MPCTensor
+
+
+def _mul_twice(x: MPCTensor, y: MPCTensor) -> MPCTensor:
+    return x * y + x * y
+
+
+def test_plan_groups_requests() -> None:
+    primitive_log = {
+        "beaver_mul": [
+            ({"a_shape": (2, 3), "b_shape": (2, 3)}, {"a_shape": (2, 3)}),
+            ({"a_shape": [2, 3], "b_shape": [2, 3]}, {"a_shape": [2, 3]}),
+        ],
+        "beaver_matmul": [
+            ({"a_shape": (2, 3), "b_shape": (3, 2)}, {"a_shape": (2, 3)}),
+        ],
+        "beaver_wraps": [(None, {"shape": (2, 3)})],
+    }
+
+    planner = PreprocessingPlanner(Session(), primitive_log)
+    plan = planner.plan()
+
+    assert len(planner.requests) == 4
+    assert [(op_str, count) for op_str, _, _, count in plan] == [
+        ("beaver_mul", 2),
+        ("beaver_matmul", 1),
+    ]
+
+
+def test_generate_exception() -> None:
+    planner = PreprocessingPlanner(Session())
+
+    with pytest.raises(ValueError):
+        planner.generate(nr_batches=0)
+
+
+def test_trace_and_generate(get_clients) -> None:
+    clients = get_clients(2)
+    session = Session(parties=clients)
+    SessionManager.setup_mpc(session)
+
+    x = MPCTensor(secret=torch.Tensor([[1, 2], [3, 4]]), session=session)
+    y = MPCTensor(secret=torch.Tensor([[5, 6], [7, 8]]), session=session)
+
+    planner = PreprocessingPlanner(session)
+    planner.trace(_mul_twice, x, y)
+    planner.generate(nr_batches=3)
+
+    store = session.session_ptrs[0].crypto_store
+    assert store.available("beaver_mul", (2, 2), (2, 2)).get() == 6
+
+    res = (x * y).reconstruct()
+
+    assert torch.allclose(res, torch.Tensor([[5, 12], [21, 32]]))
+    assert store.available("beaver_mul", (2, 2), (2, 2)).get() == 5
+
+
+def test_generate_in_background(get_clients) -> None:
+    clients = get_clients(2)
+    session = Session(parties=clients)
+    SessionManager.setup_mpc(session)
+
+    primitive_log = {
+        "beaver_matmul": [
+            (
+                {"a_shape": (2, 3), "b_shape": (3, 10)},
+                {"a_shape": (2, 3), "b_shape": (3, 10), "nr_parties": 2},
+            )
+        ]
+    }
+
+    planner = PreprocessingPlanner(session, primitive_log)
+    try:
+        planner.generate_in_background(nr_batches=2).result()
+    finally:
+        planner.shutdown()
+
+    for session_ptr in session.session_ptrs:
+        store = session_ptr.crypto_store
+        assert store.available("beaver_matmul", (2, 3), (3, 10)).get() == 2
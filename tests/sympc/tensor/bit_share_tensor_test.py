@@ -0,0 +1,101 @@
+# third party
+import pytest
+import torch
+
+from sympc.protocol import FSS
+from sympc.protocol.beaver.beaver import _split_instances
+from sympc.protocol.beaver.beaver import get_dabits
+from sympc.protocol.beaver.beaver import get_triples_bit_and
+from sympc.session import Session
+from sympc.session import SessionManager
+from sympc.tensor import BitShareTensor
+from sympc.tensor import MPCBitTensor
+from sympc.tensor import MPCTensor
+from sympc.tensor.bit_share_tensor import pack_bits
+from sympc.tensor.bit_share_tensor import unpack_bits
+
+
+def test_pack_unpack_bits() -> None:
+    bits = torch.randint(0, 2, (3, 7), dtype=torch.uint8)
+
+    packed = pack_bits(bits)
+
+    assert packed.dtype == torch.uint8
+    assert packed.numel() == 3
+    assert (unpack_bits(packed, bits.shape) == bits).all()
+
+
+def test_bit_share_public_ops() -> None:
+    x_bits = torch.tensor([[0, 1, 1], [1, 0, 1]])
+    y_bits = torch.tensor([[1, 1, 0], [1, 0, 0]])
+    x = BitShareTensor(data=x_bits)
+
+    assert x.nbytes == 1
+    assert (x.xor(y_bits).bits() == (x_bits ^ y_bits)).all()
+    assert ((x & y_bits).bits() == (x_bits & y_bits)).all()
+    assert (x.xor(1).bits() == 1 - x_bits).all()
+    assert x ^ BitShareTensor(data=y_bits) == BitShareTensor(data=x_bits ^ y_bits)
+
+
+def test_bit_share_and_share_exception() -> None:
+    x = BitShareTensor(data=torch.tensor([0, 1]))
+
+    with pytest.raises(ValueError):
+        x.and_(BitShareTensor(data=torch.tensor([1, 1])))
+
+
+def test_bit_primitives_n_instances() -> None:
+    n_instances, numel = 5, 11
+
+    dabits = [_split_instances(party) for party in get_dabits(2, numel, n_instances)]
+    triples = [
+        _split_instances(party) for party in get_triples_bit_and(2, numel, n_instances)
+    ]
+
+    assert len(dabits[0]) == len(triples[0]) == n_instances
+    for (xor_0, arith_0), (xor_1, arith_1) in zip(*dabits):
+        bits = unpack_bits(xor_0 ^ xor_1, (numel,))
+        assert xor_0.numel() == 2
+        assert ((arith_0.tensor + arith_1.tensor) == bits).all()
+
+    for triple_0, triple_1 in zip(*triples):
+        a, b, c = [
+            unpack_bits(sh_0 ^ sh_1, (numel,)) for sh_0, sh_1 in zip(triple_0, triple_1)
+        ]
+        assert ((a & b) == c).all()
+
+
+@pytest.mark.parametrize("channel", [None, "in_process"])
+def test_packed_comparison(get_clients, channel) -> None:
+    session = Session(parties=get_clients(2))
+    session.channel = channel
+    SessionManager.setup_mpc(session)
+
+    x_secret = torch.tensor([[-1.5, 0, 2], [3, -4, 5]])
+    y_secret = torch.tensor([[1.0, 0, 2], [-3, 4, 5]])
+    x = MPCTensor(secret=x_secret, session=session)
+    y = MPCTensor(secret=y_secret, session=session)
+
+    le = FSS.le(x, y, packed=True)
+    eq = FSS.eq(x, y, packed=True)
+
+    assert isinstance(le, MPCBitTensor)
+    assert (le.reconstruct() == (x_secret <= y_secret)).all()
+    assert (eq.reconstruct() == (x_secret == y_secret)).all()
+    assert ((le & eq).reconstruct() == (x_secret == y_secret)).all()
+    assert ((le ^ eq).reconstruct() == (x_secret < y_secret)).all()
+    assert ((~le).reconstruct() == (x_secret > y_secret)).all()
+
+
+def test_packed_to_arithmetic(get_clients) -> None:
+    session = Session(parties=get_clients(2))
+    SessionManager.setup_mpc(session)
+
+    x_secret = torch.tensor([-1.5, 0, 2, 3.25])
+    x = MPCTensor(secret=x_secret, session=session)
+
+    bits = FSS.le(x, 0, packed=True).to_arithmetic()
+    res = (bits * x).reconstruct()
+
+    assert torch.allclose(bits.reconstruct(), (x_secret <= 0).float())
+    assert torch.allclose(res, (x_secret <= 0) * x_secret)
@@ -1,4 +1,5 @@
 # stdlib
+import asyncio
 import operator
 
 # third party
@@ -144,6 +145,140 @@ def test_ops_mpc_mpc(get_clients, nr_clients, op_str) -> None:
     assert np.allclose(result, expected_result, rtol=10e-4)
 
 
+@pytest.mark.parametrize("nr_clients", [2, 3])
+@pytest.mark.parametrize("op_str", ["mul", "matmul"])
+def test_ops_mpc_mpc_int32_ring(get_clients, nr_clients, op_str) -> None:
+    clients = get_clients(nr_clients)
+    session = Session(parties=clients, ring_size=2 ** 32)
+    SessionManager.setup_mpc(session)
+
+    op = getattr(operator, op_str)
+
+    x_secret = torch.Tensor([[0.125, -1.25], [-4.25, 4]])
+    y_secret = torch.Tensor([[4.5, -2.5], [5, 2.25]])
+    x = MPCTensor(secret=x_secret, session=session)
+    y = MPCTensor(secret=y_secret, session=session)
+    result = op(x, y)
+
+    assert all(share.dtype == torch.int32 for share in result.get_shares())
+    assert np.allclose(result.reconstruct(), op(x_secret, y_secret), atol=0.1)
+
+
+@pytest.mark.parametrize("nr_clients", [2, 3])
+def test_ops_public_div_int32_ring(get_clients, nr_clients) -> None:
+    clients = get_clients(nr_clients)
+    session = Session(parties=clients, ring_size=2 ** 32)
+    SessionManager.setup_mpc(session)
+
+    x_secret = torch.Tensor([[0.125, -1.25], [-4.25, 40]])
+    x = MPCTensor(secret=x_secret, session=session)
+    result = (x / 3).reconstruct()
+
+    assert np.allclose(result, x_secret / 3, atol=0.1)
+
+
+def test_comparison_int32_ring(get_clients) -> None:
+    clients = get_clients(2)
+    session = Session(parties=clients, ring_size=2 ** 32)
+    SessionManager.setup_mpc(session)
+
+    x_secret = torch.Tensor([[0.125, -1.25], [-4.25, 4]])
+    y_secret = torch.Tensor([[4.5, -2.5], [-4.25, 2.25]])
+    x = MPCTensor(secret=x_secret, session=session)
+    y = MPCTensor(secret=y_secret, session=session)
+
+    assert (x.le(y).reconstruct() == (x_secret <= y_secret)).all()
+    assert (x.eq(y).reconstruct() == (x_secret == y_secret)).all()
+
+
+@pytest.mark.parametrize("nr_clients", [2, 3])
+@pytest.mark.parametrize("op_str", ["mul", "matmul"])
+def test_ops_mpc_mpc_async(get_clients, nr_clients, op_str) -> None:
+    clients = get_clients(nr_clients)
+    session = Session(parties=clients)
+    SessionManager.setup_mpc(session)
+
+    op = getattr(operator, op_str)
+
+    x_secret = torch.Tensor([[0.125, -1.25], [-4.25, 4]])
+    y_secret = torch.Tensor([[4.5, -2.5], [5, 2.25]])
+    x = MPCTensor(secret=x_secret, session=session)
+    y = MPCTensor(secret=y_secret, session=session)
+
+    async def compute():
+        # Independent operations interleave on the same orchestrator
+        results = await asyncio.gather(
+            *[getattr(x, f"{op_str}_async")(y) for _ in range(3)]
+        )
+        return await asyncio.gather(*[res.reconstruct_async() for res in results])
+
+    expected_result = op(x_secret, y_secret)
+    for result in asyncio.run(compute()):
+        assert np.allclose(result, expected_result, rtol=10e-4)
+
+
+def test_ops_mpc_public_async(get_clients) -> None:
+    clients = get_clients(2)
+    session = Session(parties=clients)
+    SessionManager.setup_mpc(session)
+
+    x_secret = torch.Tensor([[0.125, -1.25], [-4.25, 4]])
+    x = MPCTensor(secret=x_secret, session=session)
+
+    async def compute():
+        result = await x.mul_async(2)
+        return await result.reconstruct_async()
+
+    assert np.allclose(asyncio.run(compute()), x_secret * 2, rtol=10e-4)
+
+
+@pytest.mark.parametrize("nr_clients", [2, 3])
+def test_lazy_mode(get_clients, nr_clients) -> None:
+    clients = get_clients(nr_clients)
+    session = Session(parties=clients)
+    SessionManager.setup_mpc(session)
+
+    x_secret = torch.Tensor([[0.125, -1.25], [-4.25, 4]])
+    y_secret = torch.Tensor([[4.5, -2.5], [5, 2.25]])
+    x = MPCTensor(secret=x_secret, session=session)
+    y = MPCTensor(secret=y_secret, session=session)
+
+    with session.lazy_mode():
+        z = (x + y - 1).t().reshape(4) + torch.tensor([1.0, 2.0, 3.0, 4.0])
+        w = (x * y + z.view(2, 2)).sum(dim=0)
+
+    # Only the private multiplication was executed
+    assert not session.lazy
+    assert z.pending_ops is not None
+    assert w.pending_ops is not None
+
+    expected_z = (x_secret + y_secret - 1).t().reshape(4) + torch.tensor(
+        [1.0, 2.0, 3.0, 4.0]
+    )
+    expected_w = (x_secret * y_secret + expected_z.view(2, 2)).sum(dim=0)
+
+    assert np.allclose(z.reconstruct(), expected_z, rtol=10e-4)
+    assert z.pending_ops is None
+    assert np.allclose(w.reconstruct(), expected_w, rtol=10e-4)
+
+
+def test_lazy_mode_public_mul(get_clients) -> None:
+    clients = get_clients(2)
+    session = Session(parties=clients)
+    SessionManager.setup_mpc(session)
+
+    x_secret = torch.Tensor([[0.125, -1.25], [-4.25, 4]])
+    x = MPCTensor(secret=x_secret, session=session)
+
+    with session.lazy_mode():
+        res = (x * 2 - x * 0.5) @ torch.Tensor([[1.0], [2.0]])
+
+    assert res.pending_ops is not None
+
+    expected_res = (x_secret * 2 - x_secret * 0.5) @ torch.Tensor([[1.0], [2.0]])
+    assert np.allclose(res.reconstruct(), expected_res, rtol=10e-4)
+
+
 @pytest.mark.parametrize("nr_clients", [2])
 @pytest.mark.parametrize("op_str", ["truediv"])
 def test_ops_mpc_mpc_div(get_clients, nr_clients, op_str) -> None:
@@ -407,6 +542,21 @@ def test_generate_shares() -> None:
     assert sum(shares_from_share_tensor).tensor == sum(shares_from_secret).tensor
 
 
+@pytest.mark.parametrize("nr_parties", [1, 2, 5])
+def test_generate_shares_nr_parties(nr_parties) -> None:
+    x_secret = torch.Tensor([[5.0, -1.25], [0.5, 3.0]])
+    x_share = ShareTensor(data=x_secret)
+
+    shares = MPCTensor.generate_shares(x_share, nr_parties, tensor_type=torch.long)
+
+    assert len(shares) == nr_parties
+    for share in shares:
+        assert share.shape == x_secret.shape
+        assert share.tensor.dtype == torch.long
+
+    assert (sum(share.tensor for share in shares) == x_share.tensor).all()
+
+
 def test_generate_shares_config(get_clients) -> None:
     x_secret = torch.Tensor([5.0])
     x_share = ShareTensor(data=x_secret)
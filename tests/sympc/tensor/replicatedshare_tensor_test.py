@@ -323,6 +323,23 @@ def test_ops_public_mul_matrix(get_clients, security, base, precision):
     assert np.allclose(result.reconstruct(), expected_res, atol=1e-3)
 
 
+@pytest.mark.parametrize("base, precision", [(2, 16), (10, 4)])
+def test_ops_public_matmul(get_clients, base, precision):
+    parties = get_clients(3)
+    protocol = Falcon("semi-honest")
+    config = Config(encoder_base=base, encoder_precision=precision)
+    session = Session(protocol=protocol, parties=parties, config=config)
+    SessionManager.setup_mpc(session)
+
+    secret = torch.Tensor([[0.125, 1001, 4.82, -1.25], [-4.25, 0.217, 3301, 4]])
+    value = torch.Tensor([[4.5, 9.25], [3.47, -2.5], [50, 3.17], [5.82, 2.25]])
+
+    tensor = MPCTensor(secret=secret, session=session)
+    result = tensor @ value
+    expected_res = secret @ value
+    assert np.allclose(result.reconstruct(), expected_res, atol=1e-2)
+
+
 @pytest.mark.parametrize("parties", [2, 3, 5])
 @pytest.mark.parametrize("security", ["semi-honest"])
 def test_ops_public_mul_integer_parties(get_clients, parties, security):
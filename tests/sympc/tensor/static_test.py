@@ -7,8 +7,10 @@ import torch
 
 from sympc.session import Session
 from sympc.session import SessionManager
+from sympc.tensor import static
 from sympc.tensor.mpc_tensor import MPCTensor
 from sympc.tensor.static import cat
+from sympc.tensor.static import compare_many
 from sympc.tensor.static import stack
 
 
@@ -111,6 +113,77 @@ def test_max_dim(dim, keepdim, get_clients) -> None:
     assert (res_max == expected_max).all(), f"Expected argmax to be {expected_max}"
 
 
+@pytest.mark.parametrize("method", ["pairwise", "tree"])
+def test_argmax_method(method, get_clients) -> None:
+    clients = get_clients(2)
+    session = Session(parties=clients)
+    SessionManager.setup_mpc(session)
+
+    secret = torch.Tensor([1, 2, 3, -1, -3, 7, 0])
+    x = MPCTensor(secret=secret, session=session)
+
+    res = x.argmax(method=method).reconstruct()
+
+    assert res == secret.argmax().float()
+
+
+@pytest.mark.parametrize(
+    "dim, keepdim, method",
+    itertools.product([0, 1, 2], [True, False], ["pairwise", "tree"]),
+)
+def test_max_dim_method(dim, keepdim, method, get_clients) -> None:
+    clients = get_clients(2)
+    session = Session(parties=clients)
+    SessionManager.setup_mpc(session)
+
+    secret = torch.Tensor(
+        [[[1, 2], [3, -1], [4, 5]], [[2, 5], [5, 1], [6, 42]], [[0, 3], [7, 2], [1, 8]]]
+    )
+    x = MPCTensor(secret=secret, session=session)
+
+    max_val, max_idx_val = x.max(dim=dim, keepdim=keepdim, method=method)
+    expected_max, expected_indices = secret.max(dim=dim, keepdim=keepdim)
+
+    assert (max_idx_val.reconstruct() == expected_indices).all()
+    assert (max_val.reconstruct() == expected_max).all()
+
+
+def test_max_tree_one_hot(get_clients) -> None:
+    clients = get_clients(2)
+    session = Session(parties=clients)
+    SessionManager.setup_mpc(session)
+
+    secret = torch.Tensor([[1, 9, 3], [4, -2, 0]])
+    x = MPCTensor(secret=secret, session=session)
+
+    max_val, one_hot = x.max(dim=1, one_hot=True, method="tree")
+
+    assert (max_val.reconstruct() == torch.Tensor([9, 4])).all()
+    assert (one_hot.reconstruct() == torch.Tensor([[0, 1, 0], [1, 0, 0]])).all()
+
+
+def test_select_argmax_method(monkeypatch, get_clients) -> None:
+    clients = get_clients(2)
+    session = Session(parties=clients)
+    SessionManager.setup_mpc(session)
+
+    x = MPCTensor(secret=torch.Tensor([[1, 2, 3], [4, 5, 6]]), session=session)
+
+    assert static._select_argmax_method(x, 1, "auto") == "pairwise"
+    assert static._select_argmax_method(x, 1, "tree") == "tree"
+
+    # The number of rows does not matter, only their length
+    rows = MPCTensor(secret=torch.zeros((1024, 4)), session=session)
+    assert static._select_argmax_method(rows, 1, "auto") == "pairwise"
+
+    monkeypatch.setattr(static, "PAIRWISE_MAX_ROW_LENGTH", 2)
+    assert static._select_argmax_method(x, 1, "auto") == "tree"
+    assert static._select_argmax_method(x, 0, "auto") == "pairwise"
+
+    with pytest.raises(ValueError):
+        x.argmax(method="bubble")
+
+
 def test_stack(get_clients):
     clients = get_clients(2)
 
@@ -141,3 +214,64 @@ def test_cat(get_clients):
     concatenated = cat([x, y])
 
     assert (secret_concatenated == concatenated.reconstruct()).all()
+
+
+def test_compare_many(get_clients) -> None:
+    clients = get_clients(2)
+    session = Session(parties=clients)
+    SessionManager.setup_mpc(session)
+
+    x_secret = torch.Tensor([[0.5, -1.25], [-4.25, 4]])
+    y_secret = torch.Tensor([1.5, -1.25, 3])
+    x = MPCTensor(secret=x_secret, session=session)
+    y = MPCTensor(secret=y_secret, session=session)
+
+    with session.stats as stats:
+        x <= 0
+
+    single_rounds = stats.summary()["fss_comp"]["rounds"]
+
+    with session.stats as stats:
+        results = compare_many(
+            [
+                (x, 0, "gt"),
+                (y, -1.25, "ge"),
+                (3, y, "lt"),
+                (x, torch.Tensor([0.5, 4]), "le"),
+                (y, 3, "eq"),
+                (x, -1.25, "ne"),
+            ]
+        )
+
+    expected = [
+        x_secret > 0,
+        y_secret >= -1.25,
+        3 < y_secret,
+        x_secret <= torch.Tensor([0.5, 4]),
+        y_secret == 3,
+        x_secret != -1.25,
+    ]
+
+    for res, expected_res in zip(results, expected):
+        assert res.shape == expected_res.shape
+        assert (res.reconstruct() == expected_res).all()
+
+    # All the comparisons of a kind are done with a single call to the protocol
+    assert stats.summary()["fss_comp"]["rounds"] == single_rounds
+
+
+def test_compare_many_exception(get_clients) -> None:
+    clients = get_clients(2)
+    session = Session(parties=clients)
+    SessionManager.setup_mpc(session)
+
+    x = MPCTensor(secret=torch.Tensor([1, 2]), session=session)
+
+    with pytest.raises(ValueError):
+        compare_many([])
+
+    with pytest.raises(ValueError):
+        compare_many([(x, 1, "max")])
+
+    with pytest.raises(ValueError):
+        compare_many([(1, 2, "le")])
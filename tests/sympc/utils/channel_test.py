@@ -0,0 +1,56 @@
+# stdlib
+import threading
+
+# third party
+import pytest
+
+from sympc.utils import Channel
+from sympc.utils import InProcessChannel
+from sympc.utils import get_channel
+from sympc.utils import register_channel
+
+
+def test_in_process_channel() -> None:
+    channel = InProcessChannel()
+    received = []
+
+    def _recv() -> None:
+        received.append(channel.recv("tag", 0, 1))
+
+    thread = threading.Thread(target=_recv)
+    thread.start()
+    channel.send("tag", 0, 1, 42)
+    thread.join()
+
+    assert received == [42]
+    assert channel.messages == {}
+
+
+def test_in_process_channel_timeout() -> None:
+    channel = InProcessChannel()
+    channel.send("tag", 1, 0, 42)
+
+    with pytest.raises(TimeoutError):
+        channel.recv("tag", 0, 1, timeout=0.01)
+
+
+def test_register_channel() -> None:
+    channel = InProcessChannel()
+    register_channel("test_channel", channel)
+
+    assert get_channel("test_channel") is channel
+    assert isinstance(get_channel("in_process"), InProcessChannel)
+
+    with pytest.raises(ValueError):
+        register_channel("test_channel", channel)
+
+    with pytest.raises(ValueError):
+        get_channel("missing_channel")
+
+
+def test_channel_not_implemented() -> None:
+    with pytest.raises(NotImplementedError):
+        Channel().send("tag", 0, 1, 42)
+
+    with pytest.raises(NotImplementedError):
+        Channel().recv("tag", 0, 1)
@@ -0,0 +1,74 @@
+# third party
+import torch
+
+from sympc.session import Session
+from sympc.session import SessionManager
+from sympc.tensor import MPCTensor
+from sympc.utils import CommunicationStats
+from sympc.utils import is_recording
+from sympc.utils import op_scope
+from sympc.utils import payload_nbytes
+from sympc.utils import record_round
+
+
+def test_payload_nbytes() -> None:
+    x = torch.zeros(2, 3, dtype=torch.int64)
+    y = torch.zeros(4, dtype=torch.int32)
+
+    assert payload_nbytes(x) == 48
+    assert payload_nbytes([x, (y, 3)]) == 64
+    assert payload_nbytes({"x": x, "y": "y"}) == 48
+    assert payload_nbytes(None) == 0
+
+
+def test_communication_stats_record() -> None:
+    parties = [object(), object()]
+    session = Session(parties=parties)
+    stats = CommunicationStats(session)
+
+    record_round(parties, [1, 2], [3, 4], 0.5, "op")
+    assert stats.rounds == 0
+    assert not is_recording()
+
+    with stats:
+        assert is_recording()
+        record_round(parties, [1, 2], [3, 4], 0.5, "op")
+
+        with op_scope("outer"):
+            with op_scope("inner"):
+                record_round(parties[1:], [5], [6], 0.5, "op")
+
+        # Parties that are not in the session are not recorded
+        record_round([object()], [7], [8], 0.5, "op")
+
+    assert not is_recording()
+    assert stats.rounds == 2
+    assert stats.bytes_sent == 8
+    assert stats.bytes_received == 13
+    assert stats.time == 1.0
+
+    summary = stats.summary()
+    assert summary["op"]["bytes_sent"] == {0: 1, 1: 2}
+    assert summary["outer"]["bytes_received"] == {1: 6}
+    assert "inner" not in summary
+
+
+def test_session_stats_mul(get_clients) -> None:
+    clients = get_clients(2)
+    session = Session(parties=clients)
+    SessionManager.setup_mpc(session)
+
+    x = MPCTensor(secret=torch.Tensor([[1, 2], [3, 4]]), session=session)
+    y = MPCTensor(secret=torch.Tensor([[5, 6], [7, 8]]), session=session)
+
+    with session.stats as stats:
+        res = (x * y).reconstruct()
+
+    assert torch.allclose(res, torch.Tensor([[5, 12], [21, 32]]))
+
+    summary = stats.summary()
+    assert summary["mul"]["rounds"] > 0
+    assert summary["reconstruct"]["rounds"] == 1
+    # Each party sends its share (4 values of 8 bytes)
+    assert summary["reconstruct"]["bytes_received"] == {0: 32, 1: 32}
+    assert stats.rounds == sum(el["rounds"] for el in summary.values())
@@ -0,0 +1,123 @@
+# stdlib
+import os
+import stat
+
+# third party
+import pytest
+import torch
+
+from sympc.session import Session
+from sympc.session import SessionManager
+from sympc.tensor import MPCTensor
+from sympc.utils import InProcessTransport
+from sympc.utils import SharedMemoryTransport
+from sympc.utils import Transport
+from sympc.utils import get_transport
+from sympc.utils import register_transport
+
+
+def test_in_process_transport() -> None:
+    transport = InProcessTransport()
+    tensor = torch.arange(6).view(2, 3)
+
+    descriptor = transport.export(tensor)
+    assert transport.load(descriptor) is tensor
+    assert transport.tensors == {}
+
+    with pytest.raises(ValueError):
+        transport.load(descriptor)
+
+    copied = transport.load(transport.export(tensor, copy=True))
+    assert copied is not tensor
+    assert (copied == tensor).all()
+
+    transport.discard(transport.export(tensor))
+    assert transport.tensors == {}
+
+
+@pytest.mark.parametrize("dtype", [torch.long, torch.int32, torch.bool])
+def test_shared_memory_transport(tmp_path, dtype) -> None:
+    transport = SharedMemoryTransport(str(tmp_path))
+    tensor = torch.arange(12).view(3, 4).to(dtype)
+
+    descriptor = transport.export(tensor)
+    res = transport.load(descriptor)
+
+    assert res.dtype == dtype
+    assert (res == tensor).all()
+    # The file is removed once it is mapped
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_shared_memory_transport_private_file(tmp_path) -> None:
+    transport = SharedMemoryTransport(str(tmp_path))
+
+    descriptor = transport.export(torch.arange(4))
+    path = descriptor[0]
+
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+
+    transport.discard(descriptor)
+    assert list(tmp_path.iterdir()) == []
+    # Discarding a descriptor that was already loaded does nothing
+    transport.discard(descriptor)
+
+
+def test_shared_memory_transport_export_exception(tmp_path, monkeypatch) -> None:
+    transport = SharedMemoryTransport(str(tmp_path))
+
+    def ftruncate(fd: int, length: int) -> None:
+        raise OSError("no space left")
+
+    monkeypatch.setattr(os, "ftruncate", ftruncate)
+
+    with pytest.raises(OSError):
+        transport.export(torch.arange(4))
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_shared_memory_transport_empty(tmp_path) -> None:
+    transport = SharedMemoryTransport(str(tmp_path))
+
+    res = transport.load(transport.export(torch.empty(0, 3)))
+
+    assert res.shape == (0, 3)
+
+
+def test_register_transport() -> None:
+    transport = InProcessTransport()
+    register_transport("test_transport", transport)
+
+    assert get_transport("test_transport") is transport
+    assert isinstance(get_transport("shared_memory"), SharedMemoryTransport)
+
+    with pytest.raises(ValueError):
+        register_transport("test_transport", transport)
+
+    with pytest.raises(ValueError):
+        get_transport("missing_transport")
+
+
+def test_transport_not_implemented() -> None:
+    with pytest.raises(NotImplementedError):
+        Transport().export(torch.zeros(1))
+
+    with pytest.raises(NotImplementedError):
+        Transport().load(["handle"])
+
+
+@pytest.mark.parametrize("transport", ["in_process", "shared_memory"])
+def test_share_reconstruct_with_transport(get_clients, transport) -> None:
+    session = Session(parties=get_clients(3))
+    session.transport = transport
+    SessionManager.setup_mpc(session)
+
+    x_secret = torch.randn(4, 5)
+    y_secret = torch.randn(4, 5)
+    x = MPCTensor(secret=x_secret, session=session)
+    y = MPCTensor(secret=y_secret, session=session)
+
+    assert torch.allclose(x.reconstruct(), x_secret, atol=1e-4)
+    assert torch.allclose((x + y).reconstruct(), x_secret + y_secret, atol=1e-4)
+    assert len(x.get_shares()) == 3
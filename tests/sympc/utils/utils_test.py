@@ -0,0 +1,142 @@
+# stdlib
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import threading
+
+# third party
+import pytest
+
+from sympc.utils import executor_stats
+from sympc.utils import parallel_execution
+from sympc.utils import parallel_execution_async
+from sympc.utils import set_executor_max_workers
+from sympc.utils import shutdown_executors
+
+
+def _square(x: int) -> int:
+    return x * x
+
+
+def _nested_square(x: int) -> int:
+    return sum(parallel_execution(_square)([[x], [x]])) // 2
+
+
+def test_parallel_execution_reuse_executor() -> None:
+    shutdown_executors()
+    stats_before = executor_stats()
+
+    for _ in range(5):
+        assert parallel_execution(_square)([[1], [2], [3]]) == [1, 4, 9]
+
+    stats_after = executor_stats()
+    assert stats_after["created"] - stats_before["created"] == 1
+    assert stats_after["reused"] - stats_before["reused"] == 4
+    assert stats_after["startup_time_saved"] >= 0
+
+
+def test_parallel_execution_nested_call() -> None:
+    set_executor_max_workers(2)
+    try:
+        res = parallel_execution(_nested_square)([[i] for i in range(4)])
+    finally:
+        set_executor_max_workers(None)
+
+    assert res == [0, 1, 4, 9]
+
+
+def test_parallel_execution_after_shutdown() -> None:
+    parallel_execution(_square)([[1], [2]])
+    shutdown_executors()
+
+    assert parallel_execution(_square)([[3], [4]]) == [9, 16]
+
+
+def _wait_event(started: threading.Event, event: threading.Event) -> bool:
+    started.set()
+    return event.wait(timeout=10)
+
+
+def _wait_peer(barrier: threading.Barrier) -> bool:
+    barrier.wait(timeout=10)
+    return True
+
+
+def test_parallel_execution_grow_concurrent_calls() -> None:
+    def run(nr_parties: int) -> None:
+        for _ in range(10):
+            res = parallel_execution(_square)([[i] for i in range(nr_parties)])
+            assert res == [i * i for i in range(nr_parties)]
+
+    shutdown_executors()
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        for future in [pool.submit(run, nr_parties) for nr_parties in range(1, 7)]:
+            future.result()
+
+
+def test_parallel_execution_channel_busy_workers() -> None:
+    set_executor_max_workers(2)
+    started = threading.Event()
+    event = threading.Event()
+    busy = threading.Thread(
+        target=lambda: parallel_execution(_wait_event)([[started, event]]), daemon=True
+    )
+    try:
+        # One of the two workers is busy
+        busy.start()
+        started.wait(timeout=10)
+        barrier = threading.Barrier(2)
+        res = parallel_execution(_wait_peer, uses_channel=True)([[barrier], [barrier]])
+    finally:
+        event.set()
+        busy.join()
+        set_executor_max_workers(None)
+
+    assert res == [True, True]
+
+
+def test_parallel_execution_channel_nested_call() -> None:
+    def nested(x: int) -> bool:
+        barrier = threading.Barrier(2)
+        return all(parallel_execution(_wait_peer, uses_channel=True)([[barrier]] * 2))
+
+    assert parallel_execution(nested)([[0], [1]]) == [True, True]
+
+
+def test_parallel_execution_channel_max_workers_exception() -> None:
+    set_executor_max_workers(1)
+    try:
+        with pytest.raises(ValueError):
+            parallel_execution(_square, uses_channel=True)([[1], [2]])
+    finally:
+        set_executor_max_workers(None)
+
+
+def test_set_executor_max_workers_exception() -> None:
+    with pytest.raises(ValueError):
+        set_executor_max_workers(0)
+
+
+def test_parallel_execution_async() -> None:
+    async def compute():
+        return await asyncio.gather(
+            parallel_execution_async(_square)([[1], [2]]),
+            parallel_execution_async(_square)([[3], [4]]),
+        )
+
+    assert asyncio.run(compute()) == [[1, 4], [9, 16]]
+
+
+def test_parallel_execution_async_shared_executor() -> None:
+    shutdown_executors()
+    parallel_execution(_square)([[1], [2]])
+    stats_before = executor_stats()
+
+    async def compute():
+        return await parallel_execution_async(_square)([[3], [4]])
+
+    assert asyncio.run(compute()) == [9, 16]
+
+    # The calls are run by the executor used by "parallel_execution"
+    stats_after = executor_stats()
+    assert stats_after["created"] == stats_before["created"]
+    assert stats_after["reused"] - stats_before["reused"] == 1